@@ -1 +0,0 @@
-from . import hr_payslip
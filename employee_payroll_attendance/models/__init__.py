@@ -1,11 +0,0 @@
-from . import hr_attendance_payroll
-from . import hr_payslip_report
-from . import payslip_attendance
-from . import generate_salary_wizard
-from . import account_analytic_line
-from . import hr_payslip
-from . import custom_invoice
-from . import custom_duration_timeoff
-
-from . import auto_generate_payslip
-from . import update_rate_fallback
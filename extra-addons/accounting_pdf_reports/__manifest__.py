@@ -19,6 +19,8 @@
     'data': [
         'security/ir.model.access.csv',
         'data/account_account_type.xml',
+        'data/account_balance_snapshot_data.xml',
+        'data/account_report_cache_data.xml',
         'views/menu.xml',
         'views/ledger_menu.xml',
         'views/financial_report.xml',
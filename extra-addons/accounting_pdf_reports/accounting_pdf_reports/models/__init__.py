@@ -1,5 +0,0 @@
-# -*- coding: utf-8 -*-
-
-from . import account_account_type
-from . import account_financial_report
-from . import account_move_line
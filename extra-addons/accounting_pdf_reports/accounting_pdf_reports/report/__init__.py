@@ -1,14 +0,0 @@
-# -*- coding: utf-8 -*-
-
-from . import report_partner_ledger
-from . import report_general_ledger
-from . import report_trial_balance
-from . import report_tax
-from . import report_aged_partner
-from . import report_journal
-from . import report_financial
-
-
-
-
-
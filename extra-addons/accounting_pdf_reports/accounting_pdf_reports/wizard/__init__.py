@@ -1,14 +0,0 @@
-# -*- coding: utf-8 -*-
-
-from . import account_report_common
-from . import account_report_common_journal
-from . import account_report_print_journal
-from . import account_report
-from . import account_report_common_partner
-from . import account_report_common_account
-from . import account_partner_ledger
-from . import account_general_ledger
-from . import account_trial_balance
-from . import account_tax_report
-from . import aged_partner
-from . import account_journal_audit
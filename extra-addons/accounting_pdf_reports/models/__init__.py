@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
 
+from . import account_account
 from . import account_account_type
 from . import account_financial_report
+from . import account_balance_snapshot
+from . import account_move
 from . import account_move_line
+from . import account_partial_reconcile
+from . import account_ledger_version
+from . import account_report_cache
+from . import res_partner
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models
+from .account_ledger_version import LEDGER_VERSION_ACCOUNT_FIELDS
+
+
+class AccountAccount(models.Model):
+    _inherit = "account.account"
+
+    def write(self, vals):
+        # The cached reports print the accounts and group them by type
+        if LEDGER_VERSION_ACCOUNT_FIELDS.intersection(vals):
+            self.env['account.ledger.version']._mark_config_dirty(self.company_id.ids)
+        return super().write(vals)
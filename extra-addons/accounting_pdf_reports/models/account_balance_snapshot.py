@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from datetime import timedelta
+
+from odoo import api, fields, models, tools
+
+_logger = logging.getLogger(__name__)
+
+# Transaction-local tracking of the move lines changed since the last delta
+# (cr.precommit.data): their ids and their snapshot rows before the change
+SNAPSHOT_PENDING_KEY = 'account.balance.snapshot.pending'
+# Move line fields feeding the snapshot
+SNAPSHOT_LINE_FIELDS = {
+    'account_id', 'partner_id', 'journal_id', 'company_id', 'date', 'move_id',
+    'debit', 'credit', 'balance', 'display_type', 'parent_state',
+}
+# Move fields changing the snapshot of its lines through related/computed fields:
+# the invoice date recomputes the accounting date and the currency rate, the
+# currency the balances, and the lines are edited through the move
+SNAPSHOT_MOVE_FIELDS = {
+    'state', 'date', 'invoice_date', 'journal_id', 'company_id', 'partner_id',
+    'currency_id', 'move_type', 'line_ids', 'invoice_line_ids',
+}
+# `_query_get` filters the snapshot cannot answer: those reports read the lines
+SNAPSHOT_UNSUPPORTED_FILTERS = (
+    'aged_balance', 'reconcile_date', 'account_tag_ids', 'analytic_tag_ids',
+    'analytic_account_ids', 'partner_categories',
+)
+
+# Grouping of the snapshot rows, as the expressions of its unique index
+SNAPSHOT_KEY = ['company_id', 'COALESCE(account_id, 0)', 'COALESCE(partner_id, 0)',
+                'journal_id', 'month', 'parent_state']
+
+# Staging table of the full aggregate of the move lines, compared with the
+# snapshot by the nightly reconciliation
+SNAPSHOT_REBUILD_STAGE = """
+    CREATE TEMPORARY TABLE account_balance_snapshot_rebuild ON COMMIT DROP AS
+    SELECT l.company_id, l.account_id, l.partner_id, l.journal_id,
+           date_trunc('month', l.date)::date AS month, l.parent_state,
+           SUM(l.debit) AS debit, SUM(l.credit) AS credit
+      FROM account_move_line l
+     WHERE l.parent_state IN ('draft', 'posted')
+       AND (l.display_type IS NULL OR l.display_type NOT IN ('line_section', 'line_note'))
+  GROUP BY l.company_id, l.account_id, l.partner_id, l.journal_id,
+           date_trunc('month', l.date), l.parent_state
+"""
+
+# Add the difference between the staged aggregate and the snapshot, for the
+# rows that differ only: as signed amounts, like the deltas of the postings
+SNAPSHOT_REBUILD_UPSERT = """
+    INSERT INTO account_balance_snapshot AS s (
+        company_id, account_id, partner_id, journal_id, month, parent_state,
+        debit, credit, balance
+    )
+    SELECT COALESCE(r.company_id, c.company_id), COALESCE(r.account_id, c.account_id),
+           COALESCE(r.partner_id, c.partner_id), COALESCE(r.journal_id, c.journal_id),
+           COALESCE(r.month, c.month), COALESCE(r.parent_state, c.parent_state),
+           COALESCE(r.debit, 0) - COALESCE(c.debit, 0),
+           COALESCE(r.credit, 0) - COALESCE(c.credit, 0),
+           COALESCE(r.debit - r.credit, 0) - COALESCE(c.balance, 0)
+      FROM account_balance_snapshot_rebuild r
+      FULL JOIN account_balance_snapshot c
+        ON c.company_id IS NOT DISTINCT FROM r.company_id
+       AND c.account_id IS NOT DISTINCT FROM r.account_id
+       AND c.partner_id IS NOT DISTINCT FROM r.partner_id
+       AND c.journal_id IS NOT DISTINCT FROM r.journal_id
+       AND c.month = r.month
+       AND c.parent_state = r.parent_state
+     WHERE COALESCE(r.debit, 0) != COALESCE(c.debit, 0)
+        OR COALESCE(r.credit, 0) != COALESCE(c.credit, 0)
+        OR COALESCE(r.debit - r.credit, 0) != COALESCE(c.balance, 0)
+        ON CONFLICT ({key})
+        DO UPDATE SET debit = s.debit + EXCLUDED.debit,
+                      credit = s.credit + EXCLUDED.credit,
+                      balance = s.balance + EXCLUDED.balance
+ RETURNING s.company_id
+"""
+
+# Snapshot rows of the move lines of ids %s, as they are in the database
+SNAPSHOT_LINE_ROWS = """
+    SELECT l.company_id, l.account_id, l.partner_id, l.journal_id,
+           date_trunc('month', l.date)::date, l.parent_state,
+           SUM(l.debit), SUM(l.credit)
+      FROM account_move_line l
+     WHERE l.id IN %s
+       AND l.parent_state IN ('draft', 'posted')
+       AND (l.display_type IS NULL OR l.display_type NOT IN ('line_section', 'line_note'))
+  GROUP BY l.company_id, l.account_id, l.partner_id, l.journal_id,
+           date_trunc('month', l.date), l.parent_state
+"""
+
+# Add the current rows of the tracked lines and subtract their rows before the
+# change: concurrent transactions only add signed amounts to the same rows
+SNAPSHOT_DELTA_UPSERT = """
+    INSERT INTO account_balance_snapshot AS s (
+        company_id, account_id, partner_id, journal_id, month, parent_state,
+        debit, credit, balance
+    )
+    SELECT company_id, account_id, partner_id, journal_id, month, parent_state,
+           SUM(debit), SUM(credit), SUM(debit) - SUM(credit)
+      FROM ({after}
+         UNION ALL
+            SELECT company_id, account_id, partner_id, journal_id, month, parent_state,
+                   -debit, -credit
+              FROM unnest(%s::integer[], %s::integer[], %s::integer[], %s::integer[],
+                          %s::date[], %s::varchar[], %s::numeric[], %s::numeric[])
+                   AS b(company_id, account_id, partner_id, journal_id, month,
+                        parent_state, debit, credit)
+           ) AS delta (company_id, account_id, partner_id, journal_id, month,
+                       parent_state, debit, credit)
+  GROUP BY company_id, account_id, partner_id, journal_id, month, parent_state
+    HAVING SUM(debit) != 0 OR SUM(credit) != 0
+        ON CONFLICT ({key})
+        DO UPDATE SET debit = s.debit + EXCLUDED.debit,
+                      credit = s.credit + EXCLUDED.credit,
+                      balance = s.balance + EXCLUDED.balance
+"""
+
+
+class AccountBalanceSnapshot(models.Model):
+    """
+    Monthly debit/credit totals per (company, account, partner, journal, month,
+    state). The table is maintained incrementally: posting, resetting or
+    cancelling moves and editing their lines record the snapshot rows of the
+    lines before the change, and the end of the transaction adds the signed
+    difference with their rows after it. Posting a move only touches the rows
+    of its own lines, whatever the size of the month.
+
+    Reports read the whole months of their period from here and only scan
+    the move lines of the partial months at its edges.
+    """
+    _name = 'account.balance.snapshot'
+    _description = 'Monthly Account Balance Snapshot'
+    _log_access = False
+
+    company_id = fields.Many2one('res.company', string='Company', readonly=True)
+    account_id = fields.Many2one('account.account', string='Account', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Partner', readonly=True)
+    journal_id = fields.Many2one('account.journal', string='Journal', readonly=True)
+    month = fields.Date(string='Month', readonly=True)
+    parent_state = fields.Selection([('draft', 'Draft'), ('posted', 'Posted')],
+                                    string='Status', readonly=True)
+    debit = fields.Monetary(string='Debit', currency_field='company_currency_id', readonly=True)
+    credit = fields.Monetary(string='Credit', currency_field='company_currency_id', readonly=True)
+    balance = fields.Monetary(string='Balance', currency_field='company_currency_id', readonly=True)
+    company_currency_id = fields.Many2one(related='company_id.currency_id', string='Currency')
+
+    def init(self):
+        tools.create_index(self._cr, 'account_balance_snapshot_company_month_idx',
+                           self._table, ['company_id', 'month'])
+        tools.create_index(self._cr, 'account_balance_snapshot_account_month_idx',
+                           self._table, ['account_id', 'month'])
+        tools.create_unique_index(self._cr, 'account_balance_snapshot_key_uniq',
+                                  self._table, SNAPSHOT_KEY)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @api.model
+    def _track_lines(self, line_ids, new=False):
+        """
+        Record the snapshot rows of the move lines of `line_ids` about to
+        change, the first time they change since the last delta. Lines being
+        created (`new`) had no row.
+        """
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get(SNAPSHOT_PENDING_KEY)
+        if pending is None:
+            pending = precommit.data[SNAPSHOT_PENDING_KEY] = {'line_ids': set(), 'before': []}
+            precommit.add(self._flush_dirty)
+        line_ids = set(line_ids) - pending['line_ids']
+        if not line_ids:
+            return
+        pending['line_ids'] |= line_ids
+        if not new:
+            # The database still holds the lines as of the last delta
+            self.env.cr.execute(SNAPSHOT_LINE_ROWS, (tuple(line_ids),))
+            pending['before'] += self.env.cr.fetchall()
+
+    @api.model
+    def _mark_lines(self, lines, new=False):
+        self._track_lines(lines.ids, new=new)
+        # Whatever changes the balances changes the ledger the cached reports read
+        self.env['account.ledger.version']._mark_dirty(
+            (line.company_id.id, line.date.replace(day=1)) for line in lines if line.date)
+
+    @api.model
+    def _mark_moves(self, moves):
+        self._track_lines(moves.line_ids.ids)
+        self.env['account.ledger.version']._mark_dirty(
+            (move.company_id.id, move.date.replace(day=1)) for move in moves if move.date)
+
+    @api.model
+    def _flush_dirty(self):
+        pending = self.env.cr.precommit.data.pop(SNAPSHOT_PENDING_KEY, None)
+        if pending and pending['line_ids']:
+            self._apply_delta(pending['line_ids'], pending['before'])
+
+    @api.model
+    def _apply_delta(self, line_ids, before):
+        """Add the current rows of the lines of `line_ids` minus their `before` rows."""
+        self.env.flush_all()
+        columns = [list(column) for column in zip(*before)] if before else [[]] * 8
+        self.env.cr.execute(
+            SNAPSHOT_DELTA_UPSERT.format(after=SNAPSHOT_LINE_ROWS, key=', '.join(SNAPSHOT_KEY)),
+            [tuple(line_ids)] + columns)
+        self.invalidate_model()
+        _logger.info("Applied the balance snapshot delta of %s move lines", len(line_ids))
+
+    @api.model
+    def _rebuild_all(self):
+        """
+        Full reconciliation with the move lines, used on install and by the
+        nightly safety-net cron. The aggregate is staged in a temporary table
+        and only the differing rows are corrected, so the postings upserting
+        concurrently only wait on these; the cached reports of the companies
+        corrected are invalidated.
+        """
+        self.env.flush_all()
+        cr = self.env.cr
+        cr.execute(SNAPSHOT_REBUILD_STAGE)
+        cr.execute(SNAPSHOT_REBUILD_UPSERT.format(key=', '.join(SNAPSHOT_KEY)))
+        company_ids = {company_id for company_id, in cr.fetchall()}
+        cr.execute("DROP TABLE account_balance_snapshot_rebuild")
+        self.invalidate_model()
+        if company_ids:
+            _logger.info("Corrected the balance snapshot of companies %s", sorted(company_ids))
+            self.env['account.ledger.version']._mark_config_dirty(list(company_ids))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @api.model
+    def _get_period_bounds(self, context):
+        """Inclusive (first, last) dates `_query_get` selects under `context`."""
+        date_from = context.get('date_from') and fields.Date.to_date(context['date_from'])
+        date_to = context.get('date_to') and fields.Date.to_date(context['date_to'])
+        first, last = None, date_to or None
+        if date_from:
+            if context.get('initial_bal'):
+                before = date_from - timedelta(days=1)
+                last = min(last, before) if last else before
+            else:
+                first = date_from
+        return first, last
+
+    @api.model
+    def _split_period(self, first, last):
+        """
+        Split [first, last] into the whole months read from the snapshot,
+        (month_from, month_to) with month_to exclusive, and the partial
+        ranges at its edges read from the move lines.
+        """
+        month_from = first
+        if first and first.day != 1:
+            month_from = (first.replace(day=1) + timedelta(days=32)).replace(day=1)
+        month_to = last and (last + timedelta(days=1)).replace(day=1)
+        if month_from and month_to and month_from >= month_to:
+            return None, []
+        edges = []
+        if first and first < month_from:
+            edges.append((first, month_from - timedelta(days=1)))
+        if last and month_to <= last:
+            edges.append((month_to, last))
+        return (month_from, month_to), edges
+
+    @api.model
+    def _get_balances(self, account_ids, context):
+        """
+        Debit, credit and balance per account of the lines `_query_get`
+        selects under `context`, as {account_id: {'debit', 'credit', 'balance'}}.
+        Returns None when the filters cannot be answered from the snapshot.
+        """
+        if any(context.get(key) for key in SNAPSHOT_UNSUPPORTED_FILTERS):
+            return None
+        if context.get('date_from') and not context.get('strict_range'):
+            return None
+        if not account_ids:
+            return {}
+        self._flush_dirty()
+        self.env.flush_all()
+
+        first, last = self._get_period_bounds(context)
+        months, edges = self._split_period(first, last)
+        if months is None:
+            edges = [(first, last)]
+
+        queries, params = [], []
+        if months is not None:
+            where, where_params = self.with_context(context)._snapshot_filters(context, months)
+            queries.append("SELECT account_id, debit, credit FROM account_balance_snapshot "
+                           "WHERE account_id IN %s" + where)
+            params += [tuple(account_ids)] + where_params
+        MoveLine = self.env['account.move.line']
+        for edge_from, edge_to in edges:
+            edge_context = dict(context, date_from=edge_from, date_to=edge_to,
+                                strict_range=True, initial_bal=False)
+            tables, where_clause, where_params = MoveLine.with_context(edge_context)._query_get()
+            tables = tables.replace('"', '') if tables else 'account_move_line'
+            filters = ' AND ' + where_clause.strip() if where_clause.strip() else ''
+            queries.append("SELECT account_id, debit, credit FROM " + tables +
+                           " WHERE account_id IN %s" + filters)
+            params += [tuple(account_ids)] + list(where_params)
+
+        self.env.cr.execute(
+            "SELECT account_id, COALESCE(SUM(debit), 0) AS debit, "
+            "COALESCE(SUM(credit), 0) AS credit, "
+            "COALESCE(SUM(debit), 0) - COALESCE(SUM(credit), 0) AS balance "
+            "FROM (" + " UNION ALL ".join(queries) + ") AS balances GROUP BY account_id",
+            params)
+        return {row.pop('account_id'): row for row in self.env.cr.dictfetchall()}
+
+    @api.model
+    def _snapshot_filters(self, context, months):
+        """WHERE fragment of the snapshot rows matching the `_query_get` filters."""
+        month_from, month_to = months
+        where, params = '', []
+        if month_from:
+            where += ' AND month >= %s'
+            params.append(month_from)
+        if month_to:
+            where += ' AND month < %s'
+            params.append(month_to)
+        state = context.get('state')
+        if state and state.lower() != 'all':
+            where += ' AND parent_state = %s'
+            params.append(state)
+        if context.get('journal_ids'):
+            where += ' AND journal_id IN %s'
+            params.append(tuple(context['journal_ids']))
+        if context.get('company_id'):
+            company_ids = [context['company_id']]
+        elif context.get('allowed_company_ids'):
+            company_ids = self.env.companies.ids
+        else:
+            company_ids = self.env.company.ids
+        where += ' AND company_id IN %s'
+        params.append(tuple(company_ids))
+        if context.get('account_ids'):
+            where += ' AND account_id IN %s'
+            params.append(tuple(context['account_ids'].ids))
+        if context.get('partner_ids'):
+            where += ' AND partner_id IN %s'
+            params.append(tuple(context['partner_ids'].ids))
+        return where, params
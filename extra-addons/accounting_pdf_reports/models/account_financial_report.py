@@ -17,14 +17,45 @@ class AccountFinancialReport(models.Model):
                 level = report.parent_id.level + 1
             report.level = level
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        # The structure of the reports is part of the cached results
+        self.env['account.ledger.version']._mark_config_dirty()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env['account.ledger.version']._mark_config_dirty()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env['account.ledger.version']._mark_config_dirty()
+        return super().unlink()
+
     def _get_children_by_order(self):
-        '''returns a recordset of all the children computed recursively, and sorted by sequence. Ready for the printing'''
-        res = self
-        children = self.search([('parent_id', 'in', self.ids)], order='sequence ASC')
-        if children:
-            for child in children:
-                res += child._get_children_by_order()
-        return res
+        '''returns a recordset of all the children computed recursively, and sorted by sequence. Ready for the printing
+
+        The whole tree is loaded by a single recursive query: each node is
+        ordered by the (sequence, id) path from its root, which is the order
+        of a depth-first walk of the children sorted by sequence.'''
+        if not self:
+            return self
+        self.flush_model(['parent_id', 'sequence'])
+        self.env.cr.execute("""
+            WITH RECURSIVE tree(id, path, ids) AS (
+                SELECT r.id, ARRAY[root.position::integer, 0, r.id], ARRAY[r.id]
+                  FROM account_financial_report r
+                  JOIN unnest(%s::integer[]) WITH ORDINALITY AS root(id, position)
+                    ON root.id = r.id
+                 UNION ALL
+                SELECT c.id, t.path || ARRAY[COALESCE(c.sequence, 0), c.id], t.ids || c.id
+                  FROM account_financial_report c
+                  JOIN tree t ON c.parent_id = t.id
+                 WHERE NOT c.id = ANY(t.ids)
+            )
+            SELECT id FROM tree ORDER BY path
+        """, [self.ids])
+        # A node reached from several roots is kept at its first position
+        return self.browse(list(dict.fromkeys(row[0] for row in self.env.cr.fetchall())))
 
     name = fields.Char('Report Name', required=True, translate=True)
     parent_id = fields.Many2one('account.financial.report', 'Parent')
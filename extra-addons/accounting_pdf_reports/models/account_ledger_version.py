@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, fields, models, tools
+
+# Transaction-local set of (company_id, month) to bump (cr.precommit.data)
+LEDGER_VERSION_PENDING_KEY = 'account.ledger.version.pending'
+
+# Fields the cached reports read besides the balances of the snapshot fields:
+# writing them bumps the months of the lines, or the configuration
+LEDGER_VERSION_LINE_FIELDS = {'date_maturity', 'analytic_distribution'}
+LEDGER_VERSION_MOVE_FIELDS = {
+    'invoice_date', 'invoice_date_due', 'invoice_payment_term_id', 'currency_id',
+    'line_ids', 'invoice_line_ids',
+}
+LEDGER_VERSION_ACCOUNT_FIELDS = {'account_type', 'code', 'name', 'include_initial_balance'}
+LEDGER_VERSION_PARTNER_FIELDS = {'name', 'trust'}
+
+# Append-only: one row per changed (company, month) and transaction, so
+# concurrent transactions never update the same row
+LEDGER_VERSION_BUMP = """
+    INSERT INTO account_ledger_version (company_id, month, version)
+    SELECT key.company_id, key.month, 1
+      FROM unnest(%s::integer[], %s::date[]) AS key(company_id, month)
+"""
+
+# Fold the bumps of each (company, month) into a single row keeping their sum
+LEDGER_VERSION_COMPACT = """
+    WITH bumps AS (
+        DELETE FROM account_ledger_version
+        RETURNING company_id, month, version
+    )
+    INSERT INTO account_ledger_version (company_id, month, version)
+    SELECT company_id, month, SUM(version)
+      FROM bumps
+  GROUP BY company_id, month
+"""
+
+
+class AccountLedgerVersion(models.Model):
+    """
+    Bumps of the ledger of every (company, month): each transaction posting,
+    resetting, cancelling or editing moves of a month, or reconciling lines
+    dated in it, appends a row for that month. Changes of the configuration
+    the reports print (financial reports, accounts, partners) are appended
+    without a month and count for every month.
+
+    The sum of the bumps of a range only grows, and is the watermark
+    validating the cached report results (account.report.cache). A daily cron
+    compacts the rows, which keeps the sums.
+    """
+    _name = 'account.ledger.version'
+    _description = 'Ledger Version'
+    _log_access = False
+
+    company_id = fields.Many2one('res.company', string='Company', required=True, readonly=True)
+    month = fields.Date(string='Month', readonly=True,
+                        help="Empty for a change of the configuration of the reports.")
+    version = fields.Integer(string='Bumps', readonly=True)
+
+    def init(self):
+        # Replaced by the append-only bumps
+        self._cr.execute("ALTER TABLE account_ledger_version "
+                         "DROP CONSTRAINT IF EXISTS account_ledger_version_company_month_uniq")
+        tools.create_index(self._cr, 'account_ledger_version_company_month_idx',
+                           self._table, ['company_id', 'month'])
+
+    @api.model
+    def _mark_dirty(self, keys):
+        """Queue (company_id, month) keys to bump at the end of the transaction."""
+        keys = {(company_id, month) for company_id, month in keys if company_id and month}
+        self._queue(keys)
+
+    @api.model
+    def _mark_config_dirty(self, company_ids=None):
+        """Queue a configuration bump of `company_ids` (every company without)."""
+        if company_ids is None:
+            company_ids = self.env['res.company'].sudo().search([]).ids
+        self._queue({(company_id, None) for company_id in company_ids if company_id})
+
+    @api.model
+    def _queue(self, keys):
+        if not keys:
+            return
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get(LEDGER_VERSION_PENDING_KEY)
+        if pending is None:
+            pending = precommit.data[LEDGER_VERSION_PENDING_KEY] = set()
+            precommit.add(self._flush_dirty)
+        pending |= keys
+
+    @api.model
+    def _has_pending(self):
+        """Whether the current transaction changed the ledger (not bumped yet)."""
+        return bool(self.env.cr.precommit.data.get(LEDGER_VERSION_PENDING_KEY))
+
+    @api.model
+    def _flush_dirty(self):
+        keys = self.env.cr.precommit.data.pop(LEDGER_VERSION_PENDING_KEY, None)
+        if keys:
+            company_ids, months = zip(*keys)
+            self.env.cr.execute(LEDGER_VERSION_BUMP, (list(company_ids), list(months)))
+            self.invalidate_model()
+
+    @api.model
+    def _get_watermark(self, company_ids, date_to=None):
+        """Watermark of the ledger of `company_ids` up to `date_to` (all the months without)."""
+        query = "SELECT COALESCE(SUM(version), 0) FROM account_ledger_version WHERE company_id IN %s"
+        params = [tuple(company_ids)]
+        if date_to:
+            query += " AND (month <= %s OR month IS NULL)"
+            params.append(fields.Date.to_date(date_to).replace(day=1))
+        self.env.cr.execute(query, params)
+        return str(self.env.cr.fetchone()[0])
+
+    @api.model
+    def _gc_versions(self):
+        """Compact the bumps, used by a daily cron."""
+        self.env.cr.execute(LEDGER_VERSION_COMPACT)
+        self.invalidate_model()
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models
+from .account_balance_snapshot import SNAPSHOT_MOVE_FIELDS
+from .account_ledger_version import LEDGER_VERSION_MOVE_FIELDS
+
+
+class AccountMove(models.Model):
+    _inherit = "account.move"
+
+    def write(self, vals):
+        # Posting, resetting to draft and cancelling move the lines between states
+        if not SNAPSHOT_MOVE_FIELDS.intersection(vals):
+            if LEDGER_VERSION_MOVE_FIELDS.intersection(vals):
+                # The due dates of the lines follow the move's
+                self.env['account.ledger.version']._mark_dirty(
+                    (move.company_id.id, move.date.replace(day=1)) for move in self if move.date)
+            return super().write(vals)
+        Snapshot = self.env['account.balance.snapshot']
+        Snapshot._mark_moves(self)
+        res = super().write(vals)
+        Snapshot._mark_moves(self)
+        return res
+
+    def unlink(self):
+        self.env['account.balance.snapshot']._mark_moves(self)
+        return super().unlink()
@@ -2,19 +2,184 @@
 
 import ast
 from odoo import api, models, fields
+from .account_balance_snapshot import SNAPSHOT_LINE_FIELDS
+from .account_ledger_version import LEDGER_VERSION_LINE_FIELDS
+
+# Partial reconciliations of the move lines selected by {lines}, aggregated per
+# line as of {date}: what they had reconciled by then (to add to the balance)
+# and whether some were only made later
+OPEN_AMOUNT_QUERY = """
+    SELECT line_id,
+           COALESCE(SUM(amount) FILTER (WHERE max_date <= {date}), 0) AS reconciled_amount,
+           bool_or(max_date > {date}) AS reconciled_after
+      FROM (
+            SELECT p.credit_move_id AS line_id, p.max_date, p.amount
+              FROM account_partial_reconcile p
+             WHERE p.credit_move_id IN ({lines})
+         UNION ALL
+            SELECT p.debit_move_id AS line_id, p.max_date, -p.amount
+              FROM account_partial_reconcile p
+             WHERE p.debit_move_id IN ({lines})
+           ) AS partial
+  GROUP BY line_id
+"""
+
+# Transaction-local memo of the compiled `_query_get` clauses (cr.precommit.data)
+QUERY_GET_CACHE_KEY = 'account.move.line.query_get'
+# Context keys read by `_query_get`
+QUERY_GET_CONTEXT_KEYS = (
+    'aged_balance', 'date_from', 'date_to', 'strict_range', 'initial_bal',
+    'journal_ids', 'state', 'company_id', 'allowed_company_ids', 'reconcile_date',
+    'account_tag_ids', 'account_ids', 'analytic_tag_ids', 'analytic_account_ids',
+    'partner_ids', 'partner_categories',
+)
+
+# Move lines with a partial reconciliation made after {date}
+RECONCILED_AFTER_QUERY = """
+    SELECT p.debit_move_id FROM account_partial_reconcile p WHERE p.max_date > {date}
+     UNION
+    SELECT p.credit_move_id FROM account_partial_reconcile p WHERE p.max_date > {date}
+"""
 
 
 class AccountMoveLine(models.Model):
     _inherit = "account.move.line"
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        self.env['account.balance.snapshot']._mark_lines(lines, new=True)
+        return lines
+
+    def write(self, vals):
+        if not SNAPSHOT_LINE_FIELDS.intersection(vals):
+            if LEDGER_VERSION_LINE_FIELDS.intersection(vals):
+                # Aged balances and analytic filters read them
+                self.env['account.ledger.version']._mark_dirty(
+                    (line.company_id.id, line.date.replace(day=1)) for line in self if line.date)
+            return super().write(vals)
+        Snapshot = self.env['account.balance.snapshot']
+        Snapshot._mark_lines(self)
+        res = super().write(vals)
+        Snapshot._mark_lines(self)
+        return res
+
+    def unlink(self):
+        self.env['account.balance.snapshot']._mark_lines(self)
+        return super().unlink()
+
+    @api.model
+    def _get_open_amount_query(self, date, lines):
+        """
+        SQL of (line_id, reconciled_amount, reconciled_after) for the move
+        lines selected by the `lines` subquery, as of `date`. The residual of a
+        line at `date` is its balance plus reconciled_amount, and the line was
+        still open at `date` unless it is reconciled and not reconciled_after.
+
+        The date is inlined, so the query can be embedded in queries using
+        either positional or named parameters.
+        """
+        return OPEN_AMOUNT_QUERY.format(lines=lines, date=self._sql_date(date))
+
+    @api.model
+    def _get_reconciled_after_query(self, date):
+        """SQL of the ids of the move lines with a partial reconciliation dated after `date`."""
+        return RECONCILED_AFTER_QUERY.format(date=self._sql_date(date))
+
+    @api.model
+    def _sql_date(self, date):
+        return "'%s'::date" % fields.Date.to_string(fields.Date.to_date(date))
+
+    @api.model
+    def _get_period_balances(self, account_ids, periods):
+        """
+        Balance per account of each period of `periods`, a list of
+        {'date_from', 'date_to'} (date_from False for a cumulative balance),
+        as {account_id: [balance, ...]} in the order of `periods`.
+
+        The lines selected by `_query_get` outside of its dates are read once
+        and bucketed by conditional aggregation, whatever the number of periods.
+        """
+        if not account_ids or not periods:
+            return {}
+        context = dict(self._context, date_from=False, date_to=False,
+                       strict_range=False, initial_bal=False)
+        tables, where_clause, where_params = self.with_context(context)._query_get()
+        tables = tables.replace('"', '') if tables else 'account_move_line'
+        filters = ' AND ' + where_clause.strip() if where_clause.strip() else ''
+
+        columns, column_params = [], []
+        for period in periods:
+            if period.get('date_from'):
+                columns.append("COALESCE(SUM(CASE WHEN account_move_line.date BETWEEN %s AND %s "
+                               "THEN account_move_line.balance END), 0)")
+                column_params += [period['date_from'], period['date_to']]
+            else:
+                columns.append("COALESCE(SUM(CASE WHEN account_move_line.date <= %s "
+                               "THEN account_move_line.balance END), 0)")
+                column_params.append(period['date_to'])
+        # Only scan the lines some period can hold
+        bounds = " AND account_move_line.date <= %s"
+        bound_params = [max(period['date_to'] for period in periods)]
+        if all(period.get('date_from') for period in periods):
+            bounds += " AND account_move_line.date >= %s"
+            bound_params.append(min(period['date_from'] for period in periods))
+
+        request = ("SELECT account_move_line.account_id, ARRAY[" + ", ".join(columns) + "]" +
+                   " FROM " + tables +
+                   " WHERE account_move_line.account_id IN %s" + bounds + filters +
+                   " GROUP BY account_move_line.account_id")
+        params = column_params + [tuple(account_ids)] + bound_params + list(where_params)
+        self.env.cr.execute(request, params)
+        return {account_id: [float(value) for value in values]
+                for account_id, values in self.env.cr.fetchall()}
+
     @api.model
     def _query_get(self, domain=None):
+        """
+        (tables, where_clause, where_clause_params) of the move lines selected
+        by `domain` and the report filters of the context.
+
+        The clauses only depend on the filters, the user and the companies:
+        they are compiled once per transaction, i.e. per report run, and
+        served from a memo to the next calls with the same filters.
+        """
         self.check_access_rights('read')
+        if not isinstance(domain, (list, tuple)):
+            domain = ast.literal_eval(domain or '[]')
+        key = (
+            self._query_get_context_key(),
+            repr(domain),
+            self.env.uid,
+            self.env.su,
+            self.env.company.id,
+            tuple(self.env.companies.ids),
+        )
+        memo = self.env.cr.precommit.data.setdefault(QUERY_GET_CACHE_KEY, {})
+        if key not in memo:
+            memo[key] = self._compile_query_get(list(domain))
+        tables, where_clause, where_clause_params = memo[key]
+        return tables, where_clause, list(where_clause_params)
 
+    @api.model
+    def _query_get_context_key(self):
+        """Hashable form of the context keys read by `_query_get`."""
+        def normalize(value):
+            # Every falsy value disables its filter
+            if not value:
+                return None
+            if isinstance(value, models.BaseModel):
+                return (value._name, tuple(value.ids))
+            if isinstance(value, (list, tuple, set)):
+                return tuple(normalize(item) for item in value)
+            if isinstance(value, dict):
+                return tuple(sorted((k, normalize(v)) for k, v in value.items()))
+            return str(value)
+        return tuple(normalize(self._context.get(key)) for key in QUERY_GET_CONTEXT_KEYS)
+
+    @api.model
+    def _compile_query_get(self, domain):
         context = dict(self._context or {})
-        domain = domain or []
-        if not isinstance(domain, (list, tuple)):
-            domain = ast.literal_eval(domain)
 
         date_field = 'date'
         if context.get('aged_balance'):
@@ -44,7 +209,8 @@ class AccountMoveLine(models.Model):
             domain += [('company_id', '=', self.env.company.id)]
 
         if context.get('reconcile_date'):
-            domain += ['|', ('reconciled', '=', False), '|', ('matched_debit_ids.max_date', '>', context['reconcile_date']), ('matched_credit_ids.max_date', '>', context['reconcile_date'])]
+            domain += ['|', ('reconciled', '=', False),
+                       ('id', 'inselect', (self._get_reconciled_after_query(context['reconcile_date']), []))]
 
         if context.get('account_tag_ids'):
             domain += [('account_id.tag_ids', 'in', context['account_tag_ids'].ids)]
@@ -77,4 +243,4 @@ class AccountMoveLine(models.Model):
             self._apply_ir_rules(query)
 
             tables, where_clause, where_clause_params = query.get_sql()
-        return tables, where_clause, where_clause_params
\ No newline at end of file
+        return tables, where_clause, tuple(where_clause_params)
\ No newline at end of file
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, models, tools
+
+
+class AccountPartialReconcile(models.Model):
+    _inherit = "account.partial.reconcile"
+
+    def init(self):
+        # Both sides of a partial with its date: the state of a move line as of
+        # any date is read by index (see account.move.line._get_open_amount_query)
+        tools.create_index(self._cr, 'account_partial_reconcile_debit_max_date_idx',
+                           self._table, ['debit_move_id', 'max_date'])
+        tools.create_index(self._cr, 'account_partial_reconcile_credit_max_date_idx',
+                           self._table, ['credit_move_id', 'max_date'])
+        tools.create_index(self._cr, 'account_partial_reconcile_max_date_idx',
+                           self._table, ['max_date'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        partials = super().create(vals_list)
+        partials._mark_ledger_versions()
+        return partials
+
+    def unlink(self):
+        self._mark_ledger_versions()
+        return super().unlink()
+
+    def _mark_ledger_versions(self):
+        # A reconciliation changes the open amounts as of its date onwards
+        self.env['account.ledger.version']._mark_dirty(
+            (partial.company_id.id, partial.max_date.replace(day=1))
+            for partial in self if partial.max_date)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+# Days a cached result is kept after its last computation
+REPORT_CACHE_DAYS = 7
+
+REPORT_CACHE_STORE = """
+    INSERT INTO account_report_cache (key, report, watermark, result, date)
+    VALUES (%s, %s, %s, %s, now() AT TIME ZONE 'UTC')
+        ON CONFLICT (key) DO UPDATE
+       SET watermark = EXCLUDED.watermark, result = EXCLUDED.result, date = EXCLUDED.date
+"""
+
+
+class AccountReportCache(models.Model):
+    """
+    Results of the report computations, keyed by report, normalized wizard
+    parameters, companies and language, and valid as long as the watermark
+    of the ledger they read (account.ledger.version) has not moved.
+
+    Only plain JSON data is stored: the templates still render every print.
+    """
+    _name = 'account.report.cache'
+    _description = 'Report Result Cache'
+    _log_access = False
+
+    key = fields.Char(string='Key', required=True, readonly=True)
+    report = fields.Char(string='Report', required=True, readonly=True)
+    watermark = fields.Char(string='Ledger Watermark', readonly=True)
+    result = fields.Text(string='Result', readonly=True)
+    date = fields.Datetime(string='Computed On', readonly=True)
+
+    _sql_constraints = [
+        ('key_uniq', 'unique (key)', 'The key of a cached report result must be unique.'),
+    ]
+
+    @api.model
+    def _get_key(self, report, params, company_ids):
+        # The wizard record printing the report does not change its result,
+        # the user does: the record rules filter the lines they read
+        params = {name: value for name, value in params.items() if name != 'id'}
+        payload = json.dumps(
+            [report, params, sorted(company_ids), sorted(self.env.companies.ids), self.env.lang,
+             self.env.uid, self.env.su],
+            sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    @api.model
+    def _get_or_compute(self, report, params, compute, date_to=None, company_ids=None):
+        """
+        Return the result of `compute()` for `report` run with `params`, from
+        the cache when the ledger of `company_ids` up to `date_to` did not
+        change since it was computed. The result must be JSON serializable
+        and is returned as loaded back from JSON.
+        """
+        Version = self.env['account.ledger.version']
+        if Version._has_pending():
+            # The ledger of this transaction differs from the committed one
+            return json.loads(json.dumps(compute(), default=str))
+        company_ids = company_ids or self.env.companies.ids
+        key = self._get_key(report, params, company_ids)
+        watermark = Version._get_watermark(company_ids, date_to)
+        self.env.cr.execute(
+            "SELECT result FROM account_report_cache WHERE key = %s AND watermark = %s",
+            (key, watermark))
+        row = self.env.cr.fetchone()
+        if row:
+            _logger.debug("Report %s served from the result cache", report)
+            return json.loads(row[0])
+        result = json.dumps(compute(), default=str)
+        self.env.cr.execute(REPORT_CACHE_STORE, (key, report, watermark, result))
+        return json.loads(result)
+
+    @api.model
+    def _gc_results(self):
+        """Drop the results not computed for REPORT_CACHE_DAYS, used by a daily cron."""
+        self.env.cr.execute(
+            "DELETE FROM account_report_cache WHERE date < (now() AT TIME ZONE 'UTC') - %s * interval '1 day'",
+            (REPORT_CACHE_DAYS,))
+        self.invalidate_model()
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models
+from .account_ledger_version import LEDGER_VERSION_PARTNER_FIELDS
+
+
+class ResPartner(models.Model):
+    _inherit = "res.partner"
+
+    def write(self, vals):
+        # The cached aged balances print the partners with their trust
+        if LEDGER_VERSION_PARTNER_FIELDS.intersection(vals):
+            Version = self.env['account.ledger.version']
+            if all(partner.company_id for partner in self):
+                Version._mark_config_dirty(self.company_id.ids)
+            else:
+                Version._mark_config_dirty()
+        return super().write(vals)
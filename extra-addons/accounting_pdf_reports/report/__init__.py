@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from . import ledger_engine
 from . import report_partner_ledger
 from . import report_general_ledger
 from . import report_trial_balance
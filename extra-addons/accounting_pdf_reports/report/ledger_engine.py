@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+import itertools
+
+from odoo import api, models
+
+# Rows fetched per round-trip from the server-side cursor
+LEDGER_FETCH_SIZE = 2000
+
+LEDGER_ORDERS = {
+    'sort_date': 'sequence, ldate, move_id, lid',
+    'sort_journal_partner': 'sequence, lcode, partner_name, move_id, lid',
+}
+
+# One row per account carrying its balance before the period
+LEDGER_INITIAL_QUERY = """
+        SELECT 0 AS lid, l.account_id, 0 AS sequence, NULL::date AS ldate,
+               '' AS lcode, NULL::integer AS currency_id, 0.0 AS amount_currency,
+               '' AS analytic_account_id, '' AS lref, 'Initial Balance' AS lname,
+               COALESCE(SUM(l.debit), 0) AS debit, COALESCE(SUM(l.credit), 0) AS credit,
+               '' AS move_name, '' AS currency_code, '' AS partner_name,
+               NULL::integer AS move_id
+          FROM account_move_line l
+          JOIN account_move m ON (l.move_id = m.id)
+          JOIN account_journal j ON (l.journal_id = j.id)
+          JOIN account_account acc ON (l.account_id = acc.id)
+         WHERE l.account_id IN %s {filters}
+      GROUP BY l.account_id
+     UNION ALL
+"""
+
+# Same rows built from balances already aggregated (account.balance.snapshot)
+LEDGER_INITIAL_VALUES_QUERY = """
+        SELECT 0 AS lid, v.account_id, 0 AS sequence, NULL::date AS ldate,
+               '' AS lcode, NULL::integer AS currency_id, 0.0 AS amount_currency,
+               '' AS analytic_account_id, '' AS lref, 'Initial Balance' AS lname,
+               v.debit, v.credit,
+               '' AS move_name, '' AS currency_code, '' AS partner_name,
+               NULL::integer AS move_id
+          FROM unnest(%s::integer[], %s::numeric[], %s::numeric[]) AS v(account_id, debit, credit)
+     UNION ALL
+"""
+
+# Move lines with their running balance (initial balance folded in) and the
+# account totals, in the order the accounts are printed
+LEDGER_QUERY = """
+    WITH ledger AS (
+        {initial}
+        SELECT l.id AS lid, l.account_id, 1 AS sequence, l.date AS ldate,
+               j.code AS lcode, l.currency_id, l.amount_currency,
+               '' AS analytic_account_id, l.ref AS lref, l.name AS lname,
+               COALESCE(l.debit, 0) AS debit, COALESCE(l.credit, 0) AS credit,
+               m.name AS move_name, c.symbol AS currency_code, p.name AS partner_name,
+               l.move_id
+          FROM account_move_line l
+          JOIN account_move m ON (l.move_id = m.id)
+     LEFT JOIN res_currency c ON (l.currency_id = c.id)
+     LEFT JOIN res_partner p ON (l.partner_id = p.id)
+          JOIN account_journal j ON (l.journal_id = j.id)
+          JOIN account_account acc ON (l.account_id = acc.id)
+         WHERE l.account_id IN %s {filters}
+    )
+    SELECT ledger.*,
+           SUM(debit - credit) OVER (
+               PARTITION BY account_id ORDER BY {order} ROWS UNBOUNDED PRECEDING
+           ) AS balance,
+           SUM(debit) OVER (PARTITION BY account_id) AS account_debit,
+           SUM(credit) OVER (PARTITION BY account_id) AS account_credit
+      FROM ledger
+  ORDER BY array_position(%s, account_id), {order}
+"""
+
+
+class LedgerEngine(models.AbstractModel):
+    """
+    Shared ledger-line engine of the General Ledger, Cash Book and Bank Book.
+
+    Running balances and account totals are computed by window functions and
+    the lines are streamed from a server-side cursor in account order, so the
+    report runs in linear time and never holds the whole ledger in memory.
+    """
+    _name = 'account.ledger.engine'
+    _description = 'Ledger Line Engine'
+
+    _cursor_sequence = itertools.count()
+
+    @api.model
+    def _get_filters(self, context):
+        """WHERE fragment and params of `_query_get` under `context`, aliased on `l`/`m`."""
+        tables, where_clause, where_params = self.env['account.move.line'].with_context(
+            context)._query_get()
+        filters = ''
+        if where_clause.strip():
+            filters = ' AND ' + where_clause.strip()
+        filters = filters.replace('account_move_line__move_id', 'm').replace('account_move_line', 'l')
+        return filters, list(where_params)
+
+    @api.model
+    def _stream(self, query, params):
+        """Yield the rows of `query` as dicts, fetched in batches from a server-side cursor."""
+        cr = self.env.cr
+        name = 'ledger_cursor_%s' % next(self._cursor_sequence)
+        cr.execute('DECLARE %s NO SCROLL CURSOR FOR %s' % (name, query), params)
+        try:
+            while True:
+                cr.execute('FETCH %s FROM %s' % (LEDGER_FETCH_SIZE, name))
+                rows = cr.dictfetchall()
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cr.execute('CLOSE %s' % name)
+
+    @api.model
+    def _ledger_rows(self, accounts, context, init_context=None, sortby='sort_date'):
+        """
+        Stream the ledger lines of `accounts`, account by account.
+
+        :param context: context of `_query_get` selecting the lines
+        :param init_context: context of `_query_get` selecting the lines of the
+            initial balance, None to leave the initial balance out
+        """
+        order = LEDGER_ORDERS.get(sortby, LEDGER_ORDERS['sort_date'])
+        filters, params = self._get_filters(context)
+        initial = ''
+        init_params = []
+        if init_context is not None:
+            balances = self.env['account.balance.snapshot']._get_balances(
+                accounts.ids, init_context)
+            if balances is not None:
+                initial = LEDGER_INITIAL_VALUES_QUERY
+                init_params = [list(balances), [b['debit'] for b in balances.values()],
+                               [b['credit'] for b in balances.values()]]
+            else:
+                init_filters, init_where_params = self._get_filters(init_context)
+                initial = LEDGER_INITIAL_QUERY.format(filters=init_filters)
+                init_params = [tuple(accounts.ids)] + init_where_params
+        query = LEDGER_QUERY.format(initial=initial, filters=filters, order=order)
+        params = init_params + [tuple(accounts.ids)] + params + [accounts.ids]
+        return self._stream(query, params)
+
+    @api.model
+    def _get_account_entries(self, accounts, display_account, context, init_context=None,
+                             sortby='sort_date'):
+        """
+        Lazily build the account dictionaries printed by the ledger templates:
+        {'code', 'name', 'debit', 'credit', 'balance', 'move_lines'}, where
+        `move_lines` is consumed from the shared stream of `_ledger_rows`.
+        """
+        if not accounts:
+            return
+        rows = self._ledger_rows(accounts, context, init_context=init_context, sortby=sortby)
+        positions = {account_id: index for index, account_id in enumerate(accounts.ids)}
+        state = {'row': next(rows, None)}
+
+        def account_lines(account_id):
+            while state['row'] is not None and state['row']['account_id'] == account_id:
+                row = state['row']
+                state['row'] = next(rows, None)
+                yield row
+
+        for index, account in enumerate(accounts):
+            # Skip the lines the template did not consume for a previous account
+            while state['row'] is not None and positions[state['row']['account_id']] < index:
+                state['row'] = next(rows, None)
+            first = state['row']
+            has_lines = first is not None and first['account_id'] == account.id
+            res = {
+                'code': account.code,
+                'name': account.name,
+                'debit': first['account_debit'] if has_lines else 0.0,
+                'credit': first['account_credit'] if has_lines else 0.0,
+                'move_lines': account_lines(account.id) if has_lines else [],
+            }
+            res['balance'] = res['debit'] - res['credit']
+            currency = account.currency_id or account.company_id.currency_id
+            if display_account == 'all':
+                yield res
+            elif display_account == 'movement' and has_lines:
+                yield res
+            elif display_account == 'not_zero' and not currency.is_zero(res['balance']):
+                yield res
@@ -8,6 +8,65 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
 
+# Amount of every receivable/payable line as of date_from, in the currency of
+# the user's company, aggregated per partner and aging period:
+#  - the partial reconciliations of each line are pre-aggregated as of
+#    date_from ({open_amounts}, see account.move.line._get_open_amount_query);
+#  - amounts are converted with the rates of the currencies as of `date`;
+#  - a line is "open" when it was not fully reconciled at date_from, only the
+#    partners with an open line are printed.
+AGED_BALANCE_QUERY = """
+    WITH currency_rate AS (
+        SELECT c.id AS currency_id,
+               COALESCE((SELECT r.rate FROM res_currency_rate r
+                          WHERE r.currency_id = c.id AND r.name <= %(date)s
+                            AND (r.company_id IS NULL OR r.company_id = %(company_id)s)
+                       ORDER BY r.company_id, r.name DESC
+                          LIMIT 1), 1.0) AS rate
+          FROM res_currency c
+    ),
+    line AS (
+        SELECT l.id, l.partner_id, l.reconciled,
+               COALESCE(l.date_maturity, l.date) AS maturity,
+               l.balance, rate.rate,
+               (%(all_partners)s OR l.partner_id IS NULL OR l.partner_id IN %(partner_ids)s) AS selected
+          FROM account_move_line l
+          JOIN account_move am ON (l.move_id = am.id)
+          JOIN account_account acc ON (l.account_id = acc.id)
+          JOIN res_company company ON (l.company_id = company.id)
+          JOIN currency_rate rate ON (rate.currency_id = company.currency_id)
+         WHERE am.state IN %(move_state)s
+           AND acc.account_type IN %(account_type)s
+           AND l.date <= %(date_from)s
+           AND l.company_id IN %(company_ids)s
+    ),
+    line_partial AS ({open_amounts}),
+    aged AS (
+        SELECT line.partner_id, line.selected,
+               NOT line.reconciled OR COALESCE(line_partial.reconciled_after, FALSE) AS open,
+               CASE WHEN line.maturity >= %(date_from)s THEN 6
+                    WHEN line.maturity >= %(start_4)s THEN 5
+                    WHEN line.maturity >= %(start_3)s THEN 4
+                    WHEN line.maturity >= %(start_2)s THEN 3
+                    WHEN line.maturity >= %(start_1)s THEN 2
+                    ELSE 1
+               END AS period,
+               ROUND((line.balance + COALESCE(line_partial.reconciled_amount, 0)) / line.rate * user_rate.rate,
+                     %(digits)s) AS amount
+          FROM line
+     LEFT JOIN line_partial ON (line_partial.line_id = line.id)
+          JOIN currency_rate user_rate ON (user_rate.currency_id = %(user_currency_id)s)
+    )
+    SELECT aged.partner_id, aged.period, bool_or(aged.open) AS open,
+           COALESCE(SUM(aged.amount) FILTER (WHERE aged.selected AND aged.amount != 0), 0) AS amount,
+           COUNT(*) FILTER (WHERE aged.selected AND aged.amount != 0) AS line_count
+      FROM aged
+ LEFT JOIN res_partner rp ON (aged.partner_id = rp.id)
+  GROUP BY aged.partner_id, UPPER(rp.name), aged.period
+  ORDER BY UPPER(rp.name), aged.partner_id, aged.period
+"""
+
+
 class ReportAgedPartnerBalance(models.AbstractModel):
     _name = 'report.accounting_pdf_reports.report_agedpartnerbalance'
     _description = 'Aged Partner Balance Report'
@@ -25,6 +84,9 @@ class ReportAgedPartnerBalance(models.AbstractModel):
         # 61 - 90  : 2018-12-09 - 2018-11-10
         # 91 - 120 : 2018-11-09 - 2018-10-11
         # +120     : 2018-10-10
+        # The lines are aged by a single query (AGED_BALANCE_QUERY) and the
+        # third returned value holds, per partner, the amount and number of
+        # lines of each period (1-5 from the oldest, 6 for not due).
         periods = {}
         start = datetime.strptime(str(date_from), "%Y-%m-%d")
         date_from = datetime.strptime(str(date_from), "%Y-%m-%d").date()
@@ -41,9 +103,6 @@ class ReportAgedPartnerBalance(models.AbstractModel):
             }
             start = stop
 
-        res = []
-        total = []
-        cr = self.env.cr
         user_company = self.env.user.company_id
         user_currency = user_company.currency_id
         company_ids = self._context.get('company_ids') or [user_company.id]
@@ -53,173 +112,72 @@ class ReportAgedPartnerBalance(models.AbstractModel):
 
         if target_move == 'posted':
             move_state = ['posted']
-        arg_list = (tuple(move_state), tuple(account_type))
-
-        reconciliation_clause = '(l.reconciled IS FALSE)'
-        cr.execute('SELECT debit_move_id, credit_move_id FROM account_partial_reconcile where max_date > %s', (date_from,))
-        reconciled_after_date = []
-        for row in cr.fetchall():
-            reconciled_after_date += [row[0], row[1]]
-        if reconciled_after_date:
-            reconciliation_clause = '(l.reconciled IS FALSE OR l.id IN %s)'
-            arg_list += (tuple(reconciled_after_date),)
-        arg_list += (date_from, tuple(company_ids))
-        query = '''
-            SELECT DISTINCT l.partner_id, UPPER(res_partner.name)
-            FROM account_move_line AS l left join res_partner on l.partner_id = res_partner.id, account_account, account_move am
-            WHERE (l.account_id = account_account.id)
-                AND (l.move_id = am.id)
-                AND (am.state IN %s)
-                AND (account_account.account_type IN %s)
-                AND ''' + reconciliation_clause + '''
-                AND (l.date <= %s)
-                AND l.company_id IN %s
-            ORDER BY UPPER(res_partner.name)'''
-        cr.execute(query, arg_list)
-        partners = cr.dictfetchall()
-        # put a total of 0
-        for i in range(7):
-            total.append(0)
 
-        # Build a string like (1,2,3) for easy use in SQL query
-        if not partner_ids:
-            partner_ids = [partner['partner_id'] for partner in partners if partner['partner_id']]
-        lines = dict((partner['partner_id'] or False, []) for partner in partners)
-        if not partner_ids:
-            return [], [], {}
-
-        # This dictionary will store the not due amount of all partners
-        undue_amounts = {}
-        query = '''SELECT l.id
-                FROM account_move_line AS l, account_account, account_move am
-                WHERE (l.account_id = account_account.id) AND (l.move_id = am.id)
-                    AND (am.state IN %s)
-                    AND (account_account.account_type IN %s)
-                    AND (COALESCE(l.date_maturity,l.date) >= %s)\
-                    AND ((l.partner_id IN %s) OR (l.partner_id IS NULL))
-                AND (l.date <= %s)
-                AND l.company_id IN %s'''
-        cr.execute(query, (tuple(move_state), tuple(account_type), date_from,
-                           tuple(partner_ids), date_from, tuple(company_ids)))
-        aml_ids = cr.fetchall()
-        aml_ids = aml_ids and [x[0] for x in aml_ids] or []
-        for line in self.env['account.move.line'].browse(aml_ids):
-            partner_id = line.partner_id.id or False
-            if partner_id not in undue_amounts:
-                undue_amounts[partner_id] = 0.0
-            line_amount = line.company_id.currency_id._convert(line.balance,
-                                                               user_currency,
-                                                               company, date)
-            if user_currency.is_zero(line_amount):
-                continue
-            for partial_line in line.matched_debit_ids:
-                if partial_line.max_date <= date_from:
-                    line_currency = partial_line.company_id.currency_id
-                    line_amount += line_currency._convert(partial_line.amount,
-                                                          user_currency,
-                                                          company, date)
-            for partial_line in line.matched_credit_ids:
-                if partial_line.max_date <= date_from:
-                    line_currency = partial_line.company_id.currency_id
-                    line_amount -= line_currency._convert(partial_line.amount,
-                                                          user_currency,
-                                                          company, date)
-            if not self.env.user.company_id.currency_id.is_zero(line_amount):
-                undue_amounts[partner_id] += line_amount
+        params = {
+            'date': date,
+            'date_from': date_from,
+            'company_id': company.id,
+            'company_ids': tuple(company_ids),
+            'user_currency_id': user_currency.id,
+            'digits': user_currency.decimal_places,
+            'move_state': tuple(move_state),
+            'account_type': tuple(account_type),
+            'all_partners': not partner_ids,
+            'partner_ids': tuple(partner_ids or [0]),
+        }
+        for i in range(1, 5):
+            params['start_%s' % i] = periods[str(i)]['start']
+        open_amounts = self.env['account.move.line']._get_open_amount_query(date_from, 'SELECT id FROM line')
+        self.env.cr.execute(AGED_BALANCE_QUERY.format(open_amounts=open_amounts), params)
+
+        # Per partner: whether it has lines still open at date_from, the amount
+        # and the number of lines of each period (1-5 aged, 6 not due)
+        partners = {}
+        lines = {}
+        for row in self.env.cr.dictfetchall():
+            partner_id = row['partner_id'] or False
+            partner = partners.setdefault(partner_id, {'open': False, 'amounts': {}})
+            partner['open'] = partner['open'] or row['open']
+            lines.setdefault(partner_id, [])
+            if row['line_count']:
+                partner['amounts'][row['period']] = float(row['amount'])
                 lines[partner_id].append({
-                    'line': line,
-                    'amount': line_amount,
-                    'period': 6,
+                    'period': row['period'],
+                    'amount': float(row['amount']),
+                    'line_count': row['line_count'],
                 })
+        partners = {partner_id: partner for partner_id, partner in partners.items() if partner['open']}
+        lines = {partner_id: lines[partner_id] for partner_id in partners}
+        if not partner_ids and not any(partners):
+            return [], [], {}
 
-        # Use one query per period and store results in history (a list variable)
-        # Each history will contain: history[1] = {'<partner_id>': <partner_debit-credit>}
-        history = []
-        for i in range(5):
-            args_list = (tuple(move_state), tuple(account_type), tuple(partner_ids),)
-            dates_query = '(COALESCE(l.date_maturity,l.date)'
-
-            if periods[str(i)]['start'] and periods[str(i)]['stop']:
-                dates_query += ' BETWEEN %s AND %s)'
-                args_list += (periods[str(i)]['start'], periods[str(i)]['stop'])
-            elif periods[str(i)]['start']:
-                dates_query += ' >= %s)'
-                args_list += (periods[str(i)]['start'],)
-            else:
-                dates_query += ' <= %s)'
-                args_list += (periods[str(i)]['stop'],)
-            args_list += (date_from, tuple(company_ids))
-
-            query = '''SELECT l.id
-                    FROM account_move_line AS l, account_account, account_move am
-                    WHERE (l.account_id = account_account.id) AND (l.move_id = am.id)
-                        AND (am.state IN %s)
-                        AND (account_account.account_type IN %s)
-                        AND ((l.partner_id IN %s) OR (l.partner_id IS NULL))
-                        AND ''' + dates_query + '''
-                    AND (l.date <= %s)
-                    AND l.company_id IN %s'''
-            cr.execute(query, args_list)
-            partners_amount = {}
-            aml_ids = cr.fetchall()
-            aml_ids = aml_ids and [x[0] for x in aml_ids] or []
-            for line in self.env['account.move.line'].browse(aml_ids):
-                partner_id = line.partner_id.id or False
-                if partner_id not in partners_amount:
-                    partners_amount[partner_id] = 0.0
-                line_currency_id = line.company_id.currency_id
-                line_amount = line_currency_id._convert(line.balance, user_currency, company, date)
-                if user_currency.is_zero(line_amount):
-                    continue
-                for partial_line in line.matched_debit_ids:
-                    if partial_line.max_date <= date_from:
-                        line_currency_id = partial_line.company_id.currency_id
-                        line_amount += line_currency_id._convert(
-                            partial_line.amount, user_currency, company, date)
-                for partial_line in line.matched_credit_ids:
-                    if partial_line.max_date <= date_from:
-                        line_currency_id = partial_line.company_id.currency_id
-                        line_amount -= line_currency_id._convert(
-                            partial_line.amount, user_currency, company, date)
-                if not self.env.user.company_id.currency_id.is_zero(line_amount):
-                    partners_amount[partner_id] += line_amount
-                    lines[partner_id].append({
-                        'line': line,
-                        'amount': line_amount,
-                        'period': i + 1,
-                        })
-            history.append(partners_amount)
-
-        for partner in partners:
-            if partner['partner_id'] is None:
-                partner['partner_id'] = False
+        res = []
+        total = [0] * 7
+        rounding = user_currency.rounding
+        browsed_partners = {partner.id: partner for partner in self.env['res.partner'].browse(
+            [partner_id for partner_id in partners if partner_id])}
+        for partner_id, partner in partners.items():
             at_least_one_amount = False
             values = {}
-            undue_amt = 0.0
-            if partner['partner_id'] in undue_amounts:  # Making sure this partner actually was found by the query
-                undue_amt = undue_amounts[partner['partner_id']]
-
+            undue_amt = partner['amounts'].get(6, 0.0)
             total[6] = total[6] + undue_amt
             values['direction'] = undue_amt
-            if not float_is_zero(values['direction'], precision_rounding=self.env.user.company_id.currency_id.rounding):
+            if not float_is_zero(values['direction'], precision_rounding=rounding):
                 at_least_one_amount = True
 
             for i in range(5):
-                during = False
-                if partner['partner_id'] in history[i]:
-                    during = [history[i][partner['partner_id']]]
+                amount = partner['amounts'].get(i + 1, 0.0)
                 # Adding counter
-                total[(i)] = total[(i)] + (during and during[0] or 0)
-                values[str(i)] = during and during[0] or 0.0
-                if not float_is_zero(values[str(i)],
-                                     precision_rounding=self.env.user.company_id.currency_id.rounding):
+                total[(i)] = total[(i)] + amount
+                values[str(i)] = amount
+                if not float_is_zero(values[str(i)], precision_rounding=rounding):
                     at_least_one_amount = True
             values['total'] = sum([values['direction']] + [values[str(i)] for i in range(5)])
             ## Add for total
-            total[(i + 1)] += values['total']
-            values['partner_id'] = partner['partner_id']
-            if partner['partner_id']:
-                browsed_partner = self.env['res.partner'].browse(partner['partner_id'])
+            total[5] += values['total']
+            values['partner_id'] = partner_id
+            if partner_id:
+                browsed_partner = browsed_partners[partner_id]
                 values['name'] = browsed_partner.name and len(
                     browsed_partner.name) >= 45 and browsed_partner.name[
                                                     0:40] + '...' or browsed_partner.name
@@ -228,7 +186,7 @@ class ReportAgedPartnerBalance(models.AbstractModel):
                 values['name'] = _('Unknown Partner')
                 values['trust'] = False
 
-            if at_least_one_amount or (self._context.get('include_nullified_amount') and lines[partner['partner_id']]):
+            if at_least_one_amount or (self._context.get('include_nullified_amount') and lines[partner_id]):
                 res.append(values)
 
         return res, total, lines
@@ -251,12 +209,15 @@ class ReportAgedPartnerBalance(models.AbstractModel):
         else:
             account_type = ['asset_receivable', 'liability_payable']
         partner_ids = data['form']['partner_ids']
-        movelines, total, dummy = self._get_partner_move_lines(account_type,
-                                                               partner_ids,
-                                                               date_from,
-                                                               target_move,
-                                                               data['form'][
-                                                                   'period_length'])
+        period_length = data['form']['period_length']
+        # Amounts are converted at today's rates
+        movelines, total = self.env['account.report.cache']._get_or_compute(
+            'aged_partner_balance',
+            dict(data['form'], date=self._context.get('date') or fields.Date.today()),
+            lambda: self._get_partner_move_lines(
+                account_type, partner_ids, date_from, target_move, period_length)[:2],
+            date_to=date_from,
+            company_ids=self._context.get('company_ids') or self.env.user.company_id.ids)
         return {
             'doc_ids': self.ids,
             'doc_model': model,
@@ -22,6 +22,12 @@ class ReportFinancial(models.AbstractModel):
         for account in accounts:
             res[account.id] = dict.fromkeys(mapping, 0.0)
         if accounts:
+            # Whole months come from the balance snapshot when the filters allow it
+            balances = self.env['account.balance.snapshot']._get_balances(
+                accounts.ids, self.env.context)
+            if balances is not None:
+                res.update(balances)
+                return res
             tables, where_clause, where_params = self.env['account.move.line']._query_get()
             tables = tables.replace('"', '') if tables else "account_move_line"
             wheres = [""]
@@ -39,55 +45,93 @@ class ReportFinancial(models.AbstractModel):
                 res[row['id']] = row
         return res
 
-    def _compute_report_balance(self, reports):
+    def _compute_report_balance(self, reports, periods=None):
         '''returns a dictionary with key=the ID of a record and value=the credit, debit and balance amount
-           computed for this record. If the record is of type :
-               'accounts' : it's the sum of the linked accounts
-               'account_type' : it's the sum of leaf accoutns with such an account_type
-               'account_report' : it's the amount of the related report
-               'sum' : it's the sum of the children of this record (aka a 'view' record)'''
-        res = {}
+           computed for this record. If the record is of type :
+               'accounts' : it's the sum of the linked accounts
+               'account_type' : it's the sum of leaf accoutns with such an account_type
+               'account_report' : it's the amount of the related report
+               'sum' : it's the sum of the children of this record (aka a 'view' record)
+
+           The leaf accounts of every node are aggregated by a single grouped
+           query, then the node values are rolled up in memory, each node
+           being evaluated once. With `periods` (see
+           account.move.line._get_period_balances) every value also carries
+           the list of its balances per period under 'periods'.'''
         fields = ['credit', 'debit', 'balance']
-        for report in reports:
+        nodes = self._load_report_tree(reports)
+
+        # One search for all the account types, one query for all the accounts
+        types = nodes.filtered(lambda r: r.type == 'account_type').account_type_ids.mapped('type')
+        accounts_by_type = {}
+        if types:
+            for account in self.env['account.account'].search([('account_type', 'in', types)]):
+                accounts_by_type.setdefault(account.account_type, []).append(account.id)
+        account_ids = set(nodes.filtered(lambda r: r.type == 'accounts').account_ids.ids)
+        for ids in accounts_by_type.values():
+            account_ids.update(ids)
+        balances = self._compute_account_balance(self.env['account.account'].browse(sorted(account_ids)))
+        if periods:
+            period_balances = self.env['account.move.line']._get_period_balances(
+                sorted(account_ids), periods)
+            for account_id in account_ids:
+                balances[account_id]['periods'] = period_balances.get(
+                    account_id, [0.0] * len(periods))
+
+        res = {}
+
+        def add(value, other):
+            for field in fields:
+                value[field] += other[field]
+            if periods:
+                value['periods'] = [a + b for a, b in zip(value['periods'], other['periods'])]
+
+        def evaluate(report):
             if report.id in res:
-                continue
-            res[report.id] = dict((fn, 0.0) for fn in fields)
-            if report.type == 'accounts':
-                # it's the sum of the linked accounts
-                res[report.id]['account'] = self._compute_account_balance(report.account_ids)
-                for value in res[report.id]['account'].values():
-                    for field in fields:
-                        res[report.id][field] += value.get(field)
-            elif report.type == 'account_type':
-                # it's the sum the leaf accounts with such an account type
-                accounts = self.env['account.account'].search(
-                    [('account_type', 'in', report.account_type_ids.mapped('type'))])
-
-                res[report.id]['account'] = self._compute_account_balance(accounts)
-                for value in res[report.id]['account'].values():
-                    for field in fields:
-                        res[report.id][field] += value.get(field)
+                return res[report.id]
+            value = res[report.id] = dict((fn, 0.0) for fn in fields)
+            if periods:
+                value['periods'] = [0.0] * len(periods)
+            if report.type in ('accounts', 'account_type'):
+                if report.type == 'accounts':
+                    leaf_ids = report.account_ids.ids
+                else:
+                    leaf_ids = [account_id for account_type in report.account_type_ids.mapped('type')
+                                for account_id in accounts_by_type.get(account_type, [])]
+                value['account'] = {account_id: dict(balances[account_id]) for account_id in leaf_ids}
+                for account_value in value['account'].values():
+                    add(value, account_value)
             elif report.type == 'account_report' and report.account_report_id:
-                # it's the amount of the linked report
-                res2 = self._compute_report_balance(report.account_report_id)
-                for key, value in res2.items():
-                    for field in fields:
-                        res[report.id][field] += value[field]
+                add(value, evaluate(report.account_report_id))
             elif report.type == 'sum':
-                # it's the sum of the children of this account.report
-                res2 = self._compute_report_balance(report.children_ids)
-                for key, value in res2.items():
-                    for field in fields:
-                        res[report.id][field] += value[field]
-        return res
+                for child in report.children_ids:
+                    add(value, evaluate(child))
+            return value
+
+        for report in reports:
+            evaluate(report)
+        return {report.id: res[report.id] for report in reports}
+
+    def _load_report_tree(self, reports):
+        """All the nodes the evaluation of `reports` reaches, including the
+        subtrees of the linked reports, loaded with one query per link depth."""
+        nodes = reports._get_children_by_order()
+        while True:
+            linked = nodes.filtered(lambda r: r.type == 'account_report').account_report_id - nodes
+            if not linked:
+                return nodes
+            nodes |= linked._get_children_by_order()
 
     def get_account_lines(self, data):
         lines = []
         account_report = self.env['account.financial.report'].search(
             [('id', '=', data['account_report_id'][0])])
         child_reports = account_report._get_children_by_order()
-        res = self.with_context(data.get('used_context'))._compute_report_balance(child_reports)
-        if data['enable_filter']:
+        # Period columns are bucketed by the same pass as the main balance
+        periods = data['enable_filter'] and data['filter_cmp'] == 'filter_periods' and data.get('period_columns')
+        res = self.with_context(data.get('used_context'))._compute_report_balance(
+            child_reports, periods=periods or None)
+        if data['enable_filter'] and not periods:
             comparison_res = self.with_context(
                 data.get('comparison_context'))._compute_report_balance(
                 child_reports)
@@ -97,6 +141,9 @@ class ReportFinancial(models.AbstractModel):
                 if report_acc:
                     for account_id, val in comparison_res[report_id].get('account').items():
                         report_acc[account_id]['comp_bal'] = val['balance']
+        # Browse every displayed account at once so they are prefetched together
+        account_ids = {account_id for value in res.values() for account_id in value.get('account', {})}
+        accounts = {account.id: account for account in self.env['account.account'].browse(account_ids)}
         for report in child_reports:
             vals = {
                 'name': report.name,
@@ -109,7 +156,9 @@ class ReportFinancial(models.AbstractModel):
                 vals['debit'] = res[report.id]['debit']
                 vals['credit'] = res[report.id]['credit']
 
-            if data['enable_filter']:
+            if periods:
+                vals['balances'] = [balance * float(report.sign) for balance in res[report.id]['periods']]
+            elif data['enable_filter']:
                 vals['balance_cmp'] = res[report.id]['comp_bal'] * float(report.sign)
 
             lines.append(vals)
@@ -123,7 +172,7 @@ class ReportFinancial(models.AbstractModel):
                     #the COA + 1 (to avoid having them with a too low level that would conflicts with the level of data
                     #financial reports for Assets, liabilities...)
                     flag = False
-                    account = self.env['account.account'].browse(account_id)
+                    account = accounts[account_id]
                     vals = {
                         'name': account.code + ' ' + account.name,
                         'balance': value['balance'] * float(report.sign) or 0.0,
@@ -138,7 +187,11 @@ class ReportFinancial(models.AbstractModel):
                             flag = True
                     if not account.company_id.currency_id.is_zero(vals['balance']):
                         flag = True
-                    if data['enable_filter']:
+                    if periods:
+                        vals['balances'] = [balance * float(report.sign) for balance in value['periods']]
+                        if any(not account.company_id.currency_id.is_zero(balance) for balance in vals['balances']):
+                            flag = True
+                    elif data['enable_filter']:
                         vals['balance_cmp'] = value['comp_bal'] * float(report.sign)
                         if not account.company_id.currency_id.is_zero(vals['balance_cmp']):
                             flag = True
@@ -147,6 +200,16 @@ class ReportFinancial(models.AbstractModel):
                 lines += sorted(sub_lines, key=lambda sub_line: sub_line['name'])
         return lines
 
+    def _get_cache_date_to(self, form):
+        """Last date the report reads, False when it reads the whole ledger."""
+        dates = [(form.get('used_context') or {}).get('date_to')]
+        if form.get('enable_filter'):
+            if form.get('filter_cmp') == 'filter_periods':
+                dates += [period['date_to'] for period in form.get('period_columns') or []]
+            else:
+                dates.append((form.get('comparison_context') or {}).get('date_to'))
+        return all(dates) and max(str(date) for date in dates)
+
     @api.model
     def _get_report_values(self, docids, data=None):
         if not data.get('form') or not self.env.context.get('active_model') or not self.env.context.get('active_id'):
@@ -154,7 +217,12 @@ class ReportFinancial(models.AbstractModel):
 
         model = self.env.context.get('active_model')
         docs = self.env[model].browse(self.env.context.get('active_id'))
-        report_lines = self.get_account_lines(data.get('form'))
+        form = data.get('form')
+        used_context = form.get('used_context') or {}
+        report_lines = self.env['account.report.cache']._get_or_compute(
+            'financial', form, lambda: self.get_account_lines(form),
+            date_to=self._get_cache_date_to(form),
+            company_ids=used_context.get('company_id') and [used_context['company_id']])
         return {
             'doc_ids': self.ids,
             'doc_model': model,
@@ -9,87 +9,97 @@ class ReportJournal(models.AbstractModel):
     _name = 'report.accounting_pdf_reports.report_journal'
     _description = 'Journal Audit Report'
 
-    def lines(self, target_move, journal_ids, sort_selection, data):
-        if isinstance(journal_ids, int):
-            journal_ids = [journal_ids]
-
-        move_state = ['draft', 'posted']
-        if target_move == 'posted':
-            move_state = ['posted']
+    def _get_move_state(self, data):
+        if data['form'].get('target_move', 'all') == 'posted':
+            return ['posted']
+        return ['draft', 'posted']
 
+    def _get_lines(self, data, journal_ids, sort_selection):
+        """The printed lines of every journal, as {journal_id: [row, ...]}."""
         query_get_clause = self._get_query_get_clause(data)
-        params = [tuple(move_state), tuple(journal_ids)] + query_get_clause[2]
-        query = 'SELECT "account_move_line".id FROM ' + query_get_clause[0] + ', account_move am, account_account acc WHERE "account_move_line".account_id = acc.id AND "account_move_line".move_id=am.id AND am.state IN %s AND "account_move_line".journal_id IN %s AND ' + query_get_clause[1] + ' ORDER BY '
+        params = [tuple(self._get_move_state(data)), tuple(journal_ids)] + query_get_clause[2]
+        query = """
+            SELECT "account_move_line".id, "account_move_line".journal_id, "account_move_line".move_id,
+                   am.name AS move_name, "account_move_line".date, acc.code AS account_code,
+                   p.name AS partner_name, "account_move_line".name,
+                   "account_move_line".debit, "account_move_line".credit,
+                   "account_move_line".amount_currency, "account_move_line".currency_id
+            FROM """ + query_get_clause[0] + """
+            JOIN account_move am ON ("account_move_line".move_id = am.id)
+            JOIN account_account acc ON ("account_move_line".account_id = acc.id)
+            LEFT JOIN res_partner p ON ("account_move_line".partner_id = p.id)
+            WHERE am.state IN %s
+                AND "account_move_line".journal_id IN %s
+                AND """ + query_get_clause[1] + """
+            ORDER BY """
         if sort_selection == 'date':
             query += '"account_move_line".date'
         else:
             query += 'am.name'
         query += ', "account_move_line".move_id, acc.code'
         self.env.cr.execute(query, tuple(params))
-        ids = (x[0] for x in self.env.cr.fetchall())
-        return self.env['account.move.line'].browse(ids)
-
-    def _sum_debit(self, data, journal_id):
-        move_state = ['draft', 'posted']
-        if data['form'].get('target_move', 'all') == 'posted':
-            move_state = ['posted']
-
-        query_get_clause = self._get_query_get_clause(data)
-        params = [tuple(move_state), tuple(journal_id.ids)] + query_get_clause[2]
-        self.env.cr.execute('SELECT SUM(debit) FROM ' + query_get_clause[0] + ', account_move am '
-                        'WHERE "account_move_line".move_id=am.id AND am.state IN %s AND "account_move_line".journal_id IN %s AND ' + query_get_clause[1] + ' ',
-                        tuple(params))
-        return self.env.cr.fetchone()[0] or 0.0
-
-    def _sum_credit(self, data, journal_id):
-        move_state = ['draft', 'posted']
-        if data['form'].get('target_move', 'all') == 'posted':
-            move_state = ['posted']
+        currency = self.env['res.currency']
+        res = {journal_id: [] for journal_id in journal_ids}
+        for row in self.env.cr.dictfetchall():
+            row['move_name'] = row['move_name'] != '/' and row['move_name'] or ('*' + str(row['move_id']))
+            row['partner_name'] = row['partner_name'] and row['partner_name'][:23] or ''
+            row['name'] = row['name'] and row['name'][:35]
+            row['currency_id'] = currency.browse(row['currency_id'])
+            res[row['journal_id']].append(row)
+        return res
 
+    def _get_totals(self, data, journal_ids):
+        """Debit and credit totals of every journal, as {journal_id: {'debit', 'credit'}}."""
         query_get_clause = self._get_query_get_clause(data)
-        params = [tuple(move_state), tuple(journal_id.ids)] + query_get_clause[2]
-        self.env.cr.execute('SELECT SUM(credit) FROM ' + query_get_clause[0] + ', account_move am '
-                        'WHERE "account_move_line".move_id=am.id AND am.state IN %s AND "account_move_line".journal_id IN %s AND ' + query_get_clause[1] + ' ',
-                        tuple(params))
-        return self.env.cr.fetchone()[0] or 0.0
-
-    def _get_taxes(self, data, journal_id):
-        move_state = ['draft', 'posted']
-        if data['form'].get('target_move', 'all') == 'posted':
-            move_state = ['posted']
+        params = [tuple(self._get_move_state(data)), tuple(journal_ids)] + query_get_clause[2]
+        self.env.cr.execute(
+            'SELECT "account_move_line".journal_id, COALESCE(SUM(debit), 0) AS debit, COALESCE(SUM(credit), 0) AS credit '
+            'FROM ' + query_get_clause[0] + ', account_move am '
+            'WHERE "account_move_line".move_id=am.id AND am.state IN %s AND "account_move_line".journal_id IN %s AND ' + query_get_clause[1] +
+            ' GROUP BY "account_move_line".journal_id',
+            tuple(params))
+        res = {journal_id: {'debit': 0.0, 'credit': 0.0} for journal_id in journal_ids}
+        for row in self.env.cr.dictfetchall():
+            res[row.pop('journal_id')] = row
+        return res
 
+    def _get_taxes(self, data, journals):
+        """
+        Base and tax amounts of every tax of every journal, as
+        {journal_id: {tax: {'base_amount', 'tax_amount'}}}, from one query
+        grouping the base lines and one grouping the tax lines.
+        """
         query_get_clause = self._get_query_get_clause(data)
-        params = [tuple(move_state), tuple(journal_id.ids)] + query_get_clause[2]
+        params = [tuple(self._get_move_state(data)), tuple(journals.ids)] + query_get_clause[2]
         query = """
-            SELECT rel.account_tax_id, SUM("account_move_line".balance) AS base_amount
-            FROM account_move_line_account_tax_rel rel, """ + query_get_clause[0] + """ 
+            SELECT "account_move_line".journal_id, rel.account_tax_id, SUM("account_move_line".balance) AS base_amount
+            FROM account_move_line_account_tax_rel rel, """ + query_get_clause[0] + """
             LEFT JOIN account_move am ON "account_move_line".move_id = am.id
             WHERE "account_move_line".id = rel.account_move_line_id
                 AND am.state IN %s
                 AND "account_move_line".journal_id IN %s
                 AND """ + query_get_clause[1] + """
-           GROUP BY rel.account_tax_id"""
+           GROUP BY "account_move_line".journal_id, rel.account_tax_id"""
         self.env.cr.execute(query, tuple(params))
-        ids = []
-        base_amounts = {}
-        for row in self.env.cr.fetchall():
-            ids.append(row[0])
-            base_amounts[row[0]] = row[1]
-
-
-        res = {}
-        for tax in self.env['account.tax'].browse(ids):
-            self.env.cr.execute('SELECT sum(debit - credit) FROM ' + query_get_clause[0] + ', account_move am '
-                'WHERE "account_move_line".move_id=am.id AND am.state IN %s AND "account_move_line".journal_id IN %s AND ' + query_get_clause[1] + ' AND tax_line_id = %s',
-                tuple(params + [tax.id]))
-            res[tax] = {
-                'base_amount': base_amounts[tax.id],
-                'tax_amount': self.env.cr.fetchone()[0] or 0.0,
+        base_amounts = self.env.cr.fetchall()
+
+        self.env.cr.execute(
+            'SELECT "account_move_line".journal_id, tax_line_id, SUM(debit - credit) '
+            'FROM ' + query_get_clause[0] + ', account_move am '
+            'WHERE "account_move_line".move_id=am.id AND am.state IN %s AND "account_move_line".journal_id IN %s AND ' + query_get_clause[1] +
+            ' AND tax_line_id IS NOT NULL GROUP BY "account_move_line".journal_id, tax_line_id',
+            tuple(params))
+        tax_amounts = {(journal_id, tax_id): amount for journal_id, tax_id, amount in self.env.cr.fetchall()}
+
+        taxes = {tax.id: tax for tax in self.env['account.tax'].browse(list({row[1] for row in base_amounts}))}
+        # sales operation are credits
+        signs = {journal.id: journal.type == 'sale' and -1 or 1 for journal in journals}
+        res = {journal_id: {} for journal_id in journals.ids}
+        for journal_id, tax_id, base_amount in base_amounts:
+            res[journal_id][taxes[tax_id]] = {
+                'base_amount': base_amount * signs[journal_id],
+                'tax_amount': (tax_amounts.get((journal_id, tax_id)) or 0.0) * signs[journal_id],
             }
-            if journal_id.type == 'sale':
-                #sales operation are credits
-                res[tax]['base_amount'] = res[tax]['base_amount'] * -1
-                res[tax]['tax_amount'] = res[tax]['tax_amount'] * -1
         return res
 
     def _get_query_get_clause(self, data):
@@ -100,20 +110,17 @@ class ReportJournal(models.AbstractModel):
         if not data.get('form'):
             raise UserError(_("Form content is missing, this report cannot be printed."))
 
-        target_move = data['form'].get('target_move', 'all')
         sort_selection = data['form'].get('sort_selection', 'date')
-
-        res = {}
-        for journal in data['form']['journal_ids']:
-            res[journal] = self.with_context(data['form'].get('used_context', {})).lines(target_move, journal, sort_selection, data)
+        journal_ids = data['form']['journal_ids']
+        journals = self.env['account.journal'].browse(journal_ids)
+        report = self.with_context(data['form'].get('used_context', {}))
         return {
-            'doc_ids': data['form']['journal_ids'],
+            'doc_ids': journal_ids,
             'doc_model': self.env['account.journal'],
             'data': data,
-            'docs': self.env['account.journal'].browse(data['form']['journal_ids']),
+            'docs': journals,
             'time': time,
-            'lines': res,
-            'sum_credit': self._sum_credit,
-            'sum_debit': self._sum_debit,
-            'get_taxes': self._get_taxes,
+            'lines': report._get_lines(data, journal_ids, sort_selection),
+            'totals': report._get_totals(data, journal_ids),
+            'taxes': report._get_taxes(data, journals),
         }
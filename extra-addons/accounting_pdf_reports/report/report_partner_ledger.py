@@ -5,67 +5,97 @@ from odoo import api, models, _
 from odoo.exceptions import UserError
 
 
+# Lines of the printed partners in the order of the report, with the running
+# balance and the totals of their partner
+PARTNER_LEDGER_QUERY = """
+    SELECT "account_move_line".id, "account_move_line".partner_id, "account_move_line".date, j.code,
+           acc.code as a_code, acc.name as a_name, "account_move_line".ref, m.name as move_name,
+           "account_move_line".name, "account_move_line".debit, "account_move_line".credit,
+           "account_move_line".amount_currency, "account_move_line".currency_id, c.symbol AS currency_code,
+           SUM("account_move_line".debit - "account_move_line".credit) OVER (
+               PARTITION BY "account_move_line".partner_id
+               ORDER BY "account_move_line".date, "account_move_line".id ROWS UNBOUNDED PRECEDING
+           ) AS progress,
+           SUM("account_move_line".debit) OVER (PARTITION BY "account_move_line".partner_id) AS partner_debit,
+           SUM("account_move_line".credit) OVER (PARTITION BY "account_move_line".partner_id) AS partner_credit
+      FROM {tables}
+ LEFT JOIN account_journal j ON ("account_move_line".journal_id = j.id)
+ LEFT JOIN account_account acc ON ("account_move_line".account_id = acc.id)
+ LEFT JOIN res_currency c ON ("account_move_line".currency_id=c.id)
+ LEFT JOIN account_move m ON (m.id="account_move_line".move_id)
+     WHERE "account_move_line".partner_id IN %s
+       AND m.state IN %s
+       AND "account_move_line".account_id IN %s AND {where} {reconcile}
+  ORDER BY array_position(%s, "account_move_line".partner_id), "account_move_line".date, "account_move_line".id
+"""
+
+
 class ReportPartnerLedger(models.AbstractModel):
     _name = 'report.accounting_pdf_reports.report_partnerledger'
     _description = 'Partner Ledger Report'
 
-    def _lines(self, data, partner):
-        full_account = []
-        currency = self.env['res.currency']
-        query_get_data = self.env['account.move.line'].with_context(data['form'].get('used_context', {}))._query_get()
-        reconcile_clause = "" if data['form']['reconciled'] else ' AND "account_move_line".full_reconcile_id IS NULL '
-        params = [partner.id, tuple(data['computed']['move_state']), tuple(data['computed']['account_ids'])] + query_get_data[2]
-        query = """
-            SELECT "account_move_line".id, "account_move_line".date, j.code, acc.code as a_code, acc.name as a_name, "account_move_line".ref, m.name as move_name, "account_move_line".name, "account_move_line".debit, "account_move_line".credit, "account_move_line".amount_currency,"account_move_line".currency_id, c.symbol AS currency_code
-            FROM """ + query_get_data[0] + """
-            LEFT JOIN account_journal j ON ("account_move_line".journal_id = j.id)
-            LEFT JOIN account_account acc ON ("account_move_line".account_id = acc.id)
-            LEFT JOIN res_currency c ON ("account_move_line".currency_id=c.id)
-            LEFT JOIN account_move m ON (m.id="account_move_line".move_id)
-            WHERE "account_move_line".partner_id = %s
-                AND m.state IN %s
-                AND "account_move_line".account_id IN %s AND """ + query_get_data[1] + reconcile_clause + """
-                ORDER BY "account_move_line".date"""
-        self.env.cr.execute(query, tuple(params))
-        res = self.env.cr.dictfetchall()
-        sum = 0.0
-        lang_code = self.env.context.get('lang') or 'en_US'
-        lang = self.env['res.lang']
-        lang_id = lang._lang_get(lang_code)
-        date_format = lang_id.date_format
-        for r in res:
-            r['date'] = r['date']
-            r['displayed_name'] = '-'.join(
-                r[field_name] for field_name in ('move_name', 'ref', 'name')
-                if r[field_name] not in (None, '', '/')
-            )
-            sum += r['debit'] - r['credit']
-            r['progress'] = sum
-            r['currency_id'] = currency.browse(r.get('currency_id'))
-            full_account.append(r)
-        return full_account
+    def _get_reconcile_clause(self, data):
+        """
+        Filter of the unreconciled entries: the lines that were not fully
+        reconciled yet at the end date of the report, or today without one.
+        """
+        if data['form']['reconciled']:
+            return ""
+        date_to = data['form'].get('used_context', {}).get('date_to')
+        if not date_to:
+            return ' AND "account_move_line".full_reconcile_id IS NULL '
+        reconciled_after = self.env['account.move.line']._get_reconciled_after_query(date_to)
+        return (' AND ("account_move_line".full_reconcile_id IS NULL'
+                ' OR "account_move_line".id IN (' + reconciled_after + ')) ')
 
-    def _sum_partner(self, data, partner, field):
-        if field not in ['debit', 'credit', 'debit - credit']:
+    def _get_partner_entries(self, data, partners):
+        """
+        Lazily build the partner dictionaries printed by the template:
+        {'partner', 'debit', 'credit', 'balance', 'move_lines'}. The lines of
+        every partner come from one query ordered by partner, whose running
+        `progress` balance and partner totals are computed by window
+        functions, streamed from a server-side cursor.
+        """
+        if not partners:
             return
-        result = 0.0
         query_get_data = self.env['account.move.line'].with_context(data['form'].get('used_context', {}))._query_get()
-        reconcile_clause = "" if data['form']['reconciled'] else ' AND "account_move_line".full_reconcile_id IS NULL '
+        reconcile_clause = self._get_reconcile_clause(data)
+        partner_ids = [partner.id for partner in partners]
+        params = [tuple(partner_ids), tuple(data['computed']['move_state']),
+                  tuple(data['computed']['account_ids'])] + query_get_data[2] + [partner_ids]
+        query = PARTNER_LEDGER_QUERY.format(
+            tables=query_get_data[0], where=query_get_data[1], reconcile=reconcile_clause)
+        rows = self.env['account.ledger.engine']._stream(query, params)
+        currency = self.env['res.currency']
+        positions = {partner_id: index for index, partner_id in enumerate(partner_ids)}
+        state = {'row': next(rows, None)}
 
-        params = [partner.id, tuple(data['computed']['move_state']), tuple(data['computed']['account_ids'])] + query_get_data[2]
-        query = """SELECT sum(""" + field + """)
-                FROM """ + query_get_data[0] + """, account_move AS m
-                WHERE "account_move_line".partner_id = %s
-                    AND m.id = "account_move_line".move_id
-                    AND m.state IN %s
-                    AND account_id IN %s
-                    AND """ + query_get_data[1] + reconcile_clause
-        self.env.cr.execute(query, tuple(params))
+        def partner_lines(partner_id):
+            while state['row'] is not None and state['row']['partner_id'] == partner_id:
+                r = state['row']
+                state['row'] = next(rows, None)
+                r['displayed_name'] = '-'.join(
+                    r[field_name] for field_name in ('move_name', 'ref', 'name')
+                    if r[field_name] not in (None, '', '/')
+                )
+                r['currency_id'] = currency.browse(r.get('currency_id'))
+                yield r
 
-        contemp = self.env.cr.fetchone()
-        if contemp is not None:
-            result = contemp[0] or 0.0
-        return result
+        for index, partner in enumerate(partners):
+            # Skip the lines the template did not consume for a previous partner
+            while state['row'] is not None and positions[state['row']['partner_id']] < index:
+                state['row'] = next(rows, None)
+            first = state['row']
+            has_lines = first is not None and first['partner_id'] == partner.id
+            debit = first['partner_debit'] if has_lines else 0.0
+            credit = first['partner_credit'] if has_lines else 0.0
+            yield {
+                'partner': partner,
+                'debit': debit,
+                'credit': credit,
+                'balance': debit - credit,
+                'move_lines': partner_lines(partner.id) if has_lines else [],
+            }
 
     @api.model
     def _get_report_values(self, docids, data=None):
@@ -93,7 +123,7 @@ class ReportPartnerLedger(models.AbstractModel):
             AND NOT a.deprecated""", (tuple(data['computed']['ACCOUNT_TYPE']),))
         data['computed']['account_ids'] = [a for (a,) in self.env.cr.fetchall()]
         params = [tuple(data['computed']['move_state']), tuple(data['computed']['account_ids'])] + query_get_data[2]
-        reconcile_clause = "" if data['form']['reconciled'] else ' AND "account_move_line".full_reconcile_id IS NULL '
+        reconcile_clause = self._get_reconcile_clause(data)
         query = """
             SELECT DISTINCT "account_move_line".partner_id
             FROM """ + query_get_data[0] + """, account_account AS account, account_move AS am
@@ -119,6 +149,5 @@ class ReportPartnerLedger(models.AbstractModel):
             'data': data,
             'docs': partners,
             'time': time,
-            'lines': self._lines,
-            'sum_partner': self._sum_partner,
+            'partner_entries': self._get_partner_entries(data, partners),
         }
@@ -17,6 +17,9 @@ class ReportTrialBalance(models.AbstractModel):
         context = {
             'date_to': self.env.context['date_from'],
         }
+        balances = self.env['account.balance.snapshot']._get_balances(accounts.ids, context)
+        if balances is not None:
+            return balances
         tables, where_clause, where_params = self.env['account.move.line'].with_context(context)._query_get()
         tables = tables.replace('"', '') if tables else 'account_move_line'
 
@@ -35,7 +38,7 @@ class ReportTrialBalance(models.AbstractModel):
             initial_balance[row.pop('id')] = row
         return initial_balance
 
-    def _get_accounts(self, accounts, display_account):
+    def _get_accounts(self, accounts, display_account, periods=None):
         """ compute the balance, debit and credit for the provided accounts
             :Arguments:
                 `accounts`: list of accounts record,
@@ -46,28 +49,36 @@ class ReportTrialBalance(models.AbstractModel):
                 `credit`: total amount of credit,
                 `debit`: total amount of debit,
                 `balance`: total amount of balance,
+                `balances`: balance of each of the `periods`, when given,
         """
 
-        account_result = {}
-        # Prepare sql query base on selected parameters from wizard
-        tables, where_clause, where_params = self.env['account.move.line']._query_get()
-        tables = tables.replace('"','')
-        if not tables:
-            tables = 'account_move_line'
-        wheres = [""]
-        if where_clause.strip():
-            wheres.append(where_clause.strip())
-        filters = " AND ".join(wheres)
-        # compute the balance, debit and credit for the provided accounts
-        request = ("SELECT account_id AS id, SUM(debit) AS debit, SUM(credit) AS credit, "
-                   "(SUM(debit) - SUM(credit)) AS balance" +\
-                   " FROM " + tables + " WHERE account_id IN %s " + filters + " GROUP BY account_id")
-        params = (tuple(accounts.ids),) + tuple(where_params)
-        self.env.cr.execute(request, params)
-        for row in self.env.cr.dictfetchall():
-            account_result[row.pop('id')] = row
+        # Whole months come from the balance snapshot when the filters allow it
+        account_result = self.env['account.balance.snapshot']._get_balances(
+            accounts.ids, self.env.context)
+        if account_result is None:
+            account_result = {}
+            # Prepare sql query base on selected parameters from wizard
+            tables, where_clause, where_params = self.env['account.move.line']._query_get()
+            tables = tables.replace('"','')
+            if not tables:
+                tables = 'account_move_line'
+            wheres = [""]
+            if where_clause.strip():
+                wheres.append(where_clause.strip())
+            filters = " AND ".join(wheres)
+            # compute the balance, debit and credit for the provided accounts
+            request = ("SELECT account_id AS id, SUM(debit) AS debit, SUM(credit) AS credit, "
+                       "(SUM(debit) - SUM(credit)) AS balance" +\
+                       " FROM " + tables + " WHERE account_id IN %s " + filters + " GROUP BY account_id")
+            params = (tuple(accounts.ids),) + tuple(where_params)
+            self.env.cr.execute(request, params)
+            for row in self.env.cr.dictfetchall():
+                account_result[row.pop('id')] = row
 
         initial_balance = self._get_initial_balance(accounts)
+        period_balances = {}
+        if periods:
+            period_balances = self.env['account.move.line']._get_period_balances(accounts.ids, periods)
         account_res = []
         for account in accounts:
             res = dict((fn, 0.0) for fn in ['credit', 'debit', 'balance'])
@@ -84,6 +95,8 @@ class ReportTrialBalance(models.AbstractModel):
                 res['balance'] = res['initial_balance'] + account_result[account.id].get('balance')
             else:
                 res['balance'] = res['initial_balance']
+            if periods:
+                res['balances'] = period_balances.get(account.id, [0.0] * len(periods))
             if display_account == 'all':
                 account_res.append(res)
             if display_account == 'not_zero' and not currency.is_zero(res['balance']):
@@ -92,6 +105,11 @@ class ReportTrialBalance(models.AbstractModel):
                 account_res.append(res)
         return account_res
 
+    def _get_cache_date_to(self, form):
+        """Last date the report reads, False when it reads the whole ledger."""
+        dates = [form.get('date_to')] + [period['date_to'] for period in form.get('period_columns') or []]
+        return all(dates) and max(str(date) for date in dates)
+
     @api.model
     def _get_report_values(self, docids, data=None):
         if not data.get('form') or not self.env.context.get('active_model'):
@@ -107,7 +125,13 @@ class ReportTrialBalance(models.AbstractModel):
             analytic_account_ids = self.env['account.analytic.account'].browse(data['form'].get('analytic_account_ids'))
             context['analytic_account_ids'] = analytic_account_ids
             analytic_accounts = [account.name for account in analytic_account_ids]
-        account_res = self.with_context(context)._get_accounts(accounts, display_account)
+        account_res = self.env['account.report.cache']._get_or_compute(
+            'trial_balance',
+            dict(data['form'], model=model, account_ids=accounts.ids if model == 'account.account' else []),
+            lambda: self.with_context(context)._get_accounts(
+                accounts, display_account, periods=data['form'].get('period_columns')),
+            date_to=self._get_cache_date_to(data['form']),
+            company_ids=context.get('company_id') and [context['company_id']])
         codes = []
         if data['form'].get('journal_ids', False):
             codes = [journal.code for journal in
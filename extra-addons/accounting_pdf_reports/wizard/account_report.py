@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from odoo import api, fields, models
+from odoo import api, fields, models, _
+from odoo.exceptions import ValidationError
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -31,7 +32,8 @@ class AccountingReport(models.TransientModel):
                                         required=True, default=_get_account_report)
     label_filter = fields.Char(string='Column Label', help="This label will be displayed on report to "
                                                            "show the balance computed for the given comparison filter.")
-    filter_cmp = fields.Selection([('filter_no', 'No Filters'), ('filter_date', 'Date')],
+    filter_cmp = fields.Selection([('filter_no', 'No Filters'), ('filter_date', 'Date'),
+                                   ('filter_periods', 'Periods')],
                                   string='Filter by', required=True, default='filter_no')
     date_from_cmp = fields.Date(string='Date From')
     date_to_cmp = fields.Date(string='Date To')
@@ -41,6 +43,12 @@ class AccountingReport(models.TransientModel):
                                        " Because it is space consuming, we do not allow to"
                                        " use it while doing a comparison.")
 
+    @api.constrains('filter_cmp', 'period_count')
+    def _check_period_count(self):
+        for wizard in self:
+            if wizard.filter_cmp == 'filter_periods' and wizard.period_count < 1:
+                raise ValidationError(_('The comparison by periods needs at least one period.'))
+
     def _build_comparison_context(self, data):
         _logger.info("Building comparison context with data: %s", data)
         try:
@@ -79,6 +87,8 @@ class AccountingReport(models.TransientModel):
         _logger.info("Printing report with data: %s", data)
         try:
             data['form'].update(self.read(['date_from_cmp', 'debit_credit', 'date_to_cmp', 'filter_cmp', 'account_report_id', 'enable_filter', 'label_filter', 'target_move'])[0])
+            if self.enable_filter and self.filter_cmp == 'filter_periods':
+                data['form']['period_columns'] = self._get_period_columns()
             _logger.debug("Updated data for printing: %s", data)
             return self.env.ref('accounting_pdf_reports.action_report_financial').report_action(self, data=data, config=False)
         except Exception as e:
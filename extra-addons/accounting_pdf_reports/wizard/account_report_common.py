@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from dateutil.relativedelta import relativedelta
+
 from odoo import api, fields, models, _
 from odoo.tools.misc import get_lang
 
@@ -21,6 +23,13 @@ class AccountCommonReport(models.TransientModel):
     target_move = fields.Selection([('posted', 'All Posted Entries'),
                                     ('all', 'All Entries'),
                                     ], string='Target Moves', required=True, default='posted')
+    period_count = fields.Integer(string='Number of Periods', default=0,
+                                  help="Number of periods printed side by side, the last one "
+                                       "holding the end date.")
+    period_type = fields.Selection([('month', 'Month'),
+                                    ('quarter', 'Quarter'),
+                                    ('year', 'Year'),
+                                    ], string='Period', required=True, default='month')
 
     @api.onchange('company_id')
     def _onchange_company_id(self):
@@ -40,6 +49,34 @@ class AccountCommonReport(models.TransientModel):
         result['company_id'] = data['form']['company_id'][0] or False
         return result
 
+    def _get_period_columns(self):
+        """
+        The `period_count` consecutive periods ending with the one holding the
+        end date (today by default), oldest first, as {'name', 'date_from',
+        'date_to'}. Without a start date the columns are cumulative balances
+        at the end of each period (date_from False).
+        """
+        self.ensure_one()
+        end = self.date_to or fields.Date.context_today(self)
+        months = {'month': 1, 'quarter': 3, 'year': 12}[self.period_type]
+        start = end.replace(month=end.month - (end.month - 1) % months, day=1)
+        columns = []
+        for index in range(self.period_count):
+            period_start = start - relativedelta(months=months * index)
+            period_end = min(period_start + relativedelta(months=months, days=-1), end)
+            if self.period_type == 'month':
+                name = period_start.strftime('%b %Y')
+            elif self.period_type == 'quarter':
+                name = 'Q%s %s' % ((period_start.month - 1) // 3 + 1, period_start.year)
+            else:
+                name = str(period_start.year)
+            columns.append({
+                'name': name,
+                'date_from': self.date_from and fields.Date.to_string(period_start),
+                'date_to': fields.Date.to_string(period_end),
+            })
+        return columns[::-1]
+
     def _print_report(self, data):
         raise NotImplementedError()
 
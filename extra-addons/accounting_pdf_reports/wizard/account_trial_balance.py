@@ -41,6 +41,8 @@ class AccountBalanceReport(models.TransientModel):
 
         try:
             records, data = self._get_report_data(data)
+            if self.period_count > 0:
+                data['form']['period_columns'] = self._get_period_columns()
             _logger.info("Records for report generation: %s", records)
             return self.env.ref('accounting_pdf_reports.action_report_trial_balance').report_action(records, data=data)
         except Exception as e:
@@ -2,12 +2,12 @@
     'name': 'Payslip Timesheet Integration',
     'version': '1.0',
     'summary': 'Display Timesheets in Payslip Attendance Records',
-    'description': 'Automatically fetch and display timesheets in the attendance section of payslips.',
+    'description': 'Payslip attendance lines, their approval and timesheet details are provided by '
+                   'employee_payroll_attendance; this module is kept as an empty shell so existing '
+                   'databases can upgrade without uninstalling it.',
     'author': 'nguyenthuongg',
     'depends': ['employee_payroll_attendance', 'hr_timesheet','hr_attendance'],
-    'data': [
-        'views/hr_payslip_views.xml',
-    ],
+    'data': [],
     'installable': True,
     'application': False,
     'license': 'LGPL-3',
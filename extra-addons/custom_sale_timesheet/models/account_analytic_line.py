@@ -1,7 +1,10 @@
 from odoo import models, fields, api, _
-from odoo.exceptions import ValidationError
+from odoo.exceptions import AccessError, ValidationError
 from datetime import timedelta
 
+# Maximum hours an employee can log on a single day
+MAX_DAILY_HOURS = 12
+
 
 class AccountAnalyticLine(models.Model):
     _inherit = 'account.analytic.line'
@@ -21,14 +24,11 @@ class AccountAnalyticLine(models.Model):
         """
         # Kiểm tra giá trị ngày
         if self.date:
-            today_date = fields.Date.context_today(self)
-            yesterday_date = today_date - timedelta(days=1)
-            # Nếu ngày không phải hôm qua hoặc hôm nay
-            if self.date not in [today_date, yesterday_date]:
+            if self.date not in self._timesheet_allowed_dates():
                 # Kiểm tra nếu người dùng không phải Admin
                 if not self._is_timesheet_admin():
                     # Đặt lại ngày về hôm nay
-                    self.update({'date': today_date})  # Reset giá trị
+                    self.update({'date': fields.Date.context_today(self)})  # Reset giá trị
                     return {
                         'warning': {
                             'title': _("Invalid Date"),
@@ -36,17 +36,17 @@ class AccountAnalyticLine(models.Model):
                         }
                     }
 
-        # Kiểm tra tổng số giờ trong ngày (chỉ kiểm tra nếu unit_amount > 0)
-        if self.date and self.unit_amount > 0:
-            # Kiểm tra nếu bản ghi hiện tại đã được lưu
-            domain = [('date', '=', self.date)]
-            if self.id:  # Chỉ thêm điều kiện 'id != self.id' nếu bản ghi đã được lưu
-                domain.append(('id', '!=', self.id))
+        # Kiểm tra tổng số giờ trong ngày của nhân viên (chỉ kiểm tra nếu unit_amount > 0)
+        if self.date and self.unit_amount > 0 and self.employee_id:
+            # Same lines as the daily cap of submit_timesheet_grid
+            domain = self._daily_hours_domain(self.employee_id, self.date, self.date)
+            if self._origin.id:  # Chỉ thêm điều kiện 'id != self.id' nếu bản ghi đã được lưu
+                domain.append(('id', '!=', self._origin.id))
 
-            # Tính tổng số giờ đã nhập
-            total_hours = sum(self.search(domain).mapped('unit_amount')) + self.unit_amount
+            # Tính tổng số giờ đã nhập (một truy vấn SUM)
+            total_hours = self._sum_unit_amount(domain) + self.unit_amount
 
-            if total_hours > 12:
+            if total_hours > MAX_DAILY_HOURS:
                 self.update({'unit_amount': 0})  # Reset lại giờ của bản ghi hiện tại
                 return {
                     'warning': {
@@ -60,3 +60,142 @@ class AccountAnalyticLine(models.Model):
         Kiểm tra nếu người dùng thuộc nhóm Admin của Timesheets hoặc Quản trị viên.
         """
         return self.env.user.has_group('hr_timesheet.group_timesheet_manager') or self.env.user.has_group('base.group_system')
+
+    @api.model
+    def _timesheet_allowed_dates(self):
+        """Ngày mà nhân viên (không phải Admin) được phép nhập: hôm nay và hôm qua."""
+        today_date = fields.Date.context_today(self)
+        return {today_date, today_date - timedelta(days=1)}
+
+    @api.model
+    def _daily_hours_domain(self, employee, date_from, date_to):
+        """Lines counted in the daily cap: every line of the employee on those days."""
+        return [
+            ('employee_id', '=', employee.id),
+            ('date', '>=', date_from),
+            ('date', '<=', date_to),
+        ]
+
+    @api.model
+    def _sum_unit_amount(self, domain):
+        data = self.read_group(domain, ['unit_amount:sum'], [])
+        return (data[0]['unit_amount'] or 0.0) if data else 0.0
+
+    @api.model
+    def submit_timesheet_grid(self, week_start, cells, employee_id=None):
+        """
+        Bulk submission of a weekly timesheet grid.
+
+        :param week_start: first day of the week (date or 'YYYY-MM-DD')
+        :param cells: list of {'project_id', 'task_id', 'date', 'hours', 'name'};
+            each cell holds the total hours of a (project, task, day) and
+            optionally its description (kept as is when omitted). A cell with
+            0 hours removes the matching lines.
+        :param employee_id: employee of the grid, defaults to the current user's
+        :return: {'created', 'updated', 'deleted', 'day_totals'}
+
+        The whole grid is validated against the week's aggregates before any
+        line is touched, then the lines are created, updated and deleted in
+        batch.
+        """
+        is_admin = self._is_timesheet_admin()
+        employee = self.env['hr.employee'].browse(employee_id) if employee_id else self.env.user.employee_id
+        if not employee:
+            raise ValidationError(_("No employee is linked to the current user."))
+        if employee.user_id != self.env.user and not is_admin:
+            raise AccessError(_("You can only submit your own timesheets."))
+
+        week_start = fields.Date.to_date(week_start)
+        week_end = week_start + timedelta(days=6)
+
+        # Normalize the grid: one value per (project, task, day)
+        grid = {}
+        for cell in cells:
+            if not cell.get('project_id') or not cell.get('date'):
+                raise ValidationError(_("Every timesheet cell needs a project and a date."))
+            try:
+                day = fields.Date.to_date(cell['date'])
+            except ValueError:
+                raise ValidationError(_("Invalid timesheet date: %s") % cell['date'])
+            if not week_start <= day <= week_end:
+                raise ValidationError(_("%s is outside the submitted week.") % day)
+            hours = float(cell.get('hours') or 0.0)
+            if hours < 0:
+                raise ValidationError(_("Hours cannot be negative (%s).") % day)
+            key = (cell['project_id'], cell.get('task_id') or False, day)
+            grid[key] = (hours, cell.get('name') or None)
+
+        # Existing lines of the week, read once. The daily totals count every
+        # line of the employee, like the onchange; only project lines are cells.
+        existing = self.search(self._daily_hours_domain(employee, week_start, week_end))
+        lines_by_key = {}
+        day_totals = {}
+        for line in existing:
+            day_totals[line.date] = day_totals.get(line.date, 0.0) + line.unit_amount
+            if not line.project_id:
+                continue
+            key = (line.project_id.id, line.task_id.id or False, line.date)
+            lines_by_key.setdefault(key, self.browse())
+            lines_by_key[key] |= line
+
+        # A cell changes when its hours or its description differ
+        changed = {}
+        for key, (hours, name) in grid.items():
+            lines = lines_by_key.get(key, self.browse())
+            if hours != sum(lines.mapped('unit_amount')) or (
+                    name is not None and lines and name != lines[0].name):
+                changed[key] = (hours, name)
+
+        # Validate date rules and daily caps against the resulting totals
+        if not is_admin:
+            allowed = self._timesheet_allowed_dates()
+            forbidden = sorted({key[2] for key in changed if key[2] not in allowed})
+            if forbidden:
+                raise ValidationError(_(
+                    "You can only log time for today or yesterday. Rejected days: %s"
+                ) % ", ".join(str(day) for day in forbidden))
+        for key, (hours, _name) in changed.items():
+            current = sum(lines_by_key.get(key, self.browse()).mapped('unit_amount'))
+            day_totals[key[2]] = day_totals.get(key[2], 0.0) - current + hours
+        over = sorted(day for day, total in day_totals.items() if total > MAX_DAILY_HOURS)
+        if over:
+            raise ValidationError(_(
+                "The total hours exceed %s hours on: %s"
+            ) % (MAX_DAILY_HOURS, ", ".join(str(day) for day in over)))
+
+        # Apply in batch: cells sharing the same values are written together
+        to_create = []
+        to_delete = self.browse()
+        to_update = {}
+        for key, (hours, name) in changed.items():
+            project_id, task_id, day = key
+            lines = lines_by_key.get(key, self.browse())
+            if not hours:
+                to_delete |= lines
+            elif not lines:
+                to_create.append({
+                    'employee_id': employee.id,
+                    'project_id': project_id,
+                    'task_id': task_id,
+                    'date': day,
+                    'unit_amount': hours,
+                    'name': name or '/',
+                })
+            else:
+                to_update[(hours, name)] = to_update.get((hours, name), self.browse()) | lines[0]
+                to_delete |= lines[1:]
+        for (hours, name), lines in to_update.items():
+            vals = {'unit_amount': hours}
+            if name is not None:
+                vals['name'] = name
+            lines.write(vals)
+        updated = sum(len(lines) for lines in to_update.values())
+        created = self.create(to_create) if to_create else self.browse()
+        deleted = len(to_delete)
+        to_delete.unlink()
+        return {
+            'created': len(created),
+            'updated': updated,
+            'deleted': deleted,
+            'day_totals': {str(day): total for day, total in sorted(day_totals.items())},
+        }
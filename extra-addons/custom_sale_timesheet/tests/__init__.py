@@ -0,0 +1 @@
+from . import test_timesheet_grid
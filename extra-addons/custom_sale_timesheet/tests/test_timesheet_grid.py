@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.exceptions import ValidationError
+from odoo.tests import TransactionCase, new_test_user, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestTimesheetGrid(TransactionCase):
+    """Weekly grid submission of submit_timesheet_grid."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = new_test_user(
+            cls.env, login='grid_user',
+            groups='base.group_user,hr_timesheet.group_hr_timesheet_user')
+        cls.employee = cls.env['hr.employee'].create({
+            'name': 'Grid Employee',
+            'user_id': cls.user.id,
+        })
+        cls.project = cls.env['project.project'].create({
+            'name': 'Grid Project',
+            'allow_timesheets': True,
+        })
+        cls.other_project = cls.env['project.project'].create({
+            'name': 'Grid Other Project',
+            'allow_timesheets': True,
+        })
+        cls.today = fields.Date.context_today(cls.env['account.analytic.line'])
+        # The week starts yesterday, the first day employees may still log
+        cls.week_start = cls.today - timedelta(days=1)
+
+    def _submit(self, cells, week_start=None):
+        return self.env['account.analytic.line'].with_user(self.user).submit_timesheet_grid(
+            week_start or self.week_start, cells)
+
+    def _cell(self, hours, name=None, project=None, day=None):
+        cell = {
+            'project_id': (project or self.project).id,
+            'date': day or self.today,
+            'hours': hours,
+        }
+        if name is not None:
+            cell['name'] = name
+        return cell
+
+    def _lines(self):
+        return self.env['account.analytic.line'].search([
+            ('employee_id', '=', self.employee.id),
+            ('project_id', '=', self.project.id),
+        ])
+
+    def test_create(self):
+        result = self._submit([self._cell(3.0, 'Design')])
+        self.assertEqual(result['created'], 1)
+        line = self._lines()
+        self.assertEqual((line.unit_amount, line.name, line.date), (3.0, 'Design', self.today))
+        self.assertEqual(result['day_totals'][str(self.today)], 3.0)
+
+    def test_update_hours_and_description(self):
+        self._submit([self._cell(3.0, 'Design')])
+        # Same hours, new description: still an update
+        result = self._submit([self._cell(3.0, 'Review')])
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(self._lines().name, 'Review')
+        # New hours without a description keep the current one
+        result = self._submit([self._cell(5.0)])
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual((self._lines().unit_amount, self._lines().name), (5.0, 'Review'))
+        # An unchanged cell is not written
+        result = self._submit([self._cell(5.0, 'Review')])
+        self.assertEqual((result['created'], result['updated'], result['deleted']), (0, 0, 0))
+
+    def test_delete(self):
+        self._submit([self._cell(3.0, 'Design')])
+        result = self._submit([self._cell(0.0)])
+        self.assertEqual(result['deleted'], 1)
+        self.assertFalse(self._lines())
+
+    def test_daily_cap(self):
+        self._submit([self._cell(10.0, 'Design', project=self.other_project)])
+        with self.assertRaises(ValidationError):
+            self._submit([self._cell(3.0, 'Design')])
+        self.assertFalse(self._lines())
+        # Moving hours between projects of the same day stays under the cap
+        result = self._submit([
+            self._cell(8.0, 'Design', project=self.other_project),
+            self._cell(4.0, 'Design'),
+        ])
+        self.assertEqual(result['day_totals'][str(self.today)], 12.0)
+
+    def test_forbidden_date(self):
+        week_start = self.today - timedelta(days=5)
+        with self.assertRaises(ValidationError):
+            self._submit([self._cell(2.0, 'Late', day=week_start)], week_start=week_start)
+        self.assertFalse(self._lines())
+        # Outside of the submitted week
+        with self.assertRaises(ValidationError):
+            self._submit([self._cell(2.0, 'Design', day=self.today + timedelta(days=7))])
@@ -12,6 +12,7 @@
         "base",
         "hr_timesheet",
         "sale_management",
+        "custom_sale_timesheet",
     ],
     "assets": {
         "web.assets_backend": [
@@ -30,6 +31,17 @@
         "views/hr_payslip_views_update.xml",
         "views/menu_reporting.xml",
         "views/custom_module_sale.xml",
+        "views/hr_payslip_summary_views.xml",
+        "data/hr_payslip_summary_data.xml",
+        "data/hr_payslip_allowance_data.xml",
+        "views/hr_payroll_run_views.xml",
+        "data/hr_payroll_run_data.xml",
+        "data/hr_payslip_freeze_data.xml",
+        "views/hr_attendance_anomaly_views.xml",
+        "data/hr_attendance_anomaly_data.xml",
+        "views/hr_labour_cost_views.xml",
+        "data/hr_labour_cost_data.xml",
+        "views/hr_payroll_payment_batch_views.xml",
         # "data/update_rate_fallback_auto.xml",
     ],
     "installable": True,
@@ -9,3 +9,9 @@ from . import custom_duration_timeoff
 
 from . import auto_generate_payslip
 from . import update_rate_fallback
+from . import hr_payslip_summary
+from . import hr_payroll_run
+from . import hr_payroll_simulation
+from . import hr_attendance_anomaly
+from . import hr_labour_cost
+from . import hr_payroll_payment_batch
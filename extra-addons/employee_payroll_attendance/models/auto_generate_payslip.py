@@ -10,25 +10,22 @@ _logger = logging.getLogger(__name__)
 class HrAttendance(models.Model):
     _inherit = "hr.attendance"
 
-    @api.model
-    def create(self, vals):
-        record = super().create(vals)
-
-        if not record:
-            return record
-
+    def _ensure_current_month_payslips(self):
+        """
+        Make sure the employees of these attendances have a payslip for the
+        current month, duplicating last month's payslip when there is one.
+        Syncing the attendances into the payslips is left to the lifecycle
+        pipeline (`hr.attendance._sync_payslips`).
+        """
         today = fields.Date.today()
         first_day_current_month = today.replace(day=1)
         last_day_current_month = (
             first_day_current_month + relativedelta(months=1)
         ) - timedelta(days=1)
 
-        employee = record.employee_id
-
-        existing_payslip = (
-            self.env["hr.payslip"]
-            .with_user(SUPERUSER_ID)
-            .search(
+        Payslip = self.env["hr.payslip"].with_user(SUPERUSER_ID)
+        for employee in self.employee_id:
+            existing_payslip = Payslip.search(
                 [
                     ("employee_id", "=", employee.id),
                     ("date_from", "=", first_day_current_month),
@@ -36,27 +33,11 @@ class HrAttendance(models.Model):
                 ],
                 limit=1,
             )
-        )
+            if existing_payslip:
+                continue
 
-        if existing_payslip:
-            if existing_payslip.status != "done":
-                existing_payslip._auto_update_attendance_records()
-                existing_payslip._onchange_salary_fields()
-                existing_payslip._onchange_bonus_vnd()
-                _logger.info(
-                    f"Attendances updated for existing payslip {existing_payslip.id} (Employee: {employee.name})"
-                )
-            else:
-                _logger.info(
-                    f"Payslip {existing_payslip.id} already finalized. No update applied."
-                )
-            return record
-
-        # Nếu chưa có payslip, thì thực hiện tạo mới từ tháng trước
-        payslip_last_month = (
-            self.env["hr.payslip"]
-            .with_user(SUPERUSER_ID)
-            .search(
+            # Nếu chưa có payslip, thì thực hiện tạo mới từ tháng trước
+            payslip_last_month = Payslip.search(
                 [
                     ("employee_id", "=", employee.id),
                     (
@@ -68,49 +49,49 @@ class HrAttendance(models.Model):
                 ],
                 limit=1,
             )
-        )
 
-        if payslip_last_month:
             try:
-                new_payslip = payslip_last_month.copy(
-                    {
-                        "date_from": first_day_current_month,
-                        "date_to": last_day_current_month,
-                        "currency_rate_fallback": payslip_last_month.currency_rate_fallback,
-                    }
-                )
-                new_payslip._auto_update_attendance_records()
-                new_payslip._onchange_salary_fields()
-                new_payslip._onchange_bonus_vnd()
-                _logger.info(
-                    f"Payslip duplicated successfully for Employee: {employee.name}"
-                )
+                with self.env.cr.savepoint():
+                    new_payslip = self._create_current_month_payslip(
+                        employee,
+                        payslip_last_month,
+                        first_day_current_month,
+                        last_day_current_month,
+                    )
+                new_payslip._enqueue_pipeline(recompute=True)
             except Exception as e:
                 _logger.error(
-                    f"Error duplicating payslip for Employee ID {employee.id}: {str(e)}"
+                    f"Error creating payslip for Employee ID {employee.id}: {str(e)}"
                 )
+
+    def _create_current_month_payslip(
+        self, employee, payslip_last_month, date_from, date_to
+    ):
+        Payslip = self.env["hr.payslip"].with_user(SUPERUSER_ID)
+        if payslip_last_month:
+            new_payslip = payslip_last_month.copy(
+                {
+                    "date_from": date_from,
+                    "date_to": date_to,
+                    "currency_rate_fallback": payslip_last_month.currency_rate_fallback,
+                }
+            )
+            _logger.info(
+                f"Payslip duplicated successfully for Employee: {employee.name}"
+            )
         else:
             # Create brand new payslip if last month payslip not found
-            try:
-                new_payslip = self.env["hr.payslip"].create(
-                    {
-                        "employee_id": employee.id,
-                        "date_from": first_day_current_month,
-                        "date_to": last_day_current_month,
-                    }
-                )
-                new_payslip._auto_update_attendance_records()
-                new_payslip._onchange_salary_fields()
-                new_payslip._onchange_bonus_vnd()
-                _logger.info(
-                    f"New payslip created successfully for Employee: {employee.name}"
-                )
-            except Exception as e:
-                _logger.error(
-                    f"Error creating new payslip for Employee ID {employee.id}: {str(e)}"
-                )
-
-        return record
+            new_payslip = Payslip.create(
+                {
+                    "employee_id": employee.id,
+                    "date_from": date_from,
+                    "date_to": date_to,
+                }
+            )
+            _logger.info(
+                f"New payslip created successfully for Employee: {employee.name}"
+            )
+        return new_payslip
 
 
 class HrPayslip(models.Model):
@@ -192,40 +173,8 @@ class HrPayslip(models.Model):
         # Tạo payslip mới với quyền Superuser
         new_payslip = self.with_user(SUPERUSER_ID).copy(copy_values)
 
-        # Xóa danh sách chấm công cũ
-        new_payslip.attendance_line_ids.unlink()
-
-        # Lấy danh sách chấm công phù hợp với tháng mới
-        attendances = (
-            self.env["hr.attendance"]
-            .with_user(SUPERUSER_ID)
-            .search(
-                [
-                    ("employee_id", "=", self.employee_id.id),
-                    ("check_in", ">=", new_start_date),
-                    ("check_out", "<=", new_end_date),
-                ]
-            )
-        )
-
-        # Thêm chấm công vào phiếu lương mới
-        new_payslip.attendance_line_ids = [
-            (
-                0,
-                0,
-                {
-                    "attendance_id": att.id,
-                    "check_in": att.check_in,
-                    "check_out": att.check_out,
-                    "worked_hours": att.worked_hours,
-                    "approved": False,
-                },
-            )
-            for att in attendances
-        ]
-
+        # Attendance lines of the new month are synced by hr.payslip.create
         # Cập nhật lại thông tin lương và thưởng
-        new_payslip._auto_update_attendance_records()
         new_payslip._onchange_salary_fields()
         new_payslip._onchange_bonus_vnd()
 
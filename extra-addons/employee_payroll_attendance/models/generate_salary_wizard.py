@@ -1,5 +1,5 @@
-from odoo import models, fields, api
-from datetime import datetime
+from odoo import models, fields, api, SUPERUSER_ID
+from datetime import datetime, timedelta
 
 
 class GenerateSalaryWizard(models.TransientModel):
@@ -12,8 +12,13 @@ class GenerateSalaryWizard(models.TransientModel):
         required=True,
     )
     year = fields.Integer(string="Year", default=datetime.now().year, required=True)
+    shard_size = fields.Integer(
+        string="Employees per Job",
+        default=50,
+        help="Number of employees computed by each background job of a payroll run.",
+    )
 
-    def generate_salaries(self):
+    def _get_period(self):
         # Get selected month and year
         month = int(self.month)
         year = self.year
@@ -23,13 +28,69 @@ class GenerateSalaryWizard(models.TransientModel):
             if month < 12
             else datetime(year, 12, 31)
         )
+        return date_from.date(), date_to.date()
+
+    def generate_salaries(self):
+        date_from, date_to = self._get_period()
 
         # Fetch all employees
         employees = self.env["hr.employee"].search([])
+        self.env["hr.payslip"]._generate_period_payslips(employees, date_from, date_to)
+
+        return {"type": "ir.actions.client", "tag": "reload"}
+
+    def action_generate_in_background(self):
+        """Split the employees into shards computed by parallel cron workers."""
+        self.ensure_one()
+        date_from, date_to = self._get_period()
+        run = self.env["hr.payroll.run"].create(
+            {
+                "date_from": date_from,
+                "date_to": date_to,
+                "shard_size": self.shard_size or 50,
+            }
+        )
+        run.action_launch()
+        return {
+            "type": "ir.actions.act_window",
+            "res_model": "hr.payroll.run",
+            "view_mode": "form",
+            "res_id": run.id,
+        }
+
+
+class HrPayslip(models.Model):
+    _inherit = "hr.payslip"
+
+    @api.model
+    def _generate_period_payslips(self, employees, date_from, date_to):
+        """
+        Create the payslips of `employees` for the period, starting from each
+        employee's previous salary, and auto-approve attendances that have a
+        matching timesheet. Used by the wizard and by payroll run shards.
 
+        Idempotent: employees already having a payslip for the period are
+        skipped, so a shard reclaimed from a slow worker does not create
+        duplicates (the `employee_period_uniq` constraint rejects a payslip
+        created concurrently). Returns the payslips of the period.
+        """
+        payslips = (
+            self.with_user(SUPERUSER_ID)
+            .search(
+                [
+                    ("employee_id", "in", employees.ids),
+                    ("date_from", "=", date_from),
+                    ("date_to", "=", date_to),
+                ]
+            )
+            .with_env(self.env)
+        )
+        existing_employee_ids = set(payslips.employee_id.ids)
         for employee in employees:
+            if employee.id in existing_employee_ids:
+                continue
             # Get the previous month's payslip if it exists
-            prev_payslip = self.env["hr.payslip"].search(
+            prev_payslip = self.search(
                 [
                     ("employee_id", "=", employee.id),
                     ("date_from", "<", date_from),
@@ -43,7 +104,7 @@ class GenerateSalaryWizard(models.TransientModel):
             prev_salary = prev_payslip.total_salary if prev_payslip else 0.0
 
             # Create new payslip for the selected month
-            new_payslip = self.env["hr.payslip"].create(
+            payslips |= self.create(
                 {
                     "employee_id": employee.id,
                     "date_from": date_from,
@@ -53,23 +114,33 @@ class GenerateSalaryWizard(models.TransientModel):
                 }
             )
 
-            # Auto-approve attendance records matching the timesheet
-            attendances = self.env["hr.attendance"].search(
-                [
-                    ("employee_id", "=", employee.id),
-                    ("check_in", ">=", date_from),
-                    ("check_out", "<=", date_to),
-                ]
+        # Auto-approve attendance records matching the timesheet: one search
+        # for the attendances and one query for the days having a timesheet
+        attendances = self.env["hr.attendance"].search(
+            [
+                ("employee_id", "in", employees.ids),
+                ("check_in", ">=", date_from),
+                ("check_out", "<=", date_to),
+            ]
+        )
+        if attendances:
+            self.env["account.analytic.line"].flush_model(["employee_id", "date"])
+            self.env.cr.execute(
+                """
+                SELECT DISTINCT employee_id, date
+                  FROM account_analytic_line
+                 WHERE employee_id IN %s
+                   AND date BETWEEN %s AND %s
+                """,
+                # Local work dates may fall one day around the UTC period
+                (
+                    tuple(employees.ids),
+                    date_from - timedelta(days=1),
+                    date_to + timedelta(days=1),
+                ),
             )
-            for attendance in attendances:
-                # Check if there is a matching timesheet record
-                timesheet = self.env["account.analytic.line"].search(
-                    [
-                        ("employee_id", "=", employee.id),
-                        ("date", "=", attendance.check_in.date()),
-                    ]
-                )
-                if timesheet:
-                    attendance.approved = True
-
-        return {"type": "ir.actions.client", "tag": "reload"}
+            timesheet_days = set(self.env.cr.fetchall())
+            attendances.filtered(
+                lambda a: (a.employee_id.id, a._get_work_date()) in timesheet_days
+            ).write({"approved": True})
+        return payslips
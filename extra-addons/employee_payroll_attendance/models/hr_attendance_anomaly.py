@@ -0,0 +1,196 @@
+from odoo import api, fields, models
+from dateutil.relativedelta import relativedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Maximum approved hours in a single work day before it is flagged
+MAX_DAILY_HOURS = 12
+# An open attendance older than this is considered a forgotten check-out
+MISSING_CHECKOUT_HOURS = 16
+
+# One windowed pass over the attendances of the period, joined with the
+# timesheet day totals. Each attendance is unpivoted into the anomalies it
+# carries; day-level anomalies are reported on the first attendance of the day.
+ANOMALY_SCAN_QUERY = """
+    WITH att AS (
+        SELECT a.id,
+               a.employee_id,
+               a.check_in,
+               a.check_out,
+               COALESCE(a.worked_hours, 0) AS worked_hours,
+               (a.check_in AT TIME ZONE 'UTC'
+                           AT TIME ZONE COALESCE(r.tz, 'UTC'))::date AS work_date
+          FROM hr_attendance a
+          JOIN hr_employee e ON e.id = a.employee_id
+     LEFT JOIN resource_resource r ON r.id = e.resource_id
+         WHERE a.check_in >= %(date_from)s
+           AND a.check_in < %(date_stop)s
+           {where}
+    ), timesheet AS (
+        SELECT employee_id, date, SUM(unit_amount) AS hours
+          FROM account_analytic_line
+         WHERE employee_id IS NOT NULL
+           AND date BETWEEN %(date_from)s AND %(date_stop)s
+      GROUP BY employee_id, date
+    ), scan AS (
+        SELECT att.*,
+               MAX(att.check_out) OVER (
+                   PARTITION BY att.employee_id
+                   ORDER BY att.check_in, att.id
+                   ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+               ) AS previous_check_out,
+               SUM(att.worked_hours) OVER (
+                   PARTITION BY att.employee_id, att.work_date
+               ) AS day_hours,
+               ROW_NUMBER() OVER (
+                   PARTITION BY att.employee_id, att.work_date
+                   ORDER BY att.check_in, att.id
+               ) AS day_rank,
+               COALESCE(ts.hours, 0) AS timesheet_hours
+          FROM att
+     LEFT JOIN timesheet ts
+            ON ts.employee_id = att.employee_id AND ts.date = att.work_date
+    )
+    INSERT INTO hr_attendance_anomaly (
+        attendance_id, employee_id, work_date, anomaly_type,
+        worked_hours, day_hours, timesheet_hours, state, scan_date
+    )
+    SELECT s.id, s.employee_id, s.work_date, v.anomaly_type,
+           s.worked_hours, s.day_hours, s.timesheet_hours, 'open',
+           now() AT TIME ZONE 'UTC'
+      FROM scan s
+CROSS JOIN LATERAL (VALUES
+           ('missing_checkout',
+            s.check_out IS NULL
+            AND s.check_in < (now() AT TIME ZONE 'UTC')
+                             - make_interval(hours => %(missing_hours)s)),
+           ('overlap', s.previous_check_out > s.check_in),
+           ('over_12h', s.day_rank = 1 AND s.day_hours > %(max_hours)s),
+           ('no_timesheet',
+            s.day_rank = 1 AND s.check_out IS NOT NULL AND s.timesheet_hours = 0)
+       ) AS v(anomaly_type, flagged)
+     WHERE v.flagged
+        ON CONFLICT (attendance_id, anomaly_type) DO UPDATE SET
+           work_date = EXCLUDED.work_date,
+           worked_hours = EXCLUDED.worked_hours,
+           day_hours = EXCLUDED.day_hours,
+           timesheet_hours = EXCLUDED.timesheet_hours,
+           scan_date = EXCLUDED.scan_date
+ RETURNING id
+"""
+
+
+class HrAttendanceAnomaly(models.Model):
+    """
+    Review queue of attendance exceptions. Rows are produced by `_scan`, so
+    approvers only work the flagged attendances instead of every payslip line.
+    """
+
+    _name = "hr.attendance.anomaly"
+    _description = "Attendance Anomaly"
+    _order = "work_date desc, employee_id, anomaly_type"
+    _log_access = False
+
+    attendance_id = fields.Many2one(
+        "hr.attendance",
+        string="Attendance",
+        required=True,
+        ondelete="cascade",
+        readonly=True,
+    )
+    employee_id = fields.Many2one(
+        "hr.employee", string="Employee", readonly=True, index=True
+    )
+    work_date = fields.Date(string="Work Date", readonly=True, index=True)
+    anomaly_type = fields.Selection(
+        [
+            ("missing_checkout", "Missing Check-out"),
+            ("overlap", "Overlapping Attendance"),
+            ("over_12h", "Day over 12 Hours"),
+            ("no_timesheet", "No Timesheet"),
+        ],
+        string="Anomaly",
+        required=True,
+        readonly=True,
+    )
+    worked_hours = fields.Float(string="Worked Hours", readonly=True)
+    day_hours = fields.Float(string="Day Total Hours", readonly=True)
+    timesheet_hours = fields.Float(string="Timesheet Hours", readonly=True)
+    state = fields.Selection(
+        [("open", "To Review"), ("resolved", "Resolved"), ("ignored", "Ignored")],
+        string="Status",
+        default="open",
+        required=True,
+        index=True,
+    )
+    scan_date = fields.Datetime(string="Last Scan", readonly=True)
+    reviewed_by = fields.Many2one("res.users", string="Reviewed By", readonly=True)
+    check_in = fields.Datetime(related="attendance_id.check_in", string="Check In")
+    check_out = fields.Datetime(related="attendance_id.check_out", string="Check Out")
+
+    _sql_constraints = [
+        (
+            "attendance_type_uniq",
+            "unique(attendance_id, anomaly_type)",
+            "An attendance can only be flagged once per anomaly type.",
+        ),
+    ]
+
+    @api.model
+    def _scan(self, date_from, date_to, employee_ids=None):
+        """
+        Flag the anomalies of the period in one SQL pass. Open rows of the
+        period that are no longer flagged were fixed in the meantime and are
+        dropped; reviewed rows are kept as they are.
+        """
+        self.env.flush_all()
+        where = ""
+        params = {
+            "date_from": date_from,
+            "date_stop": date_to + relativedelta(days=1),
+            "max_hours": MAX_DAILY_HOURS,
+            "missing_hours": MISSING_CHECKOUT_HOURS,
+        }
+        if employee_ids:
+            where = "AND a.employee_id IN %(employee_ids)s"
+            params["employee_ids"] = tuple(employee_ids)
+        self.env.cr.execute(ANOMALY_SCAN_QUERY.format(where=where), params)
+        flagged_ids = [row[0] for row in self.env.cr.fetchall()]
+
+        stale_domain = [
+            ("state", "=", "open"),
+            ("work_date", ">=", date_from),
+            ("work_date", "<=", date_to),
+            ("id", "not in", flagged_ids),
+        ]
+        if employee_ids:
+            stale_domain.append(("employee_id", "in", list(employee_ids)))
+        self.search(stale_domain).unlink()
+        self.invalidate_model()
+        _logger.info(
+            f"Attendance anomaly scan {date_from} - {date_to}: {len(flagged_ids)} flagged"
+        )
+        return self.browse(flagged_ids)
+
+    @api.model
+    def _cron_scan_anomalies(self):
+        """Scan the current and the previous month."""
+        today = fields.Date.context_today(self)
+        date_from = today.replace(day=1) - relativedelta(months=1)
+        self._scan(date_from, today)
+
+    @api.model
+    def action_scan_current_month(self):
+        today = fields.Date.context_today(self)
+        self._scan(today.replace(day=1), today)
+        return {"type": "ir.actions.client", "tag": "reload"}
+
+    def action_resolve(self):
+        self.write({"state": "resolved", "reviewed_by": self.env.user.id})
+
+    def action_ignore(self):
+        self.write({"state": "ignored", "reviewed_by": self.env.user.id})
+
+    def action_reopen(self):
+        self.write({"state": "open", "reviewed_by": False})
@@ -1,19 +1,26 @@
-from odoo import api, fields, models
+from odoo import api, fields, models, SUPERUSER_ID
 import logging
+from collections import defaultdict
 from datetime import timedelta
 from odoo.exceptions import UserError, AccessError
-import requests
-
-try:
-    from forex_python.converter import CurrencyRates
-except ImportError:
-    CurrencyRates = None
-    logging.error(
-        "The forex-python library is not installed. Please install it using 'pip install forex-python'."
-    )
 
 _logger = logging.getLogger(__name__)
 
+# Payslip statuses whose figures are frozen into an immutable snapshot
+FINALIZED_STATES = ("transfer_payment", "done")
+# Stored computed figures captured by the snapshot of a finalized payslip
+SNAPSHOT_FIELDS = (
+    "worked_hours",
+    "total_salary",
+    "converted_salary_vnd",
+    "probation_hours",
+    "probation_salary",
+    "total_working_days",
+    "total_working_hours",
+    "approved_working_days",
+    "approved_working_hours",
+)
+
 
 class HrPayslip(models.Model):
     _name = "hr.payslip"
@@ -87,6 +94,12 @@ class HrPayslip(models.Model):
     attendance_line_ids = fields.One2many(
         "hr.payslip.attendance", "payslip_id", string="Attendance Records", copy=False
     )
+    attendance_line_count = fields.Integer(
+        string="Attendances", compute="_compute_attendance_line_count"
+    )
+    approved_line_count = fields.Integer(
+        string="Approved Attendances", compute="_compute_attendance_line_count"
+    )
 
     # Additional fields for allowances and bonuses
     insurance = fields.Float(string="Insurance (USD)", default=0.0)
@@ -101,16 +114,18 @@ class HrPayslip(models.Model):
 
     # New fields for additional information
     total_working_days = fields.Integer(
-        string="Total Working Days", compute="_compute_additional_fields"
+        string="Total Working Days", compute="_compute_working_calendar", store=True
     )
     total_working_hours = fields.Float(
-        string="Total Working Hours", compute="_compute_additional_fields"
+        string="Total Working Hours", compute="_compute_working_calendar", store=True
     )
     approved_working_days = fields.Float(
-        string="Approved Working Days", compute="_compute_additional_fields"
+        string="Approved Working Days", compute="_compute_approved_working", store=True
     )
     approved_working_hours = fields.Float(
-        string="Approved Working Hours", compute="_compute_additional_fields"
+        string="Approved Working Hours",
+        compute="_compute_approved_working",
+        store=True,
     )
 
     vendor_bill_id = fields.Many2one(
@@ -130,6 +145,11 @@ class HrPayslip(models.Model):
         string="Salary (Probation)", compute="_compute_total_salary", store=True
     )
 
+    # Snapshot of the computed figures taken when the payslip is finalized
+    is_frozen = fields.Boolean(string="Frozen", readonly=True, copy=False, index=True)
+    frozen_date = fields.Datetime(string="Frozen On", readonly=True, copy=False)
+    snapshot_values = fields.Json(string="Snapshot", readonly=True, copy=False)
+
     @api.onchange("is_hourly_usd")
     def _onchange_is_hourly_usd(self):
         """Bật is_vnd nếu is_hourly = True"""
@@ -151,23 +171,41 @@ class HrPayslip(models.Model):
             self.is_hourly_vnd = False
             self.is_hourly_usd = False
 
+    _sql_constraints = [
+        (
+            "employee_period_uniq",
+            "unique(employee_id, date_from, date_to)",
+            "An employee can only have one payslip per period.",
+        ),
+    ]
+
+    @api.model
+    def _get_own_payslip_domain(self, prefix=""):
+        """
+        Restriction applied to regular users, who only see their own payslips.
+        `prefix` is the path to the payslip from another model (e.g.
+        "payslip_id."), for grouped queries which bypass `search`.
+        """
+        if self.env.user.has_group("base.group_system"):
+            return []
+        return [(f"{prefix}employee_id.user_id", "=", self.env.user.id)]
+
     @api.model
     def search(self, args, offset=0, limit=None, order=None, count=False):
-        # Check if the user is an admin
-        if not self.env.user.has_group("base.group_system"):
-            # Restrict access for regular users to their own records
-            args = args or []
-            args += [("employee_id.user_id", "=", self.env.user.id)]
+        # Restrict access for regular users to their own records
+        args = (args or []) + self._get_own_payslip_domain()
         # Call the original search method
         return super(HrPayslip, self).search(args, offset, limit, order, count)
 
-    @api.depends("total_salary", "currency_rate_fallback", "wage", "hourly_rate")
+    @api.depends(
+        "total_salary", "currency_rate_fallback", "wage", "hourly_rate", "is_frozen"
+    )
     def _compute_converted_salary_vnd(self):
         """
         Computes the salary in VND based on the total salary in USD using the fallback rate.
         Updates Monthly Wage (VND) if the wage field changes.
         """
-        for payslip in self:
+        for payslip in self._apply_snapshot(["converted_salary_vnd"]):
             fallback_rate = payslip.currency_rate_fallback
 
             # Compute converted salary in VND
@@ -187,19 +225,72 @@ class HrPayslip(models.Model):
 
     @api.depends("employee_id", "date_from", "date_to")
     def _compute_attendance_ids(self):
+        payslips = self.filtered(lambda p: p.employee_id and p.date_from and p.date_to)
+        attendances = self.env["hr.attendance"]
+        if payslips:
+            # One search covering every payslip, split per payslip below
+            attendances = attendances.search(
+                [
+                    ("employee_id", "in", payslips.employee_id.ids),
+                    ("check_in", ">=", min(payslips.mapped("date_from"))),
+                    ("check_out", "<=", max(payslips.mapped("date_to"))),
+                ]
+            )
         for payslip in self:
-            if payslip.employee_id and payslip.date_from and payslip.date_to:
-                attendances = self.env["hr.attendance"].search(
-                    [
-                        ("employee_id", "=", payslip.employee_id.id),
-                        ("check_in", ">=", payslip.date_from),
-                        ("check_out", "<=", payslip.date_to),
-                    ]
+            if payslip in payslips:
+                payslip.attendance_ids = attendances.filtered(
+                    lambda a: a.employee_id == payslip.employee_id
+                    and a.check_in >= fields.Datetime.to_datetime(payslip.date_from)
+                    and a.check_out <= fields.Datetime.to_datetime(payslip.date_to)
                 )
-                payslip.attendance_ids = attendances
             else:
                 payslip.attendance_ids = False
 
+    def _compute_attendance_line_count(self):
+        data = self.env["hr.payslip.attendance"].read_group(
+            [("payslip_id", "in", self._origin.ids)]
+            + self._get_own_payslip_domain(prefix="payslip_id."),
+            ["payslip_id", "approved"],
+            ["payslip_id", "approved"],
+            lazy=False,
+        )
+        counts = {}
+        for row in data:
+            counts[(row["payslip_id"][0], row["approved"])] = row["__count"]
+        for payslip in self:
+            payslip_id = payslip._origin.id
+            approved = counts.get((payslip_id, True), 0)
+            payslip.approved_line_count = approved
+            payslip.attendance_line_count = approved + counts.get(
+                (payslip_id, False), 0
+            )
+
+    def action_view_attendance_lines(self):
+        """
+        Open the attendance lines of the payslip in a server-paginated list,
+        only the approved ones with the `approved_only` context key.
+        """
+        self.ensure_one()
+        domain = [("payslip_id", "=", self.id)]
+        if self.env.context.get("approved_only"):
+            domain.append(("approved", "=", True))
+        return {
+            "type": "ir.actions.act_window",
+            "name": "Attendance Records",
+            "res_model": "hr.payslip.attendance",
+            "view_mode": "tree",
+            "views": [
+                (
+                    self.env.ref(
+                        "employee_payroll_attendance.view_hr_payslip_attendance_tree"
+                    ).id,
+                    "tree",
+                )
+            ],
+            "domain": domain,
+            "context": {"default_payslip_id": self.id, "create": False},
+        }
+
     def _compute_salary_fields(self):
         """Tính toán đồng bộ tất cả các trường lương (USD/VND, Giờ/Tháng) dựa trên rate_lock_field."""
         for payslip in self:
@@ -269,14 +360,14 @@ class HrPayslip(models.Model):
         else:
             self.wage = 0.0
 
-    @api.depends("attendance_line_ids.approved", "attendance_line_ids.worked_hours")
+    # Approvals are folded by `_refresh_approval_totals`, not by the dependency
+    # graph, so approving an attendance line never writes the payslip row
+    @api.depends("is_frozen")
     def _compute_worked_hours(self):
-        for payslip in self:
-            total_hours = sum(
-                attendance.worked_hours
-                for attendance in payslip.attendance_line_ids
-                if attendance.approved
-            )
+        live = self._apply_snapshot(["worked_hours"])
+        hours_by_day = live._approved_hours_by_day()
+        for payslip in live:
+            total_hours = sum(hours_by_day[payslip.id].values())
             payslip.worked_hours = total_hours
             _logger.info(
                 f"Total approved worked hours for {payslip.employee_id.name}: {total_hours}"
@@ -294,13 +385,12 @@ class HrPayslip(models.Model):
         "probation_start_date",
         "probation_end_date",
         "hourly_rate",
-        "attendance_line_ids.approved",
-        "attendance_line_ids.worked_hours",
         "insurance",
         "meal_allowance",
         "kpi_bonus",
         "other_bonus",
         "monthly_wage_vnd",
+        "is_frozen",
     )
     @api.onchange(
         "probation_start_date",
@@ -315,7 +405,12 @@ class HrPayslip(models.Model):
         "monthly_wage_vnd",
     )
     def _compute_total_salary(self):
-        for payslip in self:
+        live = self._apply_snapshot(
+            ["total_salary", "probation_hours", "probation_salary"]
+        )
+        hours_by_day = live._approved_hours_by_day()
+        for payslip in live:
+            daily_hours = hours_by_day[payslip.id]
             probation_hours = 0
             normal_hours = 0
             hourly_rate = payslip.hourly_rate
@@ -334,28 +429,23 @@ class HrPayslip(models.Model):
 
                 _logger.info(f"Probation period: {probation_start} to {probation_end}")
 
-                for attendance in payslip.attendance_line_ids:
-                    attendance_date = attendance.check_in.date()
+                for attendance_date, hours in daily_hours.items():
                     if (
-                        probation_start <= attendance_date <= probation_end
-                        and attendance.approved
+                        attendance_date
+                        and probation_start <= attendance_date <= probation_end
                     ):
-                        probation_hours += attendance.worked_hours
+                        probation_hours += hours
                         _logger.info(
-                            f"Approved hours in probation period on {attendance_date}: {attendance.worked_hours}"
+                            f"Approved hours in probation period on {attendance_date}: {hours}"
                         )
-                    elif attendance.approved:
-                        normal_hours += attendance.worked_hours
+                    else:
+                        normal_hours += hours
                         _logger.info(
-                            f"Approved hours outside probation period on {attendance_date}: {attendance.worked_hours}"
+                            f"Approved hours outside probation period on {attendance_date}: {hours}"
                         )
             else:
                 # If no probation period, all approved hours are treated as normal hours
-                normal_hours = sum(
-                    attendance.worked_hours
-                    for attendance in payslip.attendance_line_ids
-                    if attendance.approved
-                )
+                normal_hours = sum(daily_hours.values())
                 _logger.info(
                     f"No probation period defined. All approved hours treated as normal: {normal_hours} hours."
                 )
@@ -558,83 +648,144 @@ class HrPayslip(models.Model):
         """
         self._compute_total_salary()
 
-    @api.onchange("date_from", "date_to", "include_saturdays", "attendance_line_ids")
-    def _compute_additional_fields(self):
-        for payslip in self:
-            if payslip.date_from and payslip.date_to:
-                _logger.info(
-                    f"Starting computation for payslip {payslip.id} (Employee: {payslip.employee_id.name})"
-                )
-                # Counter for weekdays (Monday-Friday)
-                weekdays_count = 0
-                # Counter for Saturday
-                saturday_count = 0
-
-                # Iterate through all days in the range date_from -> date_to
-                date_diff = (payslip.date_to - payslip.date_from).days + 1
-                for n in range(date_diff):
-                    current_date = payslip.date_from + timedelta(days=n)
-                    weekday_index = current_date.weekday()
-                    # Monday to Friday corresponds to weekday_index = 0..4
-                    if 0 <= weekday_index < 5:
-                        weekdays_count += 1
-                    # Saturday is weekday_index = 5
-                    elif weekday_index == 5:
-                        saturday_count += 1
-
-                # Calculate hours for weekdays (8 hours/day)
-                weekday_hours = weekdays_count * 8
-
-                # If checkbox include_saturdays = True, calculate up to 2 Saturdays (6.5 hours/day)
-                if payslip.include_saturdays:
-                    saturdays_to_count = min(saturday_count, 2)
-                    saturday_hours = saturdays_to_count * 8
-                else:
-                    saturdays_to_count = 0
-                    saturday_hours = 0
-
-                # Total working days
-                working_days = weekdays_count + saturdays_to_count
-                # Total working hours
-                total_working_hours = weekday_hours + saturday_hours
-
-                # Calculate Approved Days/Hours (unchanged from previous logic)
-                # approved_days = len(
-                #     {
-                #         att.attendance_id.check_in.date()
-                #         for att in payslip.attendance_line_ids
-                #         if att.approved
-                #     }
-                # )
-                approved_hours = sum(
-                    att.worked_hours
-                    for att in payslip.attendance_line_ids
-                    if att.approved
-                )
-
-                approved_days = approved_hours / 8
-
-                # Assign results to fields
-                payslip.total_working_days = working_days
-                payslip.total_working_hours = total_working_hours
-                payslip.approved_working_days = approved_days
-                payslip.approved_working_hours = approved_hours
-
-                _logger.info(
-                    f"Payslip {payslip.id}: Total Working Days = {working_days}, "
-                    f"Total Working Hours = {total_working_hours}, Approved Days = {approved_days}, "
-                    f"Approved Hours = {approved_hours}"
-                )
-            else:
+    @staticmethod
+    def _count_weekdays(date_from, date_to):
+        """
+        Count the weekdays (Monday-Friday) and Saturdays between two dates,
+        both included, without walking the range day by day.
+        """
+        total_days = (date_to - date_from).days + 1
+        if total_days <= 0:
+            return 0, 0
+        full_weeks, remainder = divmod(total_days, 7)
+        weekdays_count = full_weeks * 5
+        saturday_count = full_weeks
+        start_weekday = date_from.weekday()
+        for n in range(remainder):
+            weekday_index = (start_weekday + n) % 7
+            # Monday to Friday corresponds to weekday_index = 0..4
+            if weekday_index < 5:
+                weekdays_count += 1
+            # Saturday is weekday_index = 5
+            elif weekday_index == 5:
+                saturday_count += 1
+        return weekdays_count, saturday_count
+
+    @api.depends("date_from", "date_to", "include_saturdays", "is_frozen")
+    def _compute_working_calendar(self):
+        """Expected working days/hours of the period; only period edits recompute it."""
+        for payslip in self._apply_snapshot(
+            ["total_working_days", "total_working_hours"]
+        ):
+            if not payslip.date_from or not payslip.date_to:
                 # If date_from or date_to is missing
                 payslip.total_working_days = 0
                 payslip.total_working_hours = 0.0
-                payslip.approved_working_days = 0
-                payslip.approved_working_hours = 0.0
+                continue
 
-                _logger.warning(
-                    f"Payslip {payslip.id} is missing date_from or date_to. Default values applied."
-                )
+            weekdays_count, saturday_count = self._count_weekdays(
+                payslip.date_from, payslip.date_to
+            )
+
+            # If checkbox include_saturdays = True, count up to 2 Saturdays (8 hours/day)
+            saturdays_to_count = (
+                min(saturday_count, 2) if payslip.include_saturdays else 0
+            )
+
+            payslip.total_working_days = weekdays_count + saturdays_to_count
+            payslip.total_working_hours = (weekdays_count + saturdays_to_count) * 8
+
+    @api.depends("is_frozen")
+    def _compute_approved_working(self):
+        """
+        Approved days/hours, refreshed when approvals are folded: right after
+        `toggle_approval`, or by the fold cron when the payslip was busy.
+        """
+        live = self._apply_snapshot(
+            ["approved_working_days", "approved_working_hours"]
+        )
+        hours_by_day = live._approved_hours_by_day()
+        for payslip in live:
+            approved_hours = sum(hours_by_day[payslip.id].values())
+            payslip.approved_working_hours = approved_hours
+            payslip.approved_working_days = approved_hours / 8
+
+    def _approved_hours_by_day(self):
+        """
+        Approved worked hours of each payslip per local work date, summed by a
+        single grouped query on the stored line columns. Payslips not saved yet
+        (onchange) are summed from their cached lines instead.
+        """
+        hours = {payslip.id: defaultdict(float) for payslip in self}
+        stored = self.filtered(lambda p: p.id)
+        if stored:
+            self.env["hr.payslip.attendance"].flush_model(
+                ["payslip_id", "approved", "worked_hours", "work_date"]
+            )
+            self.env.cr.execute(
+                """
+                SELECT payslip_id, work_date, SUM(worked_hours)
+                  FROM hr_payslip_attendance
+                 WHERE approved AND payslip_id IN %s
+              GROUP BY payslip_id, work_date
+                """,
+                (tuple(stored.ids),),
+            )
+            for payslip_id, work_date, total in self.env.cr.fetchall():
+                hours[payslip_id][work_date] += total or 0.0
+        for payslip in self - stored:
+            for line in payslip.attendance_line_ids.filtered("approved"):
+                hours[payslip.id][line.work_date] += line.worked_hours
+        return hours
+
+    def _apply_snapshot(self, field_names):
+        """
+        Assign the snapshot values of frozen payslips to `field_names` and
+        return the payslips that still have to be computed.
+        """
+        frozen = self.filtered("is_frozen")
+        for payslip in frozen:
+            snapshot = payslip.snapshot_values or {}
+            for name in field_names:
+                payslip[name] = snapshot.get(name, 0)
+        return self - frozen
+
+    def _freeze(self):
+        """
+        Capture the computed figures of finalized payslips. From then on their
+        computes return the snapshot, so attendance edits, approvals and rate
+        changes can neither cost a recompute nor change historic payroll.
+        """
+        to_freeze = self.filtered(lambda p: not p.is_frozen)
+        # Pending approval deltas must land before the figures are captured
+        to_freeze._fold_allowance_deltas()
+        for payslip in to_freeze:
+            snapshot = {name: payslip[name] for name in SNAPSHOT_FIELDS}
+            payslip.write(
+                {
+                    "is_frozen": True,
+                    "frozen_date": fields.Datetime.now(),
+                    "snapshot_values": snapshot,
+                }
+            )
+            _logger.info(f"Payslip {payslip.id} frozen with snapshot {snapshot}")
+
+    def _unfreeze(self):
+        """Release the snapshot when a finalized payslip is reverted."""
+        frozen = self.filtered("is_frozen")
+        if frozen:
+            frozen.write(
+                {"is_frozen": False, "frozen_date": False, "snapshot_values": False}
+            )
+            _logger.info(f"Payslips {frozen.ids} unfrozen")
+
+    @api.model
+    def _freeze_finalized_payslips(self):
+        """Freeze finalized payslips created before snapshots existed."""
+        payslips = self.with_user(SUPERUSER_ID).search(
+            [("status", "in", FINALIZED_STATES), ("is_frozen", "=", False)]
+        )
+        payslips._freeze()
 
     def _update_report_status(self):
         for payslip in self:
@@ -653,6 +804,7 @@ class HrPayslip(models.Model):
                 )
 
     def generate_payslip(self):
+        self._fold_allowance_deltas()
         for payslip in self:
             payslip.status = "generated"
             payslip._update_report_status()
@@ -712,6 +864,7 @@ class HrPayslip(models.Model):
         """
         Set the payslip status to 'employee_confirm' and create a vendor bill.
         """
+        self._fold_allowance_deltas()
         for payslip in self:
             if payslip.status == "generated":
                 payslip.status = "employee_confirm"
@@ -727,12 +880,11 @@ class HrPayslip(models.Model):
         """
         Logic for transferring payment. Restrict access for non-admin users.
         """
-        for payslip in self:
-            # Kiểm tra nếu user không thuộc nhóm admin
-            if not self.env.user.has_group("base.group_system"):
-                raise AccessError("You do not have permission to perform this action.")
-            # Thực hiện logic chuyển khoản
-            payslip.status = "transfer_payment"
+        # Kiểm tra nếu user không thuộc nhóm admin
+        if not self.env.user.has_group("base.group_system"):
+            raise AccessError("You do not have permission to perform this action.")
+        # Thực hiện logic chuyển khoản
+        self.write({"status": "transfer_payment"})
 
     def action_done(self):
         """
@@ -835,6 +987,68 @@ class HrPayslip(models.Model):
                     )
             payslip.combined_records = combined_lines
 
+    @api.model
+    def _get_vendor_bill_accounts(self):
+        """Salary expense (630000) and accounts payable (211000) accounts."""
+        salary_expense_account = self.env["account.account"].search(
+            [("code", "=", "630000")], limit=1
+        )
+        if not salary_expense_account:
+            _logger.error("Salary expense account (code: 630000) not found.")
+            raise UserError(
+                "The Salary Expenses account (code: 630000) is not found in the system. Please configure it before proceeding."
+            )
+        accounts_payable_account = self.env["account.account"].search(
+            [("code", "=", "211000")], limit=1
+        )
+        if not accounts_payable_account:
+            _logger.error("Accounts payable account (code: 211000) not found.")
+            raise UserError(
+                "The Accounts Payable account (code: 211000) is not found in the system. Please configure it before proceeding."
+            )
+        return salary_expense_account, accounts_payable_account
+
+    def _prepare_vendor_bill_vals(
+        self, salary_expense_account, accounts_payable_account
+    ):
+        """Values of the vendor bill paying this payslip to the employee."""
+        self.ensure_one()
+        # Generate a unique reference for the bill
+        employee_firstname = self.employee_id.name.split(" ")[0]
+        bill_ref = f"SALARY/{fields.Date.today()}/{employee_firstname}"
+        return {
+            "move_type": "in_invoice",
+            "partner_id": self.employee_id.sudo().address_home_id.id,
+            "invoice_date": fields.Date.today(),
+            "ref": bill_ref,  # Use ref instead of name to avoid sequence conflicts
+            "invoice_line_ids": [
+                (
+                    0,
+                    0,
+                    {
+                        "name": f"Salary for {self.date_from} to {self.date_to}",
+                        "quantity": 1,
+                        "price_unit": self.total_salary,
+                        "account_id": salary_expense_account.id,
+                        "debit": self.total_salary,
+                        "credit": 0.0,  # Debit entry for salary expense
+                    },
+                ),
+                (
+                    0,
+                    0,
+                    {
+                        "name": f"Payable for {self.date_from} to {self.date_to}",
+                        "quantity": 1,
+                        "price_unit": -self.total_salary,
+                        "account_id": accounts_payable_account.id,
+                        "debit": 0.0,
+                        "credit": self.total_salary,  # Credit entry for accounts payable
+                    },
+                ),
+            ],
+        }
+
     def action_create_vendor_bill(self):
         for payslip in self:
             _logger.info(
@@ -874,72 +1088,14 @@ class HrPayslip(models.Model):
                 }
 
             try:
-                # Find the salary expense account
-                _logger.info("Searching for salary expense account (code: 630000)...")
-                salary_expense_account = self.env["account.account"].search(
-                    [("code", "=", "630000")], limit=1
-                )
-                if not salary_expense_account:
-                    _logger.error("Salary expense account (code: 630000) not found.")
-                    raise UserError(
-                        "The Salary Expenses account (code: 630000) is not found in the system. Please configure it before proceeding."
-                    )
-                _logger.info(
-                    f"Found salary expense account: {salary_expense_account.name} (ID: {salary_expense_account.id})."
-                )
-
-                # Find the accounts payable account
-                _logger.info("Searching for accounts payable account (code: 211000)...")
-                accounts_payable_account = self.env["account.account"].search(
-                    [("code", "=", "211000")], limit=1
-                )
-                if not accounts_payable_account:
-                    _logger.error("Accounts payable account (code: 211000) not found.")
-                    raise UserError(
-                        "The Accounts Payable account (code: 211000) is not found in the system. Please configure it before proceeding."
-                    )
-                _logger.info(
-                    f"Found accounts payable account: {accounts_payable_account.name} (ID: {accounts_payable_account.id})."
+                (
+                    salary_expense_account,
+                    accounts_payable_account,
+                ) = self._get_vendor_bill_accounts()
+                vendor_bill_vals = payslip._prepare_vendor_bill_vals(
+                    salary_expense_account, accounts_payable_account
                 )
-
-                # Generate a unique reference for the bill
-                employee_firstname = payslip.employee_id.name.split(" ")[0]
-                bill_ref = f"SALARY/{fields.Date.today()}/{employee_firstname}"
-                _logger.info(f"Generated bill reference: {bill_ref}")
-
-                # Vendor Bill Creation
-                vendor_bill_vals = {
-                    "move_type": "in_invoice",
-                    "partner_id": payslip.employee_id.address_home_id.id,
-                    "invoice_date": fields.Date.today(),
-                    "ref": bill_ref,  # Use ref instead of name to avoid sequence conflicts
-                    "invoice_line_ids": [
-                        (
-                            0,
-                            0,
-                            {
-                                "name": f"Salary for {payslip.date_from} to {payslip.date_to}",
-                                "quantity": 1,
-                                "price_unit": payslip.total_salary,
-                                "account_id": salary_expense_account.id,
-                                "debit": payslip.total_salary,
-                                "credit": 0.0,  # Debit entry for salary expense
-                            },
-                        ),
-                        (
-                            0,
-                            0,
-                            {
-                                "name": f"Payable for {payslip.date_from} to {payslip.date_to}",
-                                "quantity": 1,
-                                "price_unit": -payslip.total_salary,
-                                "account_id": accounts_payable_account.id,
-                                "debit": 0.0,
-                                "credit": payslip.total_salary,  # Credit entry for accounts payable
-                            },
-                        ),
-                    ],
-                }
+                bill_ref = vendor_bill_vals["ref"]
                 _logger.info(f"Vendor bill values prepared: {vendor_bill_vals}")
 
                 # Create the vendor bill
@@ -980,50 +1136,6 @@ class HrPayslip(models.Model):
                     },
                 }
 
-    @api.model
-    def create(self, vals):
-        # Create the payslip
-        payslip = super(HrPayslip, self).create(vals)
-
-        # Retrieve attendance data for the employee
-        employee_id = vals.get("employee_id")
-        if employee_id:
-            attendance_data = self._get_employee_attendance_data(employee_id)
-
-            # Save attendance records into the payslip.attendance model
-            self.env["payslip.attendance"].create_attendance_records(
-                payslip_id=payslip.id,
-                employee_id=employee_id,
-                attendance_data=attendance_data,
-            )
-
-        return payslip
-
-    def _get_employee_attendance_data(self, employee_id):
-        """
-        Retrieve attendance data for the given employee.
-
-        This is a placeholder method. Replace it with actual logic to fetch attendance records.
-
-        :param employee_id: ID of the employee.
-        :return: List of dictionaries with attendance data.
-        """
-        # Example data - replace with actual attendance fetching logic
-        return [
-            {
-                "date": "2023-12-01",
-                "check_in": "2023-12-01 08:30:00",
-                "check_out": "2023-12-01 17:30:00",
-                "approval_status": "yes",
-            },
-            {
-                "date": "2023-12-02",
-                "check_in": "2023-12-02 09:00:00",
-                "check_out": "2023-12-02 18:00:00",
-                "approval_status": "no",
-            },
-        ]
-
 
 class HrPayslipCombinedRecord(models.Model):
     _name = "hr.payslip.combined.record"
@@ -0,0 +1,161 @@
+from odoo import api, fields, models, tools
+from dateutil.relativedelta import relativedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Transaction-local set of (employee_id, month) to refresh (cr.precommit.data)
+LABOUR_COST_KEY = "hr.labour.cost.pending"
+# Timesheet fields feeding the labour cost
+TIMESHEET_COST_FIELDS = {"unit_amount", "date", "employee_id", "project_id", "task_id"}
+# Payslip fields defining the rate applied to the timesheets of its period
+PAYSLIP_RATE_FIELDS = {
+    "hourly_rate",
+    "hourly_rate_vnd",
+    "employee_id",
+    "date_from",
+    "date_to",
+}
+
+
+class HrLabourCost(models.Model):
+    """
+    Labour cost per project/task/employee/month: timesheet hours multiplied by
+    the hourly rates of the payslip covering the timesheet date.
+
+    The table is maintained incrementally: timesheet and payslip rate changes
+    queue their (employee, month) keys, which are recomputed once per
+    transaction with a single set-based statement.
+    """
+
+    _name = "hr.labour.cost"
+    _description = "Project Labour Cost"
+    _order = "month desc, project_id, task_id, employee_id"
+    _log_access = False
+
+    project_id = fields.Many2one("project.project", string="Project", readonly=True)
+    task_id = fields.Many2one("project.task", string="Task", readonly=True)
+    employee_id = fields.Many2one("hr.employee", string="Employee", readonly=True)
+    month = fields.Date(string="Month", readonly=True)
+    payslip_id = fields.Many2one(
+        "hr.payslip", string="Payslip", readonly=True, ondelete="set null"
+    )
+    hours = fields.Float(string="Hours", readonly=True)
+    hourly_rate = fields.Float(
+        string="Hourly Rate (USD)", group_operator="avg", readonly=True
+    )
+    hourly_rate_vnd = fields.Float(
+        string="Hourly Rate (VND)", group_operator="avg", readonly=True
+    )
+    cost = fields.Float(string="Cost (USD)", readonly=True)
+    cost_vnd = fields.Float(string="Cost (VND)", readonly=True)
+
+    def init(self):
+        tools.create_index(
+            self._cr,
+            "hr_labour_cost_employee_month_idx",
+            self._table,
+            ["employee_id", "month"],
+        )
+        tools.create_index(
+            self._cr,
+            "hr_labour_cost_project_month_idx",
+            self._table,
+            ["project_id", "month"],
+        )
+
+    # Timesheet hours priced with the latest payslip covering their date
+    _COST_INSERT = """
+        INSERT INTO hr_labour_cost (
+            project_id, task_id, employee_id, month, payslip_id,
+            hours, hourly_rate, hourly_rate_vnd, cost, cost_vnd
+        )
+        SELECT l.project_id,
+               l.task_id,
+               l.employee_id,
+               date_trunc('month', l.date)::date,
+               r.id,
+               SUM(l.unit_amount),
+               COALESCE(r.hourly_rate, 0),
+               COALESCE(r.hourly_rate_vnd, 0),
+               SUM(l.unit_amount) * COALESCE(r.hourly_rate, 0),
+               SUM(l.unit_amount) * COALESCE(r.hourly_rate_vnd, 0)
+          FROM account_analytic_line l
+     LEFT JOIN LATERAL (
+                SELECT p.id, p.hourly_rate, p.hourly_rate_vnd
+                  FROM hr_payslip p
+                 WHERE p.employee_id = l.employee_id
+                   AND l.date BETWEEN p.date_from AND p.date_to
+              ORDER BY p.date_from DESC, p.id DESC
+                 LIMIT 1
+               ) r ON TRUE
+         WHERE l.project_id IS NOT NULL
+           AND l.employee_id IS NOT NULL
+           {where}
+      GROUP BY l.project_id, l.task_id, l.employee_id,
+               date_trunc('month', l.date), r.id, r.hourly_rate, r.hourly_rate_vnd
+    """
+
+    @api.model
+    def _mark_dirty(self, keys):
+        """Queue (employee_id, month) keys for the end-of-transaction refresh."""
+        keys = {(employee_id, month) for employee_id, month in keys if employee_id}
+        if not keys:
+            return
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get(LABOUR_COST_KEY)
+        if pending is None:
+            pending = precommit.data[LABOUR_COST_KEY] = set()
+            precommit.add(self._flush_dirty)
+        pending |= keys
+
+    @api.model
+    def _mark_timesheets(self, lines):
+        self._mark_dirty(
+            (line.employee_id.id, line.date.replace(day=1))
+            for line in lines
+            if line.date
+        )
+
+    @api.model
+    def _mark_payslips(self, payslips):
+        keys = set()
+        for payslip in payslips:
+            if not payslip.date_from or not payslip.date_to:
+                continue
+            month = payslip.date_from.replace(day=1)
+            while month <= payslip.date_to:
+                keys.add((payslip.employee_id.id, month))
+                month += relativedelta(months=1)
+        self._mark_dirty(keys)
+
+    @api.model
+    def _flush_dirty(self):
+        keys = self.env.cr.precommit.data.pop(LABOUR_COST_KEY, None)
+        if keys:
+            self._refresh(keys)
+
+    @api.model
+    def _refresh(self, keys):
+        """Recompute the rows of the given (employee_id, month) keys."""
+        self.env.flush_all()
+        keys = tuple(keys)
+        self.env.cr.execute(
+            "DELETE FROM hr_labour_cost WHERE (employee_id, month) IN %s", (keys,)
+        )
+        self.env.cr.execute(
+            self._COST_INSERT.format(
+                where="AND (l.employee_id, date_trunc('month', l.date)::date) IN %s"
+            ),
+            (keys,),
+        )
+        self.invalidate_model()
+        _logger.info("Refreshed labour cost for %s employee-months", len(keys))
+
+    @api.model
+    def _rebuild_all(self):
+        """Full rebuild, used on install and by the nightly safety-net cron."""
+        self.env.flush_all()
+        self.env.cr.execute("DELETE FROM hr_labour_cost")
+        self.env.cr.execute(self._COST_INSERT.format(where=""))
+        self.invalidate_model()
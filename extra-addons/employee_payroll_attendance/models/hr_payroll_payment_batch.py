@@ -0,0 +1,179 @@
+from odoo import api, fields, models
+from odoo.exceptions import AccessError, UserError
+from odoo.tools import mute_logger
+import logging
+import psycopg2
+from psycopg2 import errorcodes
+
+_logger = logging.getLogger(__name__)
+
+# Errors meaning the payslips are being (or were just) paid by another batch
+PAYMENT_LOCK_ERRORS = (errorcodes.LOCK_NOT_AVAILABLE, errorcodes.SERIALIZATION_FAILURE)
+
+
+class HrPayrollPaymentBatch(models.Model):
+    """
+    Pays every confirmed payslip of a period in one operation: the vendor
+    bills are posted together, the payments are created and reconciled by a
+    single payment-register pass and the payslips move to Transfer Payment
+    with one write. The batch keeps the audit trail of what was paid.
+    """
+
+    _name = "hr.payroll.payment.batch"
+    _description = "Payroll Payment Batch"
+    _order = "date_from desc, id desc"
+
+    name = fields.Char(string="Name", compute="_compute_name", store=True)
+    date_from = fields.Date(string="Start Date", required=True)
+    date_to = fields.Date(string="End Date", required=True)
+    payment_date = fields.Date(
+        string="Payment Date", required=True, default=fields.Date.context_today
+    )
+    journal_id = fields.Many2one(
+        "account.journal",
+        string="Payment Journal",
+        required=True,
+        domain="[('type', 'in', ('bank', 'cash'))]",
+        default=lambda self: self.env["account.journal"].search(
+            [("type", "=", "bank"), ("company_id", "=", self.env.company.id)], limit=1
+        ),
+    )
+    state = fields.Selection(
+        [("draft", "Draft"), ("done", "Paid")],
+        string="Status",
+        default="draft",
+        required=True,
+    )
+    payslip_ids = fields.Many2many(
+        "hr.payslip", string="Payslips", readonly=True, copy=False
+    )
+    payment_ids = fields.Many2many(
+        "account.payment", string="Payments", readonly=True, copy=False
+    )
+    payslip_count = fields.Integer(string="Payslips Paid", readonly=True)
+    total_amount = fields.Float(string="Total Paid", readonly=True)
+    skipped_note = fields.Text(string="Skipped Payslips", readonly=True)
+    paid_by = fields.Many2one("res.users", string="Paid By", readonly=True)
+    paid_date = fields.Datetime(string="Paid On", readonly=True)
+
+    @api.depends("date_from", "date_to")
+    def _compute_name(self):
+        for batch in self:
+            batch.name = f"Salary Payment {batch.date_from} - {batch.date_to}"
+
+    def _get_payslips_to_pay(self):
+        self.ensure_one()
+        return self.env["hr.payslip"].search(
+            [
+                ("status", "=", "employee_confirm"),
+                ("date_from", ">=", self.date_from),
+                ("date_to", "<=", self.date_to),
+            ]
+        )
+
+    def _lock_payslips(self, payslips):
+        """
+        Lock the payslips without waiting and keep those still confirmed, so
+        two overlapping batches can never pay the same payslip twice.
+        """
+        if not payslips:
+            return payslips
+        try:
+            with mute_logger("odoo.sql_db"), self.env.cr.savepoint(flush=False):
+                self.env.cr.execute(
+                    """
+                    SELECT id FROM hr_payslip
+                     WHERE id IN %s AND status = 'employee_confirm'
+                       FOR UPDATE NOWAIT
+                    """,
+                    (tuple(payslips.ids),),
+                )
+                locked_ids = [row[0] for row in self.env.cr.fetchall()]
+        except psycopg2.OperationalError as e:
+            if e.pgcode not in PAYMENT_LOCK_ERRORS:
+                raise
+            raise UserError(
+                "Some of these payslips are being paid by another payment batch. "
+                "Please try again in a moment."
+            )
+        payslips.invalidate_recordset(["status", "vendor_bill_id"])
+        return payslips.browse(locked_ids)
+
+    def action_pay(self):
+        """Pay all confirmed payslips of the period."""
+        self.ensure_one()
+        if not self.env.user.has_group("base.group_system"):
+            raise AccessError("You do not have permission to perform this action.")
+        if self.state != "draft":
+            raise UserError("This payment batch has already been paid.")
+
+        payslips = self._lock_payslips(self._get_payslips_to_pay())
+        if not payslips:
+            raise UserError("There is no confirmed payslip to pay in this period.")
+        # Bills and the frozen snapshot must both see every pending approval
+        payslips._fold_allowance_deltas()
+
+        # Bills missing from older confirmations are created in one batch
+        no_address = payslips.filtered(
+            lambda p: not p.vendor_bill_id and not p.employee_id.sudo().address_home_id
+        )
+        missing = payslips.filtered(lambda p: not p.vendor_bill_id) - no_address
+        if missing:
+            accounts = self.env["hr.payslip"]._get_vendor_bill_accounts()
+            bills = self.env["account.move"].create(
+                [payslip._prepare_vendor_bill_vals(*accounts) for payslip in missing]
+            )
+            for payslip, bill in zip(missing, bills):
+                payslip.vendor_bill_id = bill
+
+        cancelled = payslips.filtered(
+            lambda p: p.vendor_bill_id and p.vendor_bill_id.state == "cancel"
+        )
+        skipped = no_address | cancelled
+        payslips -= skipped
+        if not payslips:
+            raise UserError("None of the confirmed payslips has a vendor bill to pay.")
+
+        bills = payslips.vendor_bill_id
+        bills.filtered(lambda m: m.state == "draft").action_post()
+        to_pay = bills.filtered(lambda m: m.payment_state not in ("paid", "in_payment"))
+
+        payments = self.env["account.payment"]
+        if to_pay:
+            # One register pass creates one payment per bill and reconciles all
+            register = (
+                self.env["account.payment.register"]
+                .with_context(active_model="account.move", active_ids=to_pay.ids)
+                .create(
+                    {
+                        "payment_date": self.payment_date,
+                        "journal_id": self.journal_id.id,
+                        "group_payment": False,
+                    }
+                )
+            )
+            payments = register._create_payments()
+
+        payslips.write({"status": "transfer_payment"})
+        self.write(
+            {
+                "state": "done",
+                "payslip_ids": [(6, 0, payslips.ids)],
+                "payment_ids": [(6, 0, payments.ids)],
+                "payslip_count": len(payslips),
+                # Bills paid before the batch are part of what the batch settles
+                "total_amount": sum(bills.mapped("amount_total")),
+                "skipped_note": "\n".join(
+                    [f"{p.employee_id.name}: no home address" for p in no_address]
+                    + [f"{p.employee_id.name}: bill cancelled" for p in cancelled]
+                )
+                or False,
+                "paid_by": self.env.user.id,
+                "paid_date": fields.Datetime.now(),
+            }
+        )
+        _logger.info(
+            f"Payment batch {self.id}: paid {len(payslips)} payslips with "
+            f"{len(payments)} payments, skipped {skipped.ids}"
+        )
+        return True
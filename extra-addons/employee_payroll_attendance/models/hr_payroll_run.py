@@ -0,0 +1,290 @@
+from odoo import api, fields, models
+from odoo.exceptions import UserError
+from odoo.tools import mute_logger
+import logging
+import time
+import psycopg2
+from psycopg2 import errorcodes
+
+_logger = logging.getLogger(__name__)
+
+# Worker crons declared in data/hr_payroll_run_data.xml; each one runs in its
+# own cron thread/process, so this is the maximum parallelism of a run.
+WORKER_CRON_XMLIDS = [
+    "employee_payroll_attendance.ir_cron_payroll_run_worker_1",
+    "employee_payroll_attendance.ir_cron_payroll_run_worker_2",
+    "employee_payroll_attendance.ir_cron_payroll_run_worker_3",
+    "employee_payroll_attendance.ir_cron_payroll_run_worker_4",
+]
+# Seconds a worker keeps claiming shards before handing over to a new trigger
+WORKER_TIME_BUDGET = 240
+# Shards stuck in "running" longer than this are considered lost (worker crash)
+SHARD_STALE_MINUTES = 60
+# Errors meaning another worker is finalizing (or just finalized) the same run
+FINALIZE_CONCURRENCY_ERRORS = (
+    errorcodes.SERIALIZATION_FAILURE,
+    errorcodes.DEADLOCK_DETECTED,
+)
+
+
+class HrPayrollRun(models.Model):
+    _name = "hr.payroll.run"
+    _description = "Payroll Run"
+    _order = "date_from desc, id desc"
+
+    name = fields.Char(string="Name", compute="_compute_name", store=True)
+    date_from = fields.Date(string="Start Date", required=True)
+    date_to = fields.Date(string="End Date", required=True)
+    shard_size = fields.Integer(string="Employees per Job", default=50)
+    max_attempts = fields.Integer(string="Max Attempts per Job", default=3)
+    state = fields.Selection(
+        [
+            ("draft", "Draft"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        string="Status",
+        default="draft",
+        required=True,
+    )
+    shard_ids = fields.One2many("hr.payroll.run.shard", "run_id", string="Jobs")
+    shard_count = fields.Integer(string="Jobs", compute="_compute_progress")
+    shard_done_count = fields.Integer(string="Jobs Done", compute="_compute_progress")
+    shard_failed_count = fields.Integer(
+        string="Jobs Failed", compute="_compute_progress"
+    )
+    payslip_count = fields.Integer(string="Payslips", readonly=True)
+    date_start = fields.Datetime(string="Started", readonly=True)
+    date_end = fields.Datetime(string="Finished", readonly=True)
+
+    @api.depends("date_from", "date_to")
+    def _compute_name(self):
+        for run in self:
+            run.name = f"Payroll {run.date_from} - {run.date_to}"
+
+    @api.depends("shard_ids.state")
+    def _compute_progress(self):
+        data = self.env["hr.payroll.run.shard"].read_group(
+            [("run_id", "in", self.ids)],
+            ["run_id", "state"],
+            ["run_id", "state"],
+            lazy=False,
+        )
+        counts = {}
+        for row in data:
+            counts[(row["run_id"][0], row["state"])] = row["__count"]
+        for run in self:
+            states = ("pending", "running", "done", "failed")
+            run.shard_count = sum(counts.get((run.id, s), 0) for s in states)
+            run.shard_done_count = counts.get((run.id, "done"), 0)
+            run.shard_failed_count = counts.get((run.id, "failed"), 0)
+
+    def action_launch(self):
+        """Split the employees into shards and wake up the worker crons."""
+        for run in self:
+            if run.state != "draft":
+                raise UserError("Only draft payroll runs can be launched.")
+            employee_ids = self.env["hr.employee"].search([]).ids
+            size = max(run.shard_size, 1)
+            self.env["hr.payroll.run.shard"].create(
+                [
+                    {
+                        "run_id": run.id,
+                        "sequence": index,
+                        "employee_ids": [(6, 0, employee_ids[start : start + size])],
+                    }
+                    for index, start in enumerate(range(0, len(employee_ids), size))
+                ]
+            )
+            run.write({"state": "running", "date_start": fields.Datetime.now()})
+            _logger.info(
+                "Payroll run %s launched: %s employees in %s shards",
+                run.id,
+                len(employee_ids),
+                len(run.shard_ids),
+            )
+            if not run.shard_ids:
+                run._finalize()
+        self._trigger_workers()
+
+    def action_retry_failed(self):
+        """Requeue the failed shards with a fresh attempt budget."""
+        self.shard_ids.filtered(lambda s: s.state == "failed").write(
+            {"state": "pending", "attempts": 0, "error": False}
+        )
+        self.filtered(lambda r: r.state == "failed").write(
+            {"state": "running", "date_end": False}
+        )
+        self._trigger_workers()
+
+    @api.model
+    def _trigger_workers(self):
+        for xmlid in WORKER_CRON_XMLIDS:
+            cron = self.env.ref(xmlid, raise_if_not_found=False)
+            if cron:
+                cron.sudo()._trigger()
+
+    def _finalize(self):
+        """Close the run once every shard reached a final state."""
+        self.ensure_one()
+        # Serialize the finalization between workers finishing the last shards.
+        # The lock waits rather than skipping: the last finisher must see every
+        # shard final. Failing to lock a run updated concurrently means another
+        # worker already closed it.
+        try:
+            with mute_logger("odoo.sql_db"), self.env.cr.savepoint(flush=False):
+                self.env.cr.execute(
+                    "SELECT id FROM hr_payroll_run WHERE id = %s FOR UPDATE",
+                    (self.id,),
+                )
+        except psycopg2.OperationalError as e:
+            if e.pgcode not in FINALIZE_CONCURRENCY_ERRORS:
+                raise
+            _logger.info("Payroll run %s finalized by another worker", self.id)
+            return False
+        self.env.cr.execute(
+            """
+            SELECT COUNT(*) FILTER (WHERE state IN ('pending', 'running')),
+                   COUNT(*) FILTER (WHERE state = 'failed'),
+                   COALESCE(SUM(payslip_count), 0)
+              FROM hr_payroll_run_shard
+             WHERE run_id = %s
+            """,
+            (self.id,),
+        )
+        open_count, failed_count, payslip_count = self.env.cr.fetchone()
+        if open_count:
+            return False
+        self.write(
+            {
+                "state": "failed" if failed_count else "done",
+                "payslip_count": payslip_count,
+                "date_end": fields.Datetime.now(),
+            }
+        )
+        _logger.info(
+            "Payroll run %s finished: %s payslips, %s failed shards",
+            self.id,
+            payslip_count,
+            failed_count,
+        )
+        return True
+
+    @api.model
+    def _cron_process_shards(self):
+        """
+        Worker loop: claim pending shards one at a time with SKIP LOCKED and
+        compute each in its own transaction. Several worker crons run this
+        concurrently, each in its own process and cursor.
+        """
+        Shard = self.env["hr.payroll.run.shard"]
+        deadline = time.monotonic() + WORKER_TIME_BUDGET
+        while time.monotonic() < deadline:
+            shard = Shard._claim_next()
+            if not shard:
+                return
+            shard._process()
+        # Time budget exhausted with work left: hand over to a fresh trigger
+        self._trigger_workers()
+
+
+class HrPayrollRunShard(models.Model):
+    _name = "hr.payroll.run.shard"
+    _description = "Payroll Run Job"
+    _order = "run_id, sequence"
+
+    run_id = fields.Many2one(
+        "hr.payroll.run",
+        string="Payroll Run",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    sequence = fields.Integer(string="Sequence")
+    employee_ids = fields.Many2many("hr.employee", string="Employees")
+    state = fields.Selection(
+        [
+            ("pending", "Pending"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        string="Status",
+        default="pending",
+        required=True,
+        index=True,
+    )
+    attempts = fields.Integer(string="Attempts", default=0)
+    payslip_count = fields.Integer(string="Payslips", default=0)
+    error = fields.Text(string="Last Error")
+    date_start = fields.Datetime(string="Started")
+    date_end = fields.Datetime(string="Finished")
+
+    @api.model
+    def _claim_next(self):
+        """Take the next pending (or stale running) shard and commit the claim."""
+        self.env.cr.execute(
+            """
+            SELECT s.id
+              FROM hr_payroll_run_shard s
+              JOIN hr_payroll_run r ON r.id = s.run_id
+             WHERE r.state = 'running'
+               AND (s.state = 'pending'
+                    OR (s.state = 'running'
+                        AND s.date_start < (now() at time zone 'UTC')
+                                           - make_interval(mins => %s)))
+          ORDER BY s.run_id, s.sequence
+             LIMIT 1
+               FOR UPDATE OF s SKIP LOCKED
+            """,
+            (SHARD_STALE_MINUTES,),
+        )
+        row = self.env.cr.fetchone()
+        if not row:
+            return self.browse()
+        shard = self.browse(row[0])
+        shard.write(
+            {
+                "state": "running",
+                "attempts": shard.attempts + 1,
+                "date_start": fields.Datetime.now(),
+            }
+        )
+        self.env.cr.commit()
+        return shard
+
+    def _process(self):
+        """Compute the payslips of this shard, retrying it up to max_attempts."""
+        self.ensure_one()
+        run = self.run_id
+        try:
+            payslips = self.env["hr.payslip"]._generate_period_payslips(
+                self.employee_ids, run.date_from, run.date_to
+            )
+            self.write(
+                {
+                    "state": "done",
+                    "payslip_count": len(payslips),
+                    "error": False,
+                    "date_end": fields.Datetime.now(),
+                }
+            )
+            self.env.cr.commit()
+        except Exception as e:
+            self.env.cr.rollback()
+            _logger.exception("Payroll run %s: shard %s failed", run.id, self.id)
+            self.invalidate_recordset()
+            # A reclaimed shard may have been completed by its first worker
+            if self.state != "done":
+                exhausted = self.attempts >= run.max_attempts
+                self.write(
+                    {
+                        "state": "failed" if exhausted else "pending",
+                        "error": str(e),
+                        "date_end": fields.Datetime.now(),
+                    }
+                )
+                self.env.cr.commit()
+        run._finalize()
+        self.env.cr.commit()
@@ -0,0 +1,244 @@
+from odoo import api, models
+from odoo.exceptions import AccessError, UserError
+import logging
+from .hr_payslip import MEAL_ALLOWANCE_VND
+
+_logger = logging.getLogger(__name__)
+
+# Keys accepted in the `overrides` of hr.payroll.simulator.simulate()
+SIMULATION_OVERRIDES = {
+    "currency_rate",  # USD -> VND rate applied to every payslip
+    "hourly_rates",  # {employee_id: hourly rate (USD)}
+    "hourly_rates_vnd",  # {employee_id: hourly rate (VND)}
+    "meal_allowance_per_day_vnd",  # meal allowance per qualifying day
+    "meal_allowance_min_hours",  # approved hours making a day qualify (8)
+    "probation_percentage",  # % of the hourly rate paid during probation
+}
+
+# One pass over the payslips of the period and their approved lines: the
+# daily totals feed both the probation split and the meal allowance days.
+SIMULATION_QUERY = """
+    WITH daily AS (
+        SELECT l.payslip_id, l.work_date, SUM(l.worked_hours) AS hours
+          FROM hr_payslip_attendance l
+          JOIN hr_payslip p ON p.id = l.payslip_id
+         WHERE l.approved
+           AND p.date_from >= %(date_from)s
+           AND p.date_to <= %(date_to)s
+      GROUP BY l.payslip_id, l.work_date
+    ), hours AS (
+        SELECT d.payslip_id,
+               SUM(d.hours) AS approved_hours,
+               SUM(d.hours) FILTER (
+                   WHERE d.work_date BETWEEN p.probation_start_date
+                                         AND p.probation_end_date
+               ) AS probation_hours,
+               COUNT(*) FILTER (WHERE d.hours >= %(min_hours)s) AS meal_days
+          FROM daily d
+          JOIN hr_payslip p ON p.id = d.payslip_id
+      GROUP BY d.payslip_id
+    )
+    SELECT p.id, p.employee_id, p.rate_lock_field, p.currency_rate_fallback,
+           p.wage, p.monthly_wage_vnd, p.hourly_rate, p.hourly_rate_vnd,
+           p.total_working_hours, p.include_saturdays, p.probation_percentage,
+           p.insurance_vnd, p.meal_allowance_vnd, p.kpi_bonus_vnd,
+           p.other_bonus_vnd, p.total_salary, p.converted_salary_vnd,
+           COALESCE(h.approved_hours, 0), COALESCE(h.probation_hours, 0),
+           COALESCE(h.meal_days, 0)
+      FROM hr_payslip p
+ LEFT JOIN hours h ON h.payslip_id = p.id
+     WHERE p.date_from >= %(date_from)s
+       AND p.date_to <= %(date_to)s
+       {where}
+  ORDER BY p.employee_id, p.date_from
+"""
+
+
+class HrPayrollSimulator(models.AbstractModel):
+    """
+    What-if payroll: applies rate, allowance and probation overrides to the
+    payslips of a period in memory and reports the resulting salaries next to
+    the current ones. Nothing is written; the data is read in one query.
+
+    Only the data access is set-based: the salary formula is replayed in
+    Python on the fetched rows (`_simulate_payslip`), without any further
+    query, so the per-payslip overrides and the rate lock rules of
+    `hr.payslip._compute_salary_fields` are not duplicated into SQL. The
+    simulation covers existing payslips only; employees of the population
+    without a payslip in the period are reported in `missing_employee_ids`.
+    """
+
+    _name = "hr.payroll.simulator"
+    _description = "Payroll What-if Simulator"
+
+    @api.model
+    def simulate(
+        self,
+        date_from,
+        date_to,
+        employee_ids=None,
+        overrides=None,
+        include_finalized=False,
+    ):
+        """
+        Simulate the payroll of the period [date_from, date_to].
+
+        :param employee_ids: restrict the population (default: every employee)
+        :param overrides: dict using the keys of SIMULATION_OVERRIDES
+        :param include_finalized: also simulate frozen (paid) payslips
+        :return: {"lines": [per-payslip figures and deltas], "totals": {...},
+                  "missing_employee_ids": [employees without a payslip]}
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise AccessError(
+                "You do not have permission to run payroll simulations."
+            )
+        overrides = dict(overrides or {})
+        unknown = set(overrides) - SIMULATION_OVERRIDES
+        if unknown:
+            raise UserError(
+                "Unknown simulation overrides: %s" % ", ".join(sorted(unknown))
+            )
+        # Employee keys arrive as strings when called over JSON-RPC
+        for key in ("hourly_rates", "hourly_rates_vnd"):
+            if key in overrides:
+                overrides[key] = {int(k): v for k, v in overrides[key].items()}
+        currency_rate = overrides.get("currency_rate")
+        if currency_rate is not None and currency_rate <= 0:
+            raise UserError("The simulated currency rate must be positive.")
+
+        rows = self._fetch_simulation_rows(
+            date_from, date_to, employee_ids, overrides, include_finalized
+        )
+        lines = [self._simulate_payslip(row, overrides) for row in rows]
+        totals = {
+            key: sum(line[key] for line in lines)
+            for key in (
+                "baseline_total_salary",
+                "baseline_converted_salary_vnd",
+                "total_salary",
+                "converted_salary_vnd",
+                "delta_total_salary",
+                "delta_converted_salary_vnd",
+            )
+        }
+        covered_ids = {line["employee_id"] for line in lines}
+        totals["payslip_count"] = len(lines)
+        totals["employee_count"] = len(covered_ids)
+        if employee_ids is not None:
+            missing_ids = sorted(set(employee_ids) - covered_ids)
+        else:
+            missing_ids = (
+                self.env["hr.employee"]
+                .search([("id", "not in", list(covered_ids))])
+                .ids
+            )
+        _logger.info(
+            f"Payroll simulation {date_from} - {date_to} on {len(lines)} payslips "
+            f"with {overrides}: delta {totals['delta_converted_salary_vnd']} VND"
+        )
+        return {
+            "lines": lines,
+            "totals": totals,
+            "missing_employee_ids": missing_ids,
+        }
+
+    @api.model
+    def _fetch_simulation_rows(
+        self, date_from, date_to, employee_ids, overrides, include_finalized
+    ):
+        self.env.flush_all()
+        where = ""
+        params = {
+            "date_from": date_from,
+            "date_to": date_to,
+            "min_hours": overrides.get("meal_allowance_min_hours", 8),
+        }
+        if employee_ids is not None:
+            if not employee_ids:
+                return []
+            where += " AND p.employee_id IN %(employee_ids)s"
+            params["employee_ids"] = tuple(employee_ids)
+        if not include_finalized:
+            where += " AND NOT COALESCE(p.is_frozen, FALSE)"
+        self.env.cr.execute(SIMULATION_QUERY.format(where=where), params)
+        return self.env.cr.fetchall()
+
+    @api.model
+    def _simulate_payslip(self, row, overrides):
+        """Replay the salary formula of hr.payslip on one row of figures."""
+        (
+            payslip_id,
+            employee_id,
+            rate_lock_field,
+            payslip_rate,
+            wage,
+            monthly_wage_vnd,
+            hourly_rate,
+            hourly_rate_vnd,
+            total_working_hours,
+            include_saturdays,
+            probation_percentage,
+            insurance_vnd,
+            meal_allowance_vnd,
+            kpi_bonus_vnd,
+            other_bonus_vnd,
+            baseline_total,
+            baseline_converted,
+            approved_hours,
+            probation_hours,
+            meal_days,
+        ) = row
+        rate = overrides.get("currency_rate") or payslip_rate or 0.0
+
+        # Hourly rate (USD), following the rate lock of _compute_salary_fields
+        if employee_id in overrides.get("hourly_rates_vnd", {}):
+            hourly_rate_vnd = overrides["hourly_rates_vnd"][employee_id]
+            hourly_rate = hourly_rate_vnd / rate if rate else 0.0
+        elif employee_id in overrides.get("hourly_rates", {}):
+            hourly_rate = overrides["hourly_rates"][employee_id]
+        elif rate_lock_field == "hourly_rate_vnd":
+            hourly_rate = (hourly_rate_vnd or 0.0) / rate if rate else 0.0
+        elif rate_lock_field == "wage" and total_working_hours:
+            hourly_rate = (wage or 0.0) / total_working_hours
+        elif rate_lock_field == "monthly_wage_vnd" and total_working_hours and rate:
+            hourly_rate = (monthly_wage_vnd or 0.0) / rate / total_working_hours
+        hourly_rate = hourly_rate or 0.0
+
+        # Meal allowance: re-derived from qualifying days when a rule is given
+        meal_rules = {"meal_allowance_per_day_vnd", "meal_allowance_min_hours"}
+        if meal_rules & set(overrides):
+            per_day = overrides.get("meal_allowance_per_day_vnd", MEAL_ALLOWANCE_VND)
+            meal_allowance_vnd = meal_days * per_day if include_saturdays else 0.0
+
+        percentage = overrides.get(
+            "probation_percentage", probation_percentage or 0.0
+        )
+        probation_salary = probation_hours * hourly_rate * (percentage / 100.0)
+        normal_salary = (approved_hours - probation_hours) * hourly_rate
+        allowances_vnd = (
+            -(insurance_vnd or 0.0)
+            + (meal_allowance_vnd or 0.0)
+            + (kpi_bonus_vnd or 0.0)
+            + (other_bonus_vnd or 0.0)
+        )
+        total_salary = probation_salary + normal_salary
+        if rate:
+            total_salary += allowances_vnd / rate
+        converted_salary_vnd = total_salary * rate
+        return {
+            "payslip_id": payslip_id,
+            "employee_id": employee_id,
+            "currency_rate": rate,
+            "hourly_rate": hourly_rate,
+            "approved_hours": approved_hours,
+            "probation_hours": probation_hours,
+            "meal_allowance_vnd": meal_allowance_vnd or 0.0,
+            "baseline_total_salary": baseline_total or 0.0,
+            "baseline_converted_salary_vnd": baseline_converted or 0.0,
+            "total_salary": total_salary,
+            "converted_salary_vnd": converted_salary_vnd,
+            "delta_total_salary": total_salary - (baseline_total or 0.0),
+            "delta_converted_salary_vnd": converted_salary_vnd
+            - (baseline_converted or 0.0),
+        }
@@ -1,16 +1,53 @@
 from odoo import models, fields, api, SUPERUSER_ID
+from odoo.tools import mute_logger
 import logging
+import psycopg2
+from collections import defaultdict
+import pytz
+from psycopg2 import errorcodes
 from dateutil.relativedelta import relativedelta
 from odoo.exceptions import UserError
+from .hr_attendance_payroll import FINALIZED_STATES
+from .hr_labour_cost import PAYSLIP_RATE_FIELDS
 from datetime import datetime, timedelta
-import requests
-import warnings
-import pandas as pd
-import io
-import base64
 
 _logger = logging.getLogger(__name__)
 
+# Meal allowance granted for each approved day reaching 8 worked hours
+MEAL_ALLOWANCE_VND = 30000
+# Attempts at toggling attendance lines before reporting a concurrent approval
+APPROVAL_RETRIES = 3
+# How long one attempt waits for the lines locked by another reviewer
+APPROVAL_LOCK_TIMEOUT = "500ms"
+# Lock errors an approval attempt can recover from within the transaction
+APPROVAL_RETRY_ERRORS = (errorcodes.LOCK_NOT_AVAILABLE, errorcodes.DEADLOCK_DETECTED)
+# Payslip fields defining which attendances belong to it
+PERIOD_FIELDS = {"employee_id", "date_from", "date_to"}
+# Transaction-local queue of the payslip lifecycle pipeline (cr.precommit.data)
+PIPELINE_KEY = "hr.payslip.pipeline"
+# Inputs of the salary figures, read-only once a payslip is frozen
+FROZEN_FIELDS = PERIOD_FIELDS | {
+    "wage",
+    "monthly_wage_vnd",
+    "hourly_rate",
+    "hourly_rate_vnd",
+    "currency_rate_fallback",
+    "rate_lock_field",
+    "include_saturdays",
+    "probation_start_date",
+    "probation_end_date",
+    "probation_percentage",
+    "insurance",
+    "insurance_vnd",
+    "meal_allowance",
+    "meal_allowance_vnd",
+    "kpi_bonus",
+    "kpi_bonus_vnd",
+    "other_bonus",
+    "other_bonus_vnd",
+    "attendance_line_ids",
+}
+
 
 class HrPayslip(models.Model):
     _inherit = "hr.payslip"
@@ -21,102 +58,6 @@ class HrPayslip(models.Model):
     )
     approved_by = fields.Many2one("res.users", string="Approved By", readonly=True)
 
-    def _compute_total_worked_hours(self):
-        """
-        Calculate total worked hours from approved attendance records.
-        """
-        for payslip in self:
-            total_hours = sum(
-                line.worked_hours
-                for line in payslip.attendance_line_ids
-                if line.approved
-            )
-            payslip.worked_hours = total_hours
-
-    @api.onchange("employee_id", "date_from", "date_to")
-    def _onchange_attendance_records(self):
-        if not self.employee_id or not self.date_from or not self.date_to:
-            return  # Do nothing if any of the fields are missing
-
-        # Get attendance records that match the employee and date range
-        attendances = self.env["hr.attendance"].search(
-            [
-                ("employee_id", "=", self.employee_id.id),
-                ("check_in", ">=", self.date_from),
-                ("check_out", "<=", self.date_to),
-            ]
-        )
-
-        # Find the IDs of attendance records that already exist
-        existing_attendance_ids = set(
-            self.attendance_line_ids.mapped("attendance_id.id")
-        )
-
-        # Remove any records that are no longer in the date range
-        self.attendance_line_ids = self.attendance_line_ids.filtered(
-            lambda line: line.attendance_id.id in attendances.mapped("id")
-        )
-
-        # Add new records
-        for attendance in attendances:
-            if attendance.id not in existing_attendance_ids:
-                self.attendance_line_ids = [
-                    (
-                        0,
-                        0,
-                        {
-                            "attendance_id": attendance.id,
-                            "check_in": attendance.check_in,
-                            "check_out": attendance.check_out,
-                            "worked_hours": attendance.worked_hours,
-                            "approved": False,
-                        },
-                    )
-                ]
-
-    def _auto_update_attendance_records(self):
-        for payslip in self:
-            _logger.info(
-                f"Starting _auto_update_attendance_records for Payslip ID {payslip.id}"
-            )
-
-            attendances = (
-                self.env["hr.attendance"]
-                .with_user(SUPERUSER_ID)
-                .search(
-                    [
-                        ("employee_id", "=", payslip.employee_id.id),
-                        ("check_in", ">=", payslip.date_from),
-                        ("check_out", "<=", payslip.date_to),
-                    ]
-                )
-            )
-
-            if attendances:
-                _logger.info(
-                    f"Attendances found for Payslip ID {payslip.id}: {attendances.ids}"
-                )
-            else:
-                _logger.info(f"No attendances found for Payslip ID {payslip.id}")
-
-            payslip.attendance_line_ids.unlink()
-            attendance_lines = [
-                (
-                    0,
-                    0,
-                    {
-                        "attendance_id": attendance.id,
-                        "check_in": attendance.check_in,
-                        "check_out": attendance.check_out,
-                        "worked_hours": attendance.worked_hours,
-                        "approved": False,
-                    },
-                )
-                for attendance in attendances
-            ]
-
-            payslip.write({"attendance_line_ids": attendance_lines})
-
     def _sync_attendance_records(self):
         """
         Sync attendance records with payslip without creating duplicates.
@@ -148,90 +89,165 @@ class HrPayslip(models.Model):
             existing_attendance_ids = set(
                 payslip.attendance_line_ids.mapped("attendance_id.id")
             )
-            for attendance in attendances:
-                if attendance.id not in existing_attendance_ids:
-                    payslip.attendance_line_ids = [
-                        (
-                            0,
-                            0,
-                            {
-                                "attendance_id": attendance.id,
-                                "check_in": attendance.check_in,
-                                "check_out": attendance.check_out,
-                                "worked_hours": attendance.worked_hours,
-                                "approved": False,  # Do not sync approved status
-                                "last_approver_payslip_id": False,  # Reset last approver
-                            },
-                        )
-                    ]
-
-    def write(self, vals):
-        res = super(HrPayslip, self).write(vals)
-        if any(key in vals for key in ["employee_id", "date_from", "date_to"]):
-            self._sync_attendance_records()
-        return res
+            new_lines = [
+                (
+                    0,
+                    0,
+                    {
+                        "attendance_id": attendance.id,
+                        "approved": False,  # Do not sync approved status
+                        "last_approver_payslip_id": False,  # Reset last approver
+                    },
+                )
+                for attendance in attendances
+                if attendance.id not in existing_attendance_ids
+            ]
+            if new_lines:
+                payslip.attendance_line_ids = new_lines
 
-    @api.model
-    def create(self, vals):
-        record = super(HrPayslip, self).create(vals)
+    # ------------------------------------------------------------------
+    # Lifecycle pipeline: the only create/write overrides of hr.payslip,
+    # hr.payslip.attendance and hr.attendance in this addon. Each event syncs
+    # the affected payslips once; the salary recompute and the summary refresh
+    # are queued and run once per transaction, right before commit.
+    # ------------------------------------------------------------------
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        payslips = super().create(vals_list)
         if not self.env.context.get("skip_attendance_sync"):
-            record._sync_attendance_records()
+            payslips._sync_attendance_records()
+        payslips._enqueue_pipeline()
+        self.env["hr.labour.cost"]._mark_payslips(payslips)
+        return payslips
 
-        for line in record.attendance_line_ids:
-            line.approved = False
-            line.last_approver_payslip_id = False
-            line.approved_by = False
+    def write(self, vals):
+        unfreezing = "status" in vals and vals["status"] not in FINALIZED_STATES
+        if not unfreezing and FROZEN_FIELDS & set(vals):
+            frozen = self.filtered("is_frozen")
+            if frozen:
+                raise UserError(
+                    "Payslips %s are finalized and can no longer be changed."
+                    % ", ".join(frozen.mapped("employee_id.name"))
+                )
+        if unfreezing:
+            self._unfreeze()
+        if {"employee_id", "date_from"} & set(vals):
+            self._enqueue_summary_keys()
+        reprice = PAYSLIP_RATE_FIELDS & set(vals)
+        if reprice:
+            self.env["hr.labour.cost"]._mark_payslips(self)
+        res = super().write(vals)
+        if reprice:
+            self.env["hr.labour.cost"]._mark_payslips(self)
+        if vals.get("status") in FINALIZED_STATES:
+            self._freeze()
+        if PERIOD_FIELDS & set(vals):
+            self._sync_attendance_records()
+        self._enqueue_pipeline()
+        return res
 
-        return record
+    def unlink(self):
+        self.env["hr.labour.cost"]._mark_payslips(self)
+        self._enqueue_summary_keys()
+        return super().unlink()
+
+    def _get_pipeline_queue(self):
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get(PIPELINE_KEY)
+        if pending is None:
+            pending = precommit.data[PIPELINE_KEY] = {
+                "recompute": set(),
+                "summary": set(),
+                "summary_keys": set(),
+                "approval": set(),
+            }
+            precommit.add(self._run_pipeline)
+        return pending
+
+    def _enqueue_pipeline(self, recompute=False, approval=False):
+        """
+        Queue the payslips for the end-of-transaction pipeline: the summary
+        row is refreshed, salary figures only when `recompute` is set.
 
-    def action_duplicate_payslips(self):
+        With `approval`, the payslip is only queued for the approval fold, so
+        its approval totals are recomputed later without writing the row now.
+        The summary row shared by the reviewers of an employee is refreshed
+        by the fold too, never by the approval itself.
         """
-        Duplicate payslips with new start and end dates one month after the current payslip.
+        if not self.ids:
+            return
+        pending = self._get_pipeline_queue()
+        if approval:
+            pending["approval"].update(self.ids)
+        else:
+            pending["summary"].update(self.ids)
+        if recompute:
+            pending["recompute"].update(self.ids)
+
+    def _enqueue_summary_keys(self):
         """
-        for payslip in self:
-            # Lấy tất cả Attendance Records thuộc khoảng thời gian của Payslip
-            attendances = self.env["hr.attendance"].search(
-                [
-                    ("employee_id", "=", payslip.employee_id.id),
-                    ("check_in", ">=", payslip.date_from),
-                    ("check_out", "<=", payslip.date_to),
-                ]
-            )
+        Queue the current (employee, month) summary rows of the payslips,
+        before they are moved to another employee/month or deleted.
+        """
+        keys = {
+            (payslip.employee_id.id, payslip.date_from.replace(day=1))
+            for payslip in self
+            if payslip.employee_id and payslip.date_from
+        }
+        if keys:
+            self._get_pipeline_queue()["summary_keys"].update(keys)
 
-            # Tìm các Attendance mới chưa được thêm vào Payslip
-            existing_attendance_ids = payslip.attendance_line_ids.mapped(
-                "attendance_id.id"
-            )
-            new_attendances = attendances.filtered(
-                lambda a: a.id not in existing_attendance_ids
+    @api.model
+    def _run_pipeline(self):
+        data = self.env.cr.precommit.data
+        pending = data.pop(PIPELINE_KEY, None)
+        if not pending:
+            return
+        payslips = self.with_user(SUPERUSER_ID).browse(pending["recompute"]).exists()
+        payslips._recompute_payslip_figures()
+        # Recomputed payslips already have fresh approval totals
+        approvals = pending["approval"] - pending["recompute"]
+        if approvals:
+            self.env.cr.execute(
+                """
+                INSERT INTO hr_payslip_allowance_delta (payslip_id)
+                SELECT p.id FROM hr_payslip p
+                 WHERE p.id = ANY(%s) AND NOT COALESCE(p.is_frozen, FALSE)
+                """,
+                (list(approvals),),
             )
+        # Precommit runs after the ORM flush: flush what the recompute wrote
+        self.env.flush_all()
+        summary_ids = pending["summary"]
+        summary_keys = pending["summary_keys"]
+        # Writes done by the recompute re-queued their payslips; fold them in
+        requeued = data.pop(PIPELINE_KEY, None)
+        if requeued:
+            summary_ids |= requeued["summary"]
+            summary_keys |= requeued["summary_keys"]
+        self.env["hr.payslip.summary"]._refresh_payslips(
+            list(summary_ids), summary_keys
+        )
 
-            # Thêm các Attendance mới vào Payslip
-            payslip.attendance_line_ids = [
-                (
-                    0,
-                    0,
-                    {
-                        "attendance_id": attendance.id,
-                        "check_in": attendance.check_in,
-                        "check_out": attendance.check_out,
-                        "worked_hours": attendance.worked_hours,
-                        "approved": False,
-                    },
-                )
-                for attendance in new_attendances
-            ]
-
-            # Remove readonly status for date_from and date_to fields
-            # new_payslip.write({
-            #     'state': 'draft'
-            # })
+    def _recompute_payslip_figures(self):
+        """Recompute wages, allowances and totals of open payslips."""
+        self._refresh_approval_totals()
+        payslips = self.filtered(
+            lambda p: not p.is_frozen
+            and p.currency_rate_fallback > 0
+            and p.total_working_hours
+        )
+        if payslips:
+            payslips._onchange_salary_fields()
+            payslips._onchange_bonus_vnd()
+            _logger.info("Recomputed salary figures for Payslips: %s", payslips.ids)
 
     def action_approve_attendance(self):
         """
         Approve all attendance records in the selected payslip.
         """
+        self.attendance_line_ids._check_payslip_not_frozen()
         _logger.info("Action Approve Attendance started for Payslip IDs: %s", self.ids)
         for payslip in self:
             for line in payslip.attendance_line_ids:
@@ -248,16 +264,15 @@ class HrPayslip(models.Model):
                         [
                             ("attendance_id", "=", line.attendance_id.id),
                             ("payslip_id", "!=", payslip.id),
+                            ("payslip_id.is_frozen", "=", False),
                         ]
                     )
 
                     # Disable editing for this attendance record in other payslips
                     other_payslip_lines.write({"approved": True})
 
-            # Recompute total worked hours after approval
-            payslip._compute_total_worked_hours()
-            payslip.compute_meal_allowance()
-            _logger.info("Recomputed total worked hours for Payslip ID: %s", payslip.id)
+        # Recompute the approval totals once for all payslips
+        self._refresh_approval_totals()
         _logger.info(
             "Action Approve Attendance completed for Payslip IDs: %s", self.ids
         )
@@ -270,60 +285,135 @@ class HrPayslip(models.Model):
         - include_saturdays phải là True.
         - Tổng số giờ làm trong một ngày >= 8 giờ thì cộng 30,000 VND.
         """
-        for payslip in self:
-            # Nếu không tính thứ 7, giữ nguyên tiền ăn = 0
-            if not payslip.include_saturdays:
-                payslip.meal_allowance_vnd = 0
-                payslip.write({"meal_allowance_vnd": 0})
-                continue  # Bỏ qua các bước tiếp theo
+        # The absolute recomputation supersedes any pending approval delta
+        self.env["hr.payslip.allowance.delta"].sudo().search(
+            [("payslip_id", "in", self.ids)]
+        ).unlink()
 
+        # Approved hours grouped by local work date in one query
+        hours_by_day = self._approved_hours_by_day()
+        for payslip in self:
             total_meal_allowance = 0  # Biến lưu tổng tiền ăn
 
-            # Lọc các bản ghi attendance đã được approve
-            approved_attendances = payslip.attendance_line_ids.filtered(
-                lambda a: a.approved
-            )
+            # Nếu không tính thứ 7, giữ nguyên tiền ăn = 0
+            if payslip.include_saturdays:
+                attendance_by_date = hours_by_day[payslip.id]
 
-            # Nhóm theo ngày để tính tổng số giờ làm của mỗi ngày
-            attendance_by_date = {}
-            for record in approved_attendances:
-                attendance_date = record.attendance_id.check_in.date()
-                if attendance_date not in attendance_by_date:
-                    attendance_by_date[attendance_date] = 0
-                attendance_by_date[attendance_date] += record.worked_hours
-
-            # Tính tiền ăn: nếu tổng giờ làm >= 8h trong ngày => +30,000 VND
-            for date, total_hours in attendance_by_date.items():
-                if total_hours >= 8:
-                    total_meal_allowance += (
-                        30000  # Cộng thêm 30,000 VND cho mỗi ngày đủ điều kiện
-                    )
+                # Tính tiền ăn: nếu tổng giờ làm >= 8h trong ngày => +30,000 VND
+                for date, total_hours in attendance_by_date.items():
+                    if total_hours >= 8:
+                        total_meal_allowance += MEAL_ALLOWANCE_VND
 
-            # Gán lại giá trị vào payslip
-            payslip.meal_allowance_vnd = total_meal_allowance
-            payslip.write({"meal_allowance_vnd": total_meal_allowance})
+            # Only write (and lock the payslip row) when the amount changes
+            if payslip.meal_allowance_vnd != total_meal_allowance:
+                payslip.write({"meal_allowance_vnd": total_meal_allowance})
 
             _logger.info(
                 f"Updated meal allowance for Payslip {payslip.id}: {total_meal_allowance} VND"
             )
 
-    def write(self, vals):
+    def _refresh_approval_totals(self):
         """
-        Khi trạng thái `approved` của một bản ghi attendance thay đổi,
-        tự động cập nhật lại tiền ăn của payslip chứa nó.
+        Recompute the figures fed by attendance approvals: approved hours and
+        days, the per-day meal allowance and the salary totals. They are not
+        in the stored dependency graph, so approving a line never writes the
+        payslip row; approvals are folded in by `_fold_allowance_deltas`.
         """
-        res = super().write(vals)
+        payslips = self.filtered(lambda p: not p.is_frozen)
+        if not payslips:
+            return
+        payslips._compute_worked_hours()
+        payslips._compute_approved_working()
+        # The meal allowance is only derived from attendances with Saturdays
+        meal_payslips = payslips.filtered("include_saturdays")
+        meal_payslips.compute_meal_allowance()
+        meal_payslips._onchange_bonus_vnd()
+        payslips._compute_total_salary()
+
+    def _fold_allowance_deltas(self, all_pending=False, skip_locked=False):
+        """
+        Fold the pending approvals into their payslips: the approval totals and
+        the 8-hour meal threshold of every day are recomputed from the approved
+        lines, so concurrent approvals of the same day can neither lose nor
+        double the allowance. Frozen payslips are left untouched.
+
+        The payslip rows are locked first (skipped when already locked with
+        `skip_locked`); only the approvals of locked payslips are consumed,
+        the others stay queued for the next fold. With `all_pending`, the
+        approvals of every payslip are folded. Folded payslips get their
+        summary row refreshed at the end of the transaction.
+        """
+        if not self and not all_pending:
+            return self
+        self.env.flush_all()
+        # Approvals of this transaction are only queued until commit
+        queued = self.env.cr.precommit.data.get(PIPELINE_KEY)
+        local = set(queued["approval"]) if queued else set()
+        if not all_pending:
+            local &= set(self.ids)
+        domain_sql = "" if all_pending else "WHERE payslip_id IN %s"
+        params = () if all_pending else (tuple(self.ids),)
+        lock_sql = "SKIP LOCKED" if skip_locked else ""
+        self.env.cr.execute(
+            f"""
+            WITH pending AS (
+                SELECT payslip_id FROM hr_payslip_allowance_delta
+                {domain_sql}
+                 UNION
+                SELECT unnest(%s::int[])
+            ), locked AS (
+                SELECT p.id
+                  FROM hr_payslip p
+                  JOIN pending ON pending.payslip_id = p.id
+                 WHERE NOT COALESCE(p.is_frozen, FALSE)
+                   FOR NO KEY UPDATE OF p {lock_sql}
+            ), moved AS (
+                DELETE FROM hr_payslip_allowance_delta d
+                 USING locked l
+                 WHERE d.payslip_id = l.id
+            )
+            SELECT id FROM locked
+            """,
+            params + (list(local),),
+        )
+        folded_ids = {row[0] for row in self.env.cr.fetchall()}
+        if queued:
+            # Local approvals of payslips locked elsewhere go to the queue table
+            queued["approval"] -= folded_ids
+        folded = self.browse(folded_ids).exists()
+        if folded:
+            folded._refresh_approval_totals()
+            folded._enqueue_pipeline()
+            _logger.info("Folded pending approvals into Payslips: %s", folded.ids)
+        return folded
 
-        # Nếu có thay đổi trạng thái approved, cập nhật meal allowance
-        if "approved" in vals:
-            payslips = self.mapped("payslip_id")
-            if payslips:
-                _logger.info(
-                    "Recomputing meal allowance for Payslips: %s", payslips.ids
-                )
-                payslips.compute_meal_allowance()
+    @api.model
+    def _cron_fold_allowance_deltas(self):
+        # Approvals queued before their payslip was frozen no longer apply
+        self.env.cr.execute(
+            """
+            DELETE FROM hr_payslip_allowance_delta d
+             USING hr_payslip p
+             WHERE d.payslip_id = p.id AND p.is_frozen
+            """
+        )
+        # Payslips being edited are folded by the next run
+        self.browse()._fold_allowance_deltas(all_pending=True, skip_locked=True)
 
-        return res
+
+class HrPayslipAllowanceDelta(models.Model):
+    """
+    Append-only queue of payslips with approvals not folded yet. Approvals only
+    insert here; the payslip totals are recomputed by the fold.
+    """
+
+    _name = "hr.payslip.allowance.delta"
+    _description = "Payslip Pending Approval"
+    _log_access = False
+
+    payslip_id = fields.Many2one(
+        "hr.payslip", string="Payslip", required=True, ondelete="cascade", index=True
+    )
 
 
 class HrPayslipAttendance(models.Model):
@@ -341,11 +431,22 @@ class HrPayslipAttendance(models.Model):
     check_in = fields.Datetime(
         string="Check In", related="attendance_id.check_in", readonly=True, store=True
     )
+    # Stored copies of the attendance so payroll sums read a single table
     check_out = fields.Datetime(
-        string="Check Out", related="attendance_id.check_out", readonly=True
+        string="Check Out", related="attendance_id.check_out", readonly=True, store=True
     )
     worked_hours = fields.Float(
-        string="Worked Hours", related="attendance_id.worked_hours", readonly=True
+        string="Worked Hours",
+        related="attendance_id.worked_hours",
+        readonly=True,
+        store=True,
+    )
+    work_date = fields.Date(
+        string="Work Date",
+        compute="_compute_work_date",
+        store=True,
+        index=True,
+        help="Check-in date in the employee's timezone.",
     )
     approved_by = fields.Many2one("res.users", string="Approved By", readonly=True)
     approved = fields.Boolean(string="Approved", default=False)
@@ -361,98 +462,139 @@ class HrPayslipAttendance(models.Model):
         help="The last payslip that approved this attendance record.",
     )
 
-    def toggle_approval(self):
-        """
-        Toggle the approval status of an attendance record in the current payslip.
-        The meal_allowance_vnd is updated only if `include_saturdays` is True.
-        The allowance is added/subtracted only if the total worked hours in a single day reach at least 8 hours.
-        """
-        for record in self:
-            payslip = record.payslip_id  # Get the current payslip
-
-            # If include_saturdays is False, do not modify meal_allowance_vnd
-            if not payslip.include_saturdays:
-                record.approved = not record.approved
-                record.approved_by = self.env.user.id if record.approved else False
-                record.last_approver_payslip_id = payslip if record.approved else False
-                return
-
-            attendance_date = (
-                record.attendance_id.check_in.date()
-            )  # Get the attendance date
-
-            # Get all attendance records for the same day
-            same_day_attendances = payslip.attendance_line_ids.filtered(
-                lambda a: a.attendance_id.check_in.date() == attendance_date
+    @api.depends("check_in", "employee_id.tz")
+    def _compute_work_date(self):
+        for line in self:
+            line.work_date = line.attendance_id._get_work_date()
+
+    def _check_payslip_not_frozen(self):
+        """Attendance lines of finalized payslips are part of their snapshot."""
+        frozen = self.payslip_id.filtered("is_frozen")
+        if frozen:
+            raise UserError(
+                "Attendance of finalized payslips %s can no longer be changed."
+                % ", ".join(frozen.mapped("employee_id.name"))
             )
 
-            # Calculate total worked hours before toggling
-            previous_total_hours = sum(
-                att.worked_hours for att in same_day_attendances if att.approved
-            )
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        lines._check_payslip_not_frozen()
+        lines.payslip_id._enqueue_pipeline(approval=True)
+        return lines
 
-            # Step 1: Unapprove (if currently approved)
-            if record.approved:
-                record.approved = False
-                record.approved_by = False
-                record.last_approver_payslip_id = False
-
-                # Recalculate total worked hours after unapproving
-                new_total_hours = previous_total_hours - record.worked_hours
-
-                # Only subtract meal allowance if new total hours drop below 8h
-                if previous_total_hours >= 8 and new_total_hours < 8:
-                    payslip.meal_allowance_vnd -= 30000
-                    payslip.write({"meal_allowance_vnd": payslip.meal_allowance_vnd})
-                    payslip._onchange_bonus_vnd()
-            # Step 2: Approve (if not already approved)
-            else:
-                record.approved = True
-                record.last_approver_payslip_id = payslip
-                record.approved_by = self.env.user.id
-
-                # Recalculate total worked hours after approving
-                new_total_hours = previous_total_hours + record.worked_hours
-
-                # Only add meal allowance if new total hours reach at least 8h
-                if previous_total_hours < 8 and new_total_hours >= 8:
-                    payslip.meal_allowance_vnd += 30000
-                    payslip.write({"meal_allowance_vnd": payslip.meal_allowance_vnd})
-                    payslip._onchange_bonus_vnd()
-            # Update total worked hours in the payslip
-            payslip._compute_total_worked_hours()
-            self._sync_approval_status_within_payslip(record)
-            self._recompute_related_payslips(record)
-
-    def _sync_approval_status_within_payslip(self, record):
+    def write(self, vals):
+        self._check_payslip_not_frozen()
+        payslips = self.payslip_id
+        res = super().write(vals)
+        if "payslip_id" in vals:
+            self._check_payslip_not_frozen()
+        if {"approved", "payslip_id", "attendance_id"} & set(vals):
+            (payslips | self.payslip_id)._enqueue_pipeline(approval=True)
+        return res
+
+    def unlink(self):
+        self._check_payslip_not_frozen()
+        payslips = self.payslip_id
+        res = super().unlink()
+        payslips.exists()._enqueue_pipeline(approval=True)
+        return res
+
+    def toggle_approval(self):
         """
-        Synchronize the approval status across all related payslip lines
-        for the attendance record within the same payslip.
+        Toggle the approval status of attendance records in their payslip.
+
+        Only the attendance lines are written by the toggle itself: the
+        approved hours, meal allowance (8 approved hours in a day when
+        `include_saturdays` is set), salary totals and summary row are
+        recomputed by `hr.payslip._fold_allowance_deltas`. The payslips are
+        folded right away unless another transaction holds them, in which case
+        the fold cron picks the approval up, so concurrent reviewers never
+        queue on the parent payslip row.
+
+        Each attempt runs in a savepoint and is retried a bounded number of
+        times when the lines are locked by another reviewer. A serialization
+        failure needs a fresh snapshot and is left to the RPC layer, which
+        replays the whole call in a new transaction.
         """
-        related_lines = self.env["hr.payslip.attendance"].search(
+        self._check_payslip_not_frozen()
+        for attempt in range(1, APPROVAL_RETRIES + 1):
+            try:
+                with mute_logger("odoo.sql_db"), self.env.cr.savepoint():
+                    self._toggle_approval()
+                break
+            except psycopg2.OperationalError as e:
+                if e.pgcode not in APPROVAL_RETRY_ERRORS:
+                    raise
+                self.env.invalidate_all()
+                _logger.info(
+                    "Attendance lines %s locked by another approval (attempt %s/%s)",
+                    self.ids,
+                    attempt,
+                    APPROVAL_RETRIES,
+                )
+        else:
+            raise UserError(
+                "These attendance records are being approved by another user. "
+                "Please try again in a moment."
+            )
+        # Keep the figures on screen current when nobody else holds the payslip
+        self.payslip_id._fold_allowance_deltas(skip_locked=True)
+
+    def _toggle_approval(self):
+        self._lock_for_approval()
+        # Toggle from the committed state, not from the reviewer's screen
+        self.invalidate_recordset(["approved"])
+        # Lines of the same attendance within the same payslip take the new
+        # status too; for duplicates toggled together the last one wins
+        targets = {
+            (line.attendance_id.id, line.payslip_id.id): not line.approved
+            for line in self
+        }
+        related = self.search(
             [
-                ("attendance_id", "=", record.attendance_id.id),
-                (
-                    "payslip_id",
-                    "=",
-                    record.payslip_id.id,
-                ),  # Only sync within the same payslip
+                ("attendance_id", "in", self.attendance_id.ids),
+                ("payslip_id", "in", self.payslip_id.ids),
             ]
         )
-        for line in related_lines:
-            line.approved = record.approved
-            line.last_approver_payslip_id = record.last_approver_payslip_id
-            line.approved_by = record.approved_by
+        groups = defaultdict(list)
+        for line in related:
+            approve = targets.get((line.attendance_id.id, line.payslip_id.id))
+            if approve is not None:
+                payslip_id = line.payslip_id.id if approve else False
+                groups[(approve, payslip_id)].append(line.id)
+        # One write per target status (and approving payslip)
+        for (approve, payslip_id), line_ids in groups.items():
+            self.browse(line_ids).write(
+                {
+                    "approved": approve,
+                    "approved_by": self.env.user.id if approve else False,
+                    "last_approver_payslip_id": payslip_id,
+                }
+            )
 
-    def _recompute_related_payslips(self, record):
+    def _lock_for_approval(self):
         """
-        Recompute the total worked hours for all payslips related to the attendance record.
+        Row-lock the lines being toggled, waiting at most APPROVAL_LOCK_TIMEOUT
+        for another reviewer instead of queueing behind them indefinitely.
         """
-        related_payslips = self.env["hr.payslip"].search(
-            [("attendance_line_ids.attendance_id", "=", record.attendance_id.id)]
+        if not self.ids:
+            return
+        cr = self.env.cr
+        cr.execute("SELECT current_setting('lock_timeout')")
+        lock_timeout = cr.fetchone()[0]
+        cr.execute(
+            "SELECT set_config('lock_timeout', %s, true)", (APPROVAL_LOCK_TIMEOUT,)
+        )
+        cr.execute(
+            """
+            SELECT id FROM hr_payslip_attendance
+             WHERE id IN %s
+               FOR NO KEY UPDATE
+            """,
+            (tuple(self.ids),),
         )
-        for payslip in related_payslips:
-            payslip._compute_total_worked_hours()
+        cr.execute("SELECT set_config('lock_timeout', %s, true)", (lock_timeout,))
 
     def action_view_details(self):
         """
@@ -486,78 +628,67 @@ _logger = logging.getLogger(__name__)
 class HrAttendance(models.Model):
     _inherit = "hr.attendance"
 
-    def toggle_approval(self):
-        """Toggle approval status for attendance."""
-        for record in self:
-            record.approved = not record.approved
-
     @api.model
     def _round_time(self, time):
         """Làm tròn thời gian tới phút gần nhất"""
         return (time + timedelta(seconds=30)).replace(second=0, microsecond=0)
 
+    def _get_work_date(self):
+        """Check-in date in the employee's timezone, the day payroll counts."""
+        self.ensure_one()
+        if not self.check_in:
+            return False
+        tz = pytz.timezone(self.employee_id.tz or "UTC")
+        return pytz.utc.localize(self.check_in).astimezone(tz).date()
+
+    def _round_vals(self, vals):
+        for key in ("check_in", "check_out"):
+            if vals.get(key):
+                vals[key] = self._round_time(fields.Datetime.from_string(vals[key]))
+        return vals
+
     @api.model_create_multi
     def create(self, vals_list):
         """Làm tròn thời gian khi tạo mới và tự động đồng bộ với Payslip"""
-        # Làm tròn thời gian cho tất cả records
         for vals in vals_list:
-            if "check_in" in vals and vals["check_in"]:
-                vals["check_in"] = self._round_time(
-                    fields.Datetime.from_string(vals["check_in"])
-                )
-            if "check_out" in vals and vals["check_out"]:
-                vals["check_out"] = self._round_time(
-                    fields.Datetime.from_string(vals["check_out"])
-                )
-
-        # Tạo attendance records
+            self._round_vals(vals)
         attendances = super().create(vals_list)
+        attendances._ensure_current_month_payslips()
+        attendances._sync_payslips()
+        return attendances
 
-        # Cập nhật payslip cho mỗi attendance
-        for attendance in attendances:
+    def write(self, vals):
+        """Làm tròn thời gian khi cập nhật và đồng bộ với Payslip"""
+        res = super().write(self._round_vals(vals))
+        if "check_in" in vals or "check_out" in vals:
+            self._sync_payslips()
+        return res
+
+    def _sync_payslips(self):
+        """
+        Sync, once per event, every open payslip whose period covers one of
+        these attendances or which already lists one of them, and queue their
+        salary recompute for the end of the transaction.
+        """
+        Payslip = self.env["hr.payslip"].with_user(SUPERUSER_ID)
+        payslips = (
+            self.env["hr.payslip.attendance"]
+            .with_user(SUPERUSER_ID)
+            .search([("attendance_id", "in", self.ids)])
+            .payslip_id
+        )
+        for attendance in self:
             if attendance.check_out:  # Chỉ cập nhật khi đã check out
-                payslips = self.env["hr.payslip"].search(
+                payslips |= Payslip.search(
                     [
                         ("employee_id", "=", attendance.employee_id.id),
                         ("date_from", "<=", attendance.check_in),
                         ("date_to", ">=", attendance.check_out),
                     ]
                 )
-                if payslips:
-                    payslips._auto_update_attendance_records()
-
-        return attendances
-
-    def write(self, vals):
-        """Làm tròn thời gian khi cập nhật và đồng bộ với Payslip"""
-        # Làm tròn thời gian
-        if "check_in" in vals and vals["check_in"]:
-            vals["check_in"] = self._round_time(
-                fields.Datetime.from_string(vals["check_in"])
-            )
-        if "check_out" in vals and vals["check_out"]:
-            vals["check_out"] = self._round_time(
-                fields.Datetime.from_string(vals["check_out"])
-            )
-
-        # Thực hiện cập nhật
-        result = super().write(vals)
-
-        # Cập nhật payslip nếu có thay đổi check_in hoặc check_out
-        if "check_in" in vals or "check_out" in vals:
-            for attendance in self:
-                if attendance.check_out:  # Chỉ cập nhật khi đã check out
-                    payslips = self.env["hr.payslip"].search(
-                        [
-                            ("employee_id", "=", attendance.employee_id.id),
-                            ("date_from", "<=", attendance.check_in),
-                            ("date_to", ">=", attendance.check_out),
-                        ]
-                    )
-                    if payslips:
-                        payslips._auto_update_attendance_records()
-
-        return result
+        payslips = payslips.filtered(lambda p: not p.is_frozen)
+        payslips._sync_attendance_records()
+        payslips._enqueue_pipeline(recompute=True)
 
 
 class HrPayslipDuplicateWizard(models.TransientModel):
@@ -659,37 +790,7 @@ class HrPayslipDuplicateWizard(models.TransientModel):
             # Sao chép phiếu lương
             new_payslip = payslip.copy(copy_values)
 
-            # Xóa danh sách chấm công cũ (nếu có)
-            if new_payslip.attendance_line_ids:
-                new_payslip.attendance_line_ids.unlink()
-
-            # Lấy danh sách chấm công phù hợp với khoảng thời gian mới
-            attendances = self.env["hr.attendance"].search(
-                [
-                    ("employee_id", "=", payslip.employee_id.id),
-                    ("check_in", ">=", new_start_date),
-                    ("check_out", "<=", new_end_date),
-                ]
-            )
-
-            # Thêm chấm công vào phiếu lương mới
-            new_payslip.attendance_line_ids = [
-                (
-                    0,
-                    0,
-                    {
-                        "attendance_id": attendance.id,
-                        "check_in": attendance.check_in,
-                        "check_out": attendance.check_out,
-                        "worked_hours": attendance.worked_hours,
-                        "approved": False,
-                    },
-                )
-                for attendance in attendances
-            ]
-
-            # Kích hoạt cơ chế tự động cập nhật Attendance mới
-            new_payslip._auto_update_attendance_records()
+            # Attendance lines of the new period are synced by hr.payslip.create
             new_payslip._onchange_salary_fields()
             new_payslip._onchange_bonus_vnd()
             # new_payslip._compute_converted_salary_vnd()
@@ -16,31 +16,13 @@ class HrAttendance(models.Model):
     approved_by = fields.Many2one("res.users", string="Approved By", readonly=True)
 
     def toggle_approval(self):
-        """Toggle the approval status of the attendance and update related payslip if applicable."""
+        """Toggle the approval status of the attendance."""
         for record in self:
             record.approved = not record.approved
             _logger.info(
                 f"Toggled approval for {record.employee_id.name} on {record.check_in} to {record.approved}"
             )
 
-            # Find and update the related payslip
-            payslip = self.env["hr.payslip"].search(
-                [
-                    ("employee_id", "=", record.employee_id.id),
-                    ("date_from", "<=", record.check_in.date()),
-                    ("date_to", ">=", record.check_out.date()),
-                ],
-                limit=1,
-            )
-
-            if payslip:
-                payslip._compute_worked_hours()
-                payslip._compute_total_salary()
-                payslip._compute_additional_fields()
-                _logger.info(
-                    f"Recomputed fields for payslip of {record.employee_id.name}"
-                )
-
     def approve_attendance(self):
         """Set the approved status to True."""
         for record in self:
@@ -167,6 +149,65 @@ class HrEmployee(models.Model):
     payslip_report_ids = fields.One2many(
         "hr.payslip.report", "employee_id", string="Payslip Reports"
     )
+    payslip_count = fields.Integer(
+        string="Payslips", compute="_compute_payslip_counts"
+    )
+    payslip_report_count = fields.Integer(
+        string="Payslip Reports", compute="_compute_payslip_counts"
+    )
+
+    def _compute_payslip_counts(self):
+        """Smart-button counts from grouped queries instead of loading the lists."""
+        # read_group bypasses the hr.payslip search override: restrict it here
+        restrictions = {
+            "hr.payslip": self.env["hr.payslip"]._get_own_payslip_domain(),
+            "hr.payslip.report": [],
+        }
+        counts = {}
+        for model, restriction in restrictions.items():
+            data = self.env[model].read_group(
+                [("employee_id", "in", self._origin.ids)] + restriction,
+                ["employee_id"],
+                ["employee_id"],
+            )
+            counts[model] = {
+                row["employee_id"][0]: row["employee_id_count"] for row in data
+            }
+        for employee in self:
+            employee_id = employee._origin.id
+            employee.payslip_count = counts["hr.payslip"].get(employee_id, 0)
+            employee.payslip_report_count = counts["hr.payslip.report"].get(
+                employee_id, 0
+            )
+
+    def action_view_payslips(self):
+        """Open the employee's payslips in a server-paginated list."""
+        self.ensure_one()
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "employee_payroll_attendance.action_hr_payslip"
+        )
+        action["views"] = [
+            (
+                self.env.ref(
+                    "employee_payroll_attendance.view_hr_employee_payslip_tree"
+                ).id,
+                "tree",
+            ),
+            (False, "form"),
+        ]
+        action["domain"] = [("employee_id", "=", self.id)]
+        action["context"] = {"default_employee_id": self.id}
+        return action
+
+    def action_view_payslip_reports(self):
+        """Open the employee's payslip reports in a server-paginated list."""
+        self.ensure_one()
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "employee_payroll_attendance.action_hr_payslip_report"
+        )
+        action["domain"] = [("employee_id", "=", self.id)]
+        action["context"] = {"default_employee_id": self.id}
+        return action
 
     def action_generate_payslip(self):
         """Generate a payslip for the current month for each selected employee."""
@@ -187,7 +228,6 @@ class HrEmployee(models.Model):
             )
             payslip._compute_worked_hours()
             payslip._compute_total_salary()
-            payslip._compute_additional_fields()
             _logger.info(
                 f"Payslip generated for {employee.name} for the month starting {payslip.date_from}"
             )
@@ -0,0 +1,146 @@
+from odoo import api, fields, models, tools
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class HrPayslipSummary(models.Model):
+    """
+    Monthly hours/cost cube: one row per company x employee x month x status,
+    aggregating every payslip of that employee starting in that month.
+
+    Rows are refreshed incrementally, once per transaction, by the payslip
+    lifecycle pipeline (`hr.payslip._run_pipeline`): each (employee, month)
+    touched by attendance approvals, attendance edits and payslip writes is
+    re-aggregated, so dashboards read a single indexed table instead of
+    recomputing payslips.
+    """
+
+    _name = "hr.payslip.summary"
+    _description = "Payslip Monthly Summary"
+    _order = "month desc, employee_id"
+    _log_access = False
+
+    company_id = fields.Many2one("res.company", string="Company", readonly=True)
+    employee_id = fields.Many2one("hr.employee", string="Employee", readonly=True)
+    month = fields.Date(string="Month", readonly=True)
+    status = fields.Selection(
+        [
+            ("draft", "Draft"),
+            ("generated", "Payslip Generated"),
+            ("employee_confirm", "Employee Confirm"),
+            ("transfer_payment", "Transfer Payment"),
+            ("done", "Done"),
+        ],
+        string="Status",
+        readonly=True,
+    )
+    payslip_count = fields.Integer(string="Payslips", readonly=True)
+    attendance_count = fields.Integer(string="Attendances", readonly=True)
+    worked_hours = fields.Float(string="Worked Hours", readonly=True)
+    approved_hours = fields.Float(string="Approved Hours", readonly=True)
+    approved_days = fields.Float(string="Approved Days", readonly=True)
+    total_salary = fields.Float(string="Total Salary (USD)", readonly=True)
+    converted_salary_vnd = fields.Float(string="Total Salary (VND)", readonly=True)
+
+    _sql_constraints = [
+        (
+            "employee_month_status_uniq",
+            "unique(employee_id, month, status)",
+            "An employee can only have one summary row per month and status.",
+        ),
+    ]
+
+    def init(self):
+        tools.create_index(
+            self._cr,
+            "hr_payslip_summary_company_month_status_idx",
+            self._table,
+            ["company_id", "month", "status"],
+        )
+
+    # Aggregation query shared by the incremental refresh and the full rebuild.
+    # Attendance totals are summed per payslip first (LATERAL) so the salary
+    # columns are not multiplied by the attendance join. Approved days follow
+    # the payslip convention of approved hours / 8.
+    _SUMMARY_INSERT = """
+        INSERT INTO hr_payslip_summary (
+            company_id, employee_id, month, status, payslip_count,
+            attendance_count, worked_hours, approved_hours, approved_days,
+            total_salary, converted_salary_vnd
+        )
+        SELECT e.company_id,
+               p.employee_id,
+               date_trunc('month', p.date_from)::date,
+               p.status,
+               COUNT(p.id),
+               COALESCE(SUM(l.line_count), 0),
+               COALESCE(SUM(l.worked_hours), 0),
+               COALESCE(SUM(l.approved_hours), 0),
+               COALESCE(SUM(l.approved_hours), 0) / 8.0,
+               COALESCE(SUM(p.total_salary), 0),
+               COALESCE(SUM(p.converted_salary_vnd), 0)
+          FROM hr_payslip p
+          JOIN hr_employee e ON e.id = p.employee_id
+     LEFT JOIN LATERAL (
+                SELECT COUNT(*) AS line_count,
+                       SUM(a.worked_hours) AS worked_hours,
+                       SUM(a.worked_hours) FILTER (WHERE a.approved) AS approved_hours
+                  FROM hr_payslip_attendance a
+                 WHERE a.payslip_id = p.id
+               ) l ON TRUE
+         WHERE p.date_from IS NOT NULL
+           {where}
+      GROUP BY e.company_id, p.employee_id, 3, p.status
+    """
+
+    # (employee, month) pairs given as two parallel arrays
+    _SUMMARY_KEYS = "(SELECT * FROM unnest(%s::int[], %s::date[]))"
+
+    @api.model
+    def _refresh_payslips(self, payslip_ids, keys=()):
+        """
+        Re-aggregate the (employee, month) rows of the given payslips, plus
+        the extra `keys` those payslips belonged to before being moved or
+        deleted, in one delete and one insert.
+        """
+        if not payslip_ids and not keys:
+            return
+        self.env.flush_all()
+        keys = set(keys)
+        if payslip_ids:
+            self.env.cr.execute(
+                """
+                SELECT DISTINCT employee_id, date_trunc('month', date_from)::date
+                  FROM hr_payslip
+                 WHERE id IN %s AND employee_id IS NOT NULL AND date_from IS NOT NULL
+                """,
+                (tuple(payslip_ids),),
+            )
+            keys.update(self.env.cr.fetchall())
+        if not keys:
+            return
+        employee_ids, months = zip(*keys)
+        params = (list(employee_ids), list(months))
+        self.env.cr.execute(
+            "DELETE FROM hr_payslip_summary WHERE (employee_id, month) IN "
+            + self._SUMMARY_KEYS,
+            params,
+        )
+        self.env.cr.execute(
+            self._SUMMARY_INSERT.format(
+                where="AND (p.employee_id, date_trunc('month', p.date_from)::date) IN "
+                + self._SUMMARY_KEYS
+            ),
+            params,
+        )
+        self.invalidate_model()
+        _logger.info("Refreshed payslip summary for %s employee months", len(keys))
+
+    @api.model
+    def _rebuild_all(self):
+        """Full rebuild, used on install and by the nightly safety-net cron."""
+        self.env.flush_all()
+        self.env.cr.execute("DELETE FROM hr_payslip_summary")
+        self.env.cr.execute(self._SUMMARY_INSERT.format(where=""))
+        self.invalidate_model()
@@ -1,7 +1,5 @@
-import requests
 import base64
 import io
-import pandas as pd
 import logging
 from odoo import models, fields, api
 from odoo.exceptions import UserError
@@ -29,6 +27,10 @@ class HrPayslipUpdateRateWizard(models.TransientModel):
 
     def fetch_usd_exchange_rate(self, date):
         """Fetch USD exchange rate (Buy Cash) from Vietcombank API for a chosen date"""
+        # Only this wizard needs them: keep them out of every worker's startup
+        import pandas as pd
+        import requests
+
         base_url = (
             f"https://www.vietcombank.com.vn/api/exchangerates/exportexcel?date={date}"
         )
@@ -135,14 +137,19 @@ class HrPayslipUpdateRateWizard(models.TransientModel):
         if not payslips:
             raise UserError("No Payslip records found.")
 
+        # Finalized payslips keep the rate of their snapshot
+        frozen = payslips.filtered("is_frozen")
+        if frozen:
+            _logger.info(f"Skipping finalized Payslips: {frozen.ids}")
+            payslips -= frozen
+
         payslips.sudo().write({"currency_rate_fallback": self.currency_rate_fallback})
 
         _logger.info(
-            f"Applied exchange rate {self.currency_rate_fallback} to Payslips: {active_ids}"
+            f"Applied exchange rate {self.currency_rate_fallback} to Payslips: {payslips.ids}"
         )
 
         payslips._recalculate_total_salary()
-        payslips._auto_update_attendance_records()
         payslips._onchange_salary_fields()
         payslips._onchange_bonus_vnd()
 
@@ -0,0 +1,4 @@
+from . import test_import_footprint
+from . import test_payroll_payment_batch
+from . import test_payroll_simulation
+from . import test_query_count
@@ -0,0 +1,73 @@
+import logging
+import threading
+
+from odoo.tests import TransactionCase
+
+_logger = logging.getLogger(__name__)
+
+# The same harness lives in om_account_accountant/tests/common.py on top of
+# the accounting test base: neither addon depends on the other, so a change to
+# one copy must be mirrored in the other.
+
+# Data sizes each operation is measured at
+QUERY_COUNT_SIZES = (5, 25)
+
+
+class QueryCountCase(TransactionCase):
+    """
+    Query-count regression harness: an operation is measured on a seeded
+    dataset at every size of QUERY_COUNT_SIZES. The query count and the SQL
+    time are logged, and the test fails as soon as the query count grows
+    faster than the budget of the operation: constant by default, so any N+1
+    slipping in is caught, or a fixed number of queries per seeded item for
+    operations that are linear by design.
+    """
+
+    def _measure(self, operation):
+        """
+        Run `operation` with a cold cache; return (query count, SQL seconds).
+        The work deferred to the commit (cr.precommit) is part of the count;
+        the one left over by the seeding is run before.
+        """
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.env.invalidate_all()
+        thread = threading.current_thread()
+        thread.query_count = 0
+        thread.query_time = 0.0
+        operation()
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        return thread.query_count, thread.query_time
+
+    def assertQueryScaling(self, name, seed, operation, slack=0, per_item=0):
+        """
+        :param seed: callable(size) seeding the data of one size and returning
+            the argument given to `operation`
+        :param operation: callable(seeded) performing the measured operation
+        :param slack: queries tolerated on top of the smallest size
+        :param per_item: queries allowed for each item seeded on top of the
+            smallest size (0 for an operation that must be constant)
+        """
+        results = []
+        for size in QUERY_COUNT_SIZES:
+            seeded = seed(size)
+            count, sql_time = self._measure(lambda: operation(seeded))
+            results.append((size, count, sql_time))
+            _logger.info(
+                "Query count %s [size %s]: %s queries, %.1f ms SQL",
+                name,
+                size,
+                count,
+                sql_time * 1000,
+            )
+        smallest_size, smallest = results[0][:2]
+        for size, count, _sql_time in results[1:]:
+            budget = smallest + slack + per_item * (size - smallest_size)
+            self.assertLessEqual(
+                count,
+                budget,
+                "%s: %s queries at size %s against %s at size %s (budget %s)"
+                % (name, count, size, smallest, smallest_size, budget),
+            )
+        return results
@@ -0,0 +1,69 @@
+import json
+import logging
+import subprocess
+import sys
+
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+ADDON = "employee_payroll_attendance"
+# Dependencies only needed by the currency rate wizard
+LAZY_DEPENDENCIES = ("pandas", "requests", "forex_python")
+
+# Run in a fresh interpreter: the test process already has everything loaded.
+# Odoo itself may import some of the dependencies (requests is imported by the
+# server), so only what the addon import adds over that baseline is reported.
+PROBE = """
+import importlib, json, resource, sys, time
+import odoo
+from odoo.tools import config
+config.parse_config(["--addons-path", sys.argv[1]])
+odoo.modules.module.initialize_sys_path()
+watched = sys.argv[3].split(",")
+baseline = {m for m in watched if m in sys.modules}
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+importlib.import_module("odoo.addons." + sys.argv[2])
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before,
+    "baseline": sorted(baseline),
+    "loaded": sorted(m for m in watched if m in sys.modules and m not in baseline),
+}))
+"""
+
+
+@tagged("post_install", "-at_install", "benchmark")
+class TestImportFootprint(TransactionCase):
+    """Import time and memory of the addon as paid by every worker at startup."""
+
+    def _probe(self):
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                PROBE,
+                config["addons_path"],
+                ADDON,
+                ",".join(LAZY_DEPENDENCIES),
+            ],
+            timeout=120,
+        )
+        return json.loads(output.decode().strip().splitlines()[-1])
+
+    def test_heavy_dependencies_are_lazy(self):
+        result = self._probe()
+        _logger.info(
+            "Importing %s: %.3fs, +%s KB max RSS (already loaded by odoo: %s)",
+            ADDON,
+            result["seconds"],
+            result["rss_kb"],
+            ", ".join(result["baseline"]) or "none",
+        )
+        self.assertEqual(
+            result["loaded"],
+            [],
+            "Heavy dependencies must be imported inside the code paths using them",
+        )
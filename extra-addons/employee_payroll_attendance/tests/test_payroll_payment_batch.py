@@ -0,0 +1,143 @@
+from datetime import date
+from unittest.mock import patch
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.exceptions import UserError
+from odoo.tests import tagged
+
+PERIOD_START = date(2026, 1, 1)
+PERIOD_END = date(2026, 1, 31)
+
+
+@tagged("post_install", "-at_install")
+class TestPayrollPaymentBatch(AccountTestInvoicingCommon):
+    """Paying the confirmed payslips of a period in one batch."""
+
+    @classmethod
+    def setUpClass(cls, chart_template_ref=None):
+        super().setUpClass(chart_template_ref=chart_template_ref)
+        company = cls.company_data["company"]
+        Account = cls.env["account.account"]
+        cls.expense_account = Account.search(
+            [("code", "=", "630000")], limit=1
+        ) or Account.create(
+            {
+                "code": "630000",
+                "name": "Salary Expenses",
+                "account_type": "expense",
+                "company_id": company.id,
+            }
+        )
+        if not Account.search([("code", "=", "211000")], limit=1):
+            Account.create(
+                {
+                    "code": "211000",
+                    "name": "Salaries Payable",
+                    "account_type": "liability_payable",
+                    "reconcile": True,
+                    "company_id": company.id,
+                }
+            )
+        cls.bank_journal = cls.company_data["default_journal_bank"]
+
+    def _create_payslip(self, name, amount):
+        employee = self.env["hr.employee"].create(
+            {
+                "name": name,
+                "address_home_id": self.env["res.partner"].create({"name": name}).id,
+            }
+        )
+        return self.env["hr.payslip"].create(
+            {
+                "employee_id": employee.id,
+                "date_from": PERIOD_START,
+                "date_to": PERIOD_END,
+                "status": "employee_confirm",
+                "other_bonus": amount,
+            }
+        )
+
+    def _create_bill(self, payslip, amount):
+        bill = self.env["account.move"].create(
+            {
+                "move_type": "in_invoice",
+                "partner_id": payslip.employee_id.address_home_id.id,
+                "invoice_date": PERIOD_END,
+                "invoice_line_ids": [
+                    (
+                        0,
+                        0,
+                        {
+                            "name": "Salary",
+                            "quantity": 1,
+                            "price_unit": amount,
+                            "account_id": self.expense_account.id,
+                        },
+                    )
+                ],
+            }
+        )
+        payslip.vendor_bill_id = bill
+        return bill
+
+    def _create_batch(self):
+        return self.env["hr.payroll.payment.batch"].create(
+            {
+                "date_from": PERIOD_START,
+                "date_to": PERIOD_END,
+                "journal_id": self.bank_journal.id,
+            }
+        )
+
+    def test_total_includes_paid_bills(self):
+        paid = self._create_payslip("Already Paid", 100.0)
+        paid_bill = self._create_bill(paid, 100.0)
+        paid_bill.action_post()
+        self.env["account.payment.register"].with_context(
+            active_model="account.move", active_ids=paid_bill.ids
+        ).create({"journal_id": self.bank_journal.id})._create_payments()
+        unpaid = self._create_payslip("To Pay", 200.0)
+        self._create_bill(unpaid, 200.0)
+
+        batch = self._create_batch()
+        batch.action_pay()
+
+        self.assertEqual(batch.state, "done")
+        self.assertEqual(batch.payslip_ids, paid | unpaid)
+        self.assertEqual(len(batch.payment_ids), 1)
+        self.assertAlmostEqual(batch.total_amount, 300.0)
+        self.assertEqual(set((paid | unpaid).mapped("status")), {"transfer_payment"})
+
+    def test_overlapping_batches_pay_once(self):
+        payslip = self._create_payslip("Paid Once", 150.0)
+        self._create_bill(payslip, 150.0)
+        first, second = self._create_batch(), self._create_batch()
+        first.action_pay()
+        # A batch listing the payslip before the first one paid it re-checks
+        # the status under lock and drops it
+        self.assertFalse(second._lock_payslips(payslip))
+        with self.assertRaises(UserError):
+            second.action_pay()
+        self.assertEqual(second.state, "draft")
+        self.assertEqual(len(first.payment_ids), 1)
+
+    def test_missing_bills_created_in_one_batch(self):
+        payslips = self._create_payslip("No Bill 1", 50.0) | self._create_payslip(
+            "No Bill 2", 60.0
+        )
+        AccountMove = self.registry["account.move"]
+        create = AccountMove.create
+        bill_batches = []
+
+        def counting_create(model, vals_list):
+            vals = vals_list if isinstance(vals_list, list) else [vals_list]
+            bills = [v for v in vals if v.get("move_type") == "in_invoice"]
+            if bills:
+                bill_batches.append(len(bills))
+            return create(model, vals_list)
+
+        with patch.object(AccountMove, "create", counting_create):
+            self._create_batch().action_pay()
+
+        self.assertEqual(bill_batches, [2])
+        self.assertEqual(len(payslips.vendor_bill_id), 2)
@@ -0,0 +1,88 @@
+from datetime import date, datetime, timedelta
+
+from odoo.tests import TransactionCase, tagged
+
+PERIOD_START = date(2026, 1, 1)
+PERIOD_END = date(2026, 1, 31)
+
+
+@tagged("post_install", "-at_install")
+class TestPayrollSimulation(TransactionCase):
+    """What-if simulation against the salary computed by hr.payslip."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.employee = cls.env["hr.employee"].create(
+            {"name": "Simulated Employee", "tz": "UTC"}
+        )
+        # Three approved 8-hour days at 5 USD/h: 120 USD
+        cls.env["hr.attendance"].create(
+            [
+                {
+                    "employee_id": cls.employee.id,
+                    "check_in": datetime(2026, 1, 5, 1) + timedelta(days=day),
+                    "check_out": datetime(2026, 1, 5, 9) + timedelta(days=day),
+                }
+                for day in range(3)
+            ]
+        )
+        cls.payslip = cls.env["hr.payslip"].create(
+            {
+                "employee_id": cls.employee.id,
+                "date_from": PERIOD_START,
+                "date_to": PERIOD_END,
+                "currency_rate_fallback": 25000.0,
+                "hourly_rate": 5.0,
+                "rate_lock_field": "hourly_rate",
+            }
+        )
+        cls.payslip.attendance_line_ids.write({"approved": True})
+        cls.payslip._refresh_approval_totals()
+        cls.payslip._compute_total_salary()
+        cls.env.flush_all()
+
+    def _simulate(self, **overrides):
+        return self.env["hr.payroll.simulator"].simulate(
+            PERIOD_START, PERIOD_END, [self.employee.id], overrides
+        )
+
+    def test_baseline_matches_payslip(self):
+        result = self._simulate()
+        self.assertEqual(len(result["lines"]), 1)
+        line = result["lines"][0]
+        self.assertEqual(line["payslip_id"], self.payslip.id)
+        self.assertAlmostEqual(self.payslip.total_salary, 120.0)
+        self.assertAlmostEqual(line["baseline_total_salary"], self.payslip.total_salary)
+        self.assertAlmostEqual(line["total_salary"], self.payslip.total_salary)
+        self.assertAlmostEqual(line["delta_total_salary"], 0.0)
+        self.assertAlmostEqual(line["delta_converted_salary_vnd"], 0.0)
+        self.assertEqual(result["missing_employee_ids"], [])
+
+    def test_overrides_deltas_and_totals(self):
+        result = self._simulate(
+            currency_rate=26000.0, hourly_rates={self.employee.id: 6.0}
+        )
+        line = result["lines"][0]
+        # 24 approved hours at 6 USD/h instead of 5 USD/h
+        self.assertAlmostEqual(line["total_salary"], 144.0)
+        self.assertAlmostEqual(line["delta_total_salary"], 24.0)
+        self.assertAlmostEqual(line["converted_salary_vnd"], 144.0 * 26000.0)
+        self.assertAlmostEqual(
+            line["delta_converted_salary_vnd"],
+            144.0 * 26000.0 - self.payslip.converted_salary_vnd,
+        )
+        totals = result["totals"]
+        self.assertEqual(totals["payslip_count"], 1)
+        self.assertEqual(totals["employee_count"], 1)
+        self.assertAlmostEqual(totals["delta_total_salary"], 24.0)
+        self.assertAlmostEqual(
+            totals["converted_salary_vnd"], line["converted_salary_vnd"]
+        )
+
+    def test_missing_employees(self):
+        other = self.env["hr.employee"].create({"name": "No Payslip"})
+        result = self.env["hr.payroll.simulator"].simulate(
+            PERIOD_START, PERIOD_END, [self.employee.id, other.id]
+        )
+        self.assertEqual(result["missing_employee_ids"], [other.id])
@@ -0,0 +1,87 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from odoo.tests import tagged
+
+from .common import QueryCountCase
+
+PERIOD_START = date(2026, 1, 1)
+PERIOD_END = date(2026, 1, 31)
+
+
+@tagged("post_install", "-at_install", "query_count")
+class TestPayrollQueryCount(QueryCountCase):
+    """Query counts of the payroll hot paths."""
+
+    def _seed_employee(self, attendance_count):
+        """Employee with one 8-hour attendance per day from the period start."""
+        employee = self.env["hr.employee"].create(
+            {"name": f"Query Count {attendance_count}", "tz": "UTC"}
+        )
+        self.env["hr.attendance"].create(
+            [
+                {
+                    "employee_id": employee.id,
+                    "check_in": datetime(2026, 1, 1, 1) + timedelta(days=day),
+                    "check_out": datetime(2026, 1, 1, 9) + timedelta(days=day),
+                }
+                for day in range(attendance_count)
+            ]
+        )
+        return employee
+
+    def _payslip_vals(self, employee):
+        return {
+            "employee_id": employee.id,
+            "date_from": PERIOD_START,
+            "date_to": PERIOD_END,
+            "currency_rate_fallback": 25000.0,
+            "hourly_rate": 5.0,
+        }
+
+    def _seed_payslip(self, attendance_count):
+        employee = self._seed_employee(attendance_count)
+        return self.env["hr.payslip"].create(self._payslip_vals(employee))
+
+    def test_payslip_create(self):
+        # The attendance lines are synchronized in batch
+        self.assertQueryScaling(
+            "hr.payslip create",
+            self._seed_employee,
+            lambda employee: self.env["hr.payslip"].create(
+                self._payslip_vals(employee)
+            ),
+        )
+
+    def test_toggle_approval(self):
+        # The lines are synchronized with one search and written per status,
+        # the payslip totals and summary row are folded once
+        self.assertQueryScaling(
+            "hr.payslip.attendance toggle_approval",
+            self._seed_payslip,
+            lambda payslip: payslip.attendance_line_ids.toggle_approval(),
+            slack=2,
+        )
+
+    def test_rate_application(self):
+        wizard_model = self.env["hr.payslip.update.rate.wizard"]
+
+        def seed(size):
+            return self.env["hr.payslip"].concat(
+                *(self._seed_payslip(1) for _i in range(size))
+            )
+
+        def apply_rate(payslips):
+            wizard = wizard_model.with_context(active_ids=payslips.ids).create(
+                {"currency_rate_fallback": 26000.0}
+            )
+            wizard.action_apply_to_payslips()
+
+        # No network access from the tests
+        with patch.object(
+            type(wizard_model), "fetch_usd_exchange_rate", return_value=26000.0
+        ):
+            # The salary onchanges still loop on the payslips, a few queries each
+            self.assertQueryScaling(
+                "hr.payslip.update.rate.wizard apply", seed, apply_rate, per_item=6
+            )
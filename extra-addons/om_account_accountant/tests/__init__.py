@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from . import test_general_ledger
+from . import test_query_count
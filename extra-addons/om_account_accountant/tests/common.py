@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import threading
+from datetime import date, timedelta
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+_logger = logging.getLogger(__name__)
+
+# The same harness lives in employee_payroll_attendance/tests/common.py on top
+# of TransactionCase: neither addon depends on the other, so a change to one
+# copy must be mirrored in the other.
+
+# Data sizes each operation is measured at
+QUERY_COUNT_SIZES = (5, 25)
+
+
+class QueryCountCase(AccountTestInvoicingCommon):
+    """
+    Query-count regression harness for the accounting addons: an operation is
+    measured on a seeded set of posted invoices at every size of
+    QUERY_COUNT_SIZES. The query count and the SQL time are logged, and the
+    test fails as soon as the query count grows faster than the budget of the
+    operation: constant by default, or a fixed number of queries per seeded
+    item for operations that are linear by design.
+    """
+
+    def _measure(self, operation):
+        """
+        Run `operation` with a cold cache; return (query count, SQL seconds).
+        The work deferred to the commit (cr.precommit) is part of the count;
+        the one left over by the seeding is run before.
+        """
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.env.invalidate_all()
+        thread = threading.current_thread()
+        thread.query_count = 0
+        thread.query_time = 0.0
+        operation()
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        return thread.query_count, thread.query_time
+
+    def assertQueryScaling(self, name, seed, operation, slack=0, per_item=0):
+        """
+        :param seed: callable(size) seeding the data of one size and returning
+            the argument given to `operation`
+        :param operation: callable(seeded) performing the measured operation
+        :param slack: queries tolerated on top of the smallest size
+        :param per_item: queries allowed for each item seeded on top of the
+            smallest size (0 for an operation that must be constant)
+        """
+        results = []
+        for size in QUERY_COUNT_SIZES:
+            seeded = seed(size)
+            count, sql_time = self._measure(lambda: operation(seeded))
+            results.append((size, count, sql_time))
+            _logger.info(
+                "Query count %s [size %s]: %s queries, %.1f ms SQL",
+                name, size, count, sql_time * 1000,
+            )
+        smallest_size, smallest = results[0][:2]
+        for size, count, _sql_time in results[1:]:
+            budget = smallest + slack + per_item * (size - smallest_size)
+            self.assertLessEqual(
+                count, budget,
+                "%s: %s queries at size %s against %s at size %s (budget %s)" % (
+                    name, count, size, smallest, smallest_size, budget),
+            )
+        return results
+
+    def _seed_invoices(self, size, days_overdue=45):
+        """`size` posted customer invoices, each for a new partner."""
+        invoice_date = date.today() - timedelta(days=days_overdue)
+        partners = self.env['res.partner'].create([
+            {'name': 'Query Count Partner %s' % i} for i in range(size)
+        ])
+        invoices = self.env['account.move']
+        for partner in partners:
+            invoices |= self.init_invoice(
+                'out_invoice', partner=partner, invoice_date=invoice_date,
+                amounts=[100.0], taxes=self.tax_sale_a, post=True)
+        return invoices
+
+    def _render_report(self, wizard):
+        """Render the report printed by `wizard` the way the client does."""
+        action = wizard.check_report()
+        return self.env['ir.actions.report'].with_context(
+            active_model=wizard._name, active_id=wizard.id, active_ids=wizard.ids,
+        )._render_qweb_html(action['report_name'], wizard.ids, data=action['data'])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date, timedelta
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.tests import tagged
+
+
+@tagged('post_install', '-at_install')
+class TestGeneralLedger(AccountTestInvoicingCommon):
+    """Printing the General Ledger with Analytic Accounting enabled."""
+
+    @classmethod
+    def setUpClass(cls, chart_template_ref=None):
+        super().setUpClass(chart_template_ref=chart_template_ref)
+        # The template prints the analytic column for this group only
+        cls.env.user.groups_id += cls.env.ref('analytic.group_analytic_accounting')
+        plan = cls.env['account.analytic.plan'].create({'name': 'General Ledger Plan'})
+        cls.analytic_account = cls.env['account.analytic.account'].create({
+            'name': 'General Ledger Analytic',
+            'plan_id': plan.id,
+        })
+        cls.date_from = date.today().replace(day=1)
+        # One invoice before the period feeds the initial balance
+        for invoice_date in (cls.date_from - timedelta(days=40), cls.date_from):
+            invoice = cls.init_invoice('out_invoice', invoice_date=invoice_date, amounts=[100.0])
+            invoice.invoice_line_ids.analytic_distribution = {
+                str(cls.analytic_account.id): 100}
+            invoice.action_post()
+
+    def _render(self, vals=None):
+        wizard = self.env['account.report.general.ledger'].create(dict({
+            'date_from': self.date_from,
+            'date_to': self.date_from + timedelta(days=31),
+            'initial_balance': True,
+        }, **(vals or {})))
+        action = wizard.check_report()
+        html = self.env['ir.actions.report'].with_context(
+            active_model=wizard._name, active_id=wizard.id, active_ids=wizard.ids,
+        )._render_qweb_html(action['report_name'], wizard.ids, data=action['data'])[0]
+        return html.decode()
+
+    def test_render_with_analytic_group(self):
+        # Initial balance read from the balance snapshot
+        html = self._render()
+        self.assertIn('Initial Balance', html)
+        self.assertIn(self.company_data['default_account_revenue'].name, html)
+
+    def test_render_with_analytic_filter(self):
+        # The analytic filter reads the initial balance from the move lines
+        html = self._render({'analytic_account_ids': [(6, 0, self.analytic_account.ids)]})
+        self.assertIn('Initial Balance', html)
+        self.assertIn(self.company_data['default_account_revenue'].name, html)
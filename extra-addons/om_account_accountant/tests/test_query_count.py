@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from odoo.tests import tagged
+
+from .common import QueryCountCase
+
+
+@tagged('post_install', '-at_install', 'query_count')
+class TestAccountingQueryCount(QueryCountCase):
+    """Query counts of the reports, follow-ups and asset entries."""
+
+    @classmethod
+    def setUpClass(cls, chart_template_ref=None):
+        super().setUpClass(chart_template_ref=chart_template_ref)
+        cls.date_from = date.today().replace(month=1, day=1) - timedelta(days=366)
+        cls.date_to = date.today()
+        cls.sale_journal = cls.company_data['default_journal_sale']
+
+    def _report_check(self, name, model, vals=None):
+        def render(_invoices):
+            wizard = self.env[model].create(dict({
+                'date_from': self.date_from,
+                'date_to': self.date_to,
+            }, **(vals or {})))
+            self._render_report(wizard)
+
+        self.assertQueryScaling(name, self._seed_invoices, render)
+
+    def test_general_ledger(self):
+        self._report_check('general ledger', 'account.report.general.ledger')
+
+    def test_trial_balance(self):
+        self._report_check('trial balance', 'account.balance.report')
+
+    def test_partner_ledger(self):
+        self._report_check(
+            'partner ledger', 'account.report.partner.ledger',
+            {'result_selection': 'customer'})
+
+    def test_tax_report(self):
+        self._report_check('tax report', 'account.tax.report.wizard')
+
+    def test_journal_audit(self):
+        self._report_check(
+            'journal audit', 'account.print.journal',
+            {'journal_ids': [(6, 0, self.sale_journal.ids)]})
+
+    def _create_financial_report(self):
+        return self.env['account.financial.report'].create({
+            'name': 'Query Count Report',
+            'type': 'sum',
+            'children_ids': [(0, 0, {
+                'name': 'Receivables and Income',
+                'type': 'accounts',
+                'display_detail': 'detail_flat',
+                'account_ids': [(6, 0, (
+                    self.company_data['default_account_receivable']
+                    | self.company_data['default_account_revenue']
+                ).ids)],
+            })],
+        })
+
+    def test_financial_report(self):
+        report = self._create_financial_report()
+        self._report_check(
+            'financial report', 'accounting.report', {'account_report_id': report.id})
+
+    def test_financial_report_periods(self):
+        report = self._create_financial_report()
+        self._report_check('financial report periods', 'accounting.report', {
+            'account_report_id': report.id,
+            'enable_filter': True,
+            'filter_cmp': 'filter_periods',
+            'period_count': 12,
+        })
+
+    def test_trial_balance_periods(self):
+        self._report_check('trial balance periods', 'account.balance.report', {'period_count': 12})
+
+    def test_period_columns(self):
+        """The number of period columns does not change the number of queries."""
+        self._seed_invoices(5)
+        report = self._create_financial_report()
+        counts = []
+        for period_count in (1, 12):
+            wizard = self.env['accounting.report'].create({
+                'date_from': self.date_from,
+                'date_to': self.date_to,
+                'account_report_id': report.id,
+                'enable_filter': True,
+                'filter_cmp': 'filter_periods',
+                'period_count': period_count,
+            })
+            counts.append(self._measure(lambda: self._render_report(wizard))[0])
+        self.assertEqual(counts[0], counts[1])
+
+    def test_aged_balance(self):
+        def render(_invoices):
+            wizard = self.env['account.aged.trial.balance'].create({
+                'date_from': self.date_to,
+                'period_length': 30,
+                'result_selection': 'customer',
+                'journal_ids': [(6, 0, self.sale_journal.ids)],
+            })
+            self._render_report(wizard)
+
+        self.assertQueryScaling('aged balance', self._seed_invoices, render)
+
+    def test_followup_processing(self):
+        followup = self.env['followup.followup'].search(
+            [('company_id', '=', self.env.company.id)], limit=1)
+        if not followup:
+            followup = self.env['followup.followup'].create({
+                'company_id': self.env.company.id,
+            })
+        followup.followup_line = [(5, 0, 0), (0, 0, {
+            'name': 'First reminder',
+            'delay': 15,
+            'send_email': False,
+            'send_letter': False,
+        })]
+
+        def process(_invoices):
+            self.env['followup.print'].create({'date': self.date_to}).do_process()
+
+        # Partners are updated and their actions cleared one by one: a
+        # handful of queries per overdue partner, never one per move line
+        self.assertQueryScaling(
+            'follow-up processing', self._seed_invoices, process, per_item=10)
+
+    def test_asset_entries(self):
+        category = self.env['account.asset.category'].create({
+            'name': 'Query Count Assets',
+            'journal_id': self.company_data['default_journal_misc'].id,
+            'account_asset_id': self.company_data['default_account_assets'].id,
+            'account_depreciation_id': self.company_data['default_account_assets'].id,
+            'account_depreciation_expense_id':
+                self.company_data['default_account_expense'].id,
+            'method_number': 12,
+            'method_period': 1,
+        })
+
+        def seed(size):
+            assets = self.env['account.asset.asset'].create([{
+                'name': 'Query Count Asset %s' % i,
+                'category_id': category.id,
+                'value': 1200.0,
+                'date': self.date_from,
+            } for i in range(size)])
+            assets.validate()
+            return assets
+
+        # One depreciation move is created and posted per asset: bounded by
+        # the cost of a move, not by the depreciation lines of every asset
+        self.assertQueryScaling(
+            'asset entry generation', seed,
+            lambda _assets: self.env['account.asset.asset'].compute_generated_entries(
+                self.date_to),
+            per_item=60)
+
+    def test_query_get_memo(self):
+        """Identical report filters are compiled once per transaction."""
+        MoveLine = self.env['account.move.line']
+        context = {'state': 'posted', 'date_from': date(2001, 2, 3), 'strict_range': True}
+        compile_query_get = type(MoveLine)._compile_query_get
+        with patch.object(type(MoveLine), '_compile_query_get', autospec=True,
+                          side_effect=compile_query_get) as compiled:
+            first = MoveLine.with_context(context)._query_get()
+            second = MoveLine.with_context(dict(context, journal_ids=[]))._query_get()
+        self.assertEqual(first, second)
+        self.assertEqual(compiled.call_count, 1)
+
+    def test_report_cache(self):
+        """A re-print is served from the result cache until the ledger changes."""
+        self._seed_invoices(5)
+        # What the commit of the transaction runs
+        self.env.cr.precommit.run()
+        wizard = self.env['account.balance.report'].create({
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+        })
+        report = type(self.env['report.accounting_pdf_reports.report_trialbalance'])
+        with patch.object(report, '_get_accounts', autospec=True,
+                          side_effect=report._get_accounts) as computed:
+            self._render_report(wizard)
+            self._render_report(wizard)
+            self.assertEqual(computed.call_count, 1)
+            # Posting in the period moves the watermark
+            self._seed_invoices(1)
+            self.env.cr.precommit.run()
+            self._render_report(wizard)
+            self.assertEqual(computed.call_count, 2)
+            # So does renaming an account the report prints
+            self.company_data['default_account_revenue'].name = 'Renamed Revenue'
+            self.env.cr.precommit.run()
+            self._render_report(wizard)
+            self.assertEqual(computed.call_count, 3)
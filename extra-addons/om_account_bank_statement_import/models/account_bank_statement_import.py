@@ -18,11 +18,6 @@ try:
 except ImportError:
     _logger.debug('Cannot `import csv`.')
 
-try:
-    import xlrd
-except ImportError:
-    _logger.debug('Cannot `import xlrd`.')
-
 
 class AccountBankStatementLine(models.Model):
     _inherit = "account.bank.statement.line"
@@ -102,6 +97,10 @@ class AccountBankStatementImport(models.TransientModel):
                         if len(vals_list) != 0:
                             statement = self.create_statement(statement_vals)
                     elif file_name.strip().endswith('.xlsx'):
+                        try:
+                            import xlrd
+                        except ImportError:
+                            raise UserError(_("The xlrd library is required to import .xlsx files."))
                         try:
                             fp = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
                             fp.write(binascii.a2b_base64(data_file.datas))
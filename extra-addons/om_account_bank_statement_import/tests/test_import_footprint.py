@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import json
+import subprocess
+import sys
+
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import config
+
+# Spreadsheet readers only needed when an .xlsx statement is imported
+LAZY_DEPENDENCIES = ('xlrd', 'openpyxl')
+
+# Run in a fresh interpreter, reporting only what the addon adds to `import odoo`
+PROBE = """
+import importlib, json, sys
+import odoo
+odoo.tools.config.parse_config(['--addons-path', sys.argv[1]])
+odoo.modules.module.initialize_sys_path()
+watched = sys.argv[2].split(',')
+baseline = {m for m in watched if m in sys.modules}
+importlib.import_module('odoo.addons.om_account_bank_statement_import')
+print(json.dumps(sorted(m for m in watched if m in sys.modules and m not in baseline)))
+"""
+
+
+@tagged('post_install', '-at_install', 'benchmark')
+class TestImportFootprint(TransactionCase):
+
+    def test_spreadsheet_readers_are_lazy(self):
+        output = subprocess.check_output([
+            sys.executable, '-c', PROBE,
+            config['addons_path'], ','.join(LAZY_DEPENDENCIES),
+        ], timeout=120)
+        loaded = json.loads(output.decode().strip().splitlines()[-1])
+        self.assertEqual(loaded, [], "xlrd and openpyxl must only be imported by the xlsx import")